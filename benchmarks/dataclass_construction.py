@@ -0,0 +1,50 @@
+"""
+Construction benchmark of ``@notify_property_dataclass`` model objects,
+measures time and memory of creating instances
+
+Run from the repository root:
+    python -m benchmarks.dataclass_construction [count]
+"""
+
+import sys
+import time
+import tracemalloc
+from typing import List, Any
+
+from src.magique.declarative import notify_property_dataclass
+
+
+@notify_property_dataclass
+class Monitor:
+    x: int
+    y: int
+    width: int
+    height: int
+    name: str
+    is_primary: bool
+
+
+def main(count: int = 1_000_000) -> None:
+    print(f"instances: {count}")
+
+    start: float = time.perf_counter()
+    instances: List[Any] = [Monitor(i, 0, 1920, 1080, "display", False) for i in range(count)]
+    elapsed: float = time.perf_counter() - start
+    print(f"construction: {elapsed:6.2f} s, {elapsed / count * 1e9:7.1f} ns per instance")
+
+    start = time.perf_counter()
+    for instance in instances:
+        instance.x = 1
+    elapsed = time.perf_counter() - start
+    print(f"assignment:   {elapsed:6.2f} s, {elapsed / count * 1e9:7.1f} ns per instance")
+
+    del instances
+    tracemalloc.start()
+    instances = [Monitor(i, 0, 1920, 1080, "display", False) for i in range(count // 10)]
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"memory:       {(used - sys.getsizeof(instances)) / len(instances):7.1f} bytes per instance")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
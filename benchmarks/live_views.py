@@ -0,0 +1,41 @@
+"""
+Live views benchmark, compares incrementally maintained ``where()`` and ``sorted_by()``
+views with rebuilding the derived list on every update of the source list
+
+Run from the repository root:
+    python -m benchmarks.live_views [count]
+"""
+
+import sys
+import time
+import random
+from typing import List
+
+from src.magique.declarative import ObservableList
+
+
+def run(source: ObservableList, changes: int) -> float:
+    rng = random.Random(0)
+    start: float = time.perf_counter()
+    for _ in range(changes):
+        source[rng.randrange(len(source))] = rng.randrange(1_000_000)
+
+    return (time.perf_counter() - start) / changes
+
+
+def main(count: int = 50_000, changes: int = 500) -> None:
+    print(f"items: {count}, changes: {changes}")
+
+    source: ObservableList[int] = ObservableList(range(count))
+    rebuilt: List[List[int]] = [[]]
+    source.attach_on_update(lambda value: rebuilt.__setitem__(0, sorted(x for x in value if x % 2 == 0)))
+    print(f"rebuild:   {run(source, changes) * 1e6:9.1f} us per change")
+
+    source = ObservableList(range(count))
+    view = source.where(lambda x: x % 2 == 0).sorted_by(lambda x: x)
+    print(f"live view: {run(source, changes) * 1e6:9.1f} us per change")
+    assert view.value == sorted(x for x in source if x % 2 == 0)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
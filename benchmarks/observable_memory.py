@@ -0,0 +1,65 @@
+"""
+Memory benchmark, measures bytes allocated per idle observable object
+
+Run from the repository root:
+    python -m benchmarks.observable_memory [count]
+"""
+
+import sys
+import tracemalloc
+from typing import Callable, List, Any
+
+from src.magique.declarative import NotifyUpdated, Observable, notify_property_dataclass
+
+
+@notify_property_dataclass
+class Point:
+    x: int
+    y: int
+
+
+def property_subscribed() -> Point:
+    point: Point = Point(0, 0)
+    point.attach_on_property_update("x", print)
+    return point
+
+
+def property_listened() -> Point:
+    point: Point = Point(0, 0)
+    point.property_updated("x").attach_on_update(print)
+    return point
+
+
+def property_bound() -> Point:
+    point: Point = Point(0, 0)
+    point.property("x")
+    return point
+
+
+def bytes_per_instance(factory: Callable[[], Any], count: int) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+
+    instances: List[Any] = [factory() for _ in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # the list holding instances is not an observable's overhead
+    list_overhead: int = sys.getsizeof(instances)
+    return (after - before - list_overhead) / count
+
+
+def main(count: int = 1_000_000) -> None:
+    print(f"idle instances: {count}")
+    print(f"NotifyUpdated: {bytes_per_instance(NotifyUpdated, count):8.1f} bytes per instance")
+    print(f"Observable:    {bytes_per_instance(Observable, count):8.1f} bytes per instance")
+
+    # property subscriptions, a tenth of instances is enough
+    count //= 10
+    print(f"Point with attach_on_property_update(): {bytes_per_instance(property_subscribed, count):8.1f} bytes")
+    print(f"Point with property_updated():          {bytes_per_instance(property_listened, count):8.1f} bytes")
+    print(f"Point with property():                  {bytes_per_instance(property_bound, count):8.1f} bytes")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,77 @@
+"""
+Observable setter benchmark, measures ``obs.value = x`` with no subscribed functions,
+with a plain function and with a ``Computed`` depending on the observable.
+Plain assignments must not pay for propagation waves, the benchmark fails
+if they are slower than ``max_ratio`` times a minimal list-of-callbacks observable
+
+Run from the repository root:
+    python -m benchmarks.observable_set [count] [max_ratio]
+"""
+
+import sys
+import timeit
+from typing import Callable, List, Any
+
+from src.magique.declarative import Observable, Computed
+
+
+class MinimalObservable:
+    """ The reference: compares values and invokes a list of functions """
+
+    def __init__(self, value: Any):
+        self._value: Any = value
+        self._observers: List[Callable[[Any], Any]] = []
+
+    @property
+    def value(self) -> Any: return self._value
+
+    @value.setter
+    def value(self, new_value: Any):
+        if self._value == new_value:
+            return
+
+        self._value = new_value
+        for observer_func in self._observers:
+            observer_func(self)
+
+    def attach_on_update(self, callback: Callable[[Any], Any]) -> None:
+        self._observers.append(callback)
+
+
+def nanoseconds_per_assignment(observable: Any, count: int) -> float:
+    def assign() -> None:
+        for value in range(count):
+            observable.value = value
+
+    return min(timeit.repeat(assign, number=1, repeat=5)) / count * 1e9
+
+
+def main(count: int = 200_000, max_ratio: float = 4.0) -> None:
+    print(f"assignments: {count}")
+    ratios: List[float] = []
+    for handlers in (0, 1):
+        reference: MinimalObservable = MinimalObservable(0)
+        observable: Observable[int] = Observable(0)
+        for _ in range(handlers):
+            reference.attach_on_update(lambda notifier: None)
+            observable.attach_on_update(lambda notifier: None)
+
+        reference_ns: float = nanoseconds_per_assignment(reference, count)
+        observable_ns: float = nanoseconds_per_assignment(observable, count)
+        ratios.append(observable_ns / reference_ns)
+
+        print(f"{handlers} plain functions   Observable: {observable_ns:7.1f} ns, reference: {reference_ns:7.1f} ns")
+
+    derived: Observable[int] = Observable(0)
+    computed: Computed[int] = Computed(lambda: derived.value + 1)
+    computed.attach_on_update(lambda notifier: None)
+    print(f"with Computed       Observable: {nanoseconds_per_assignment(derived, count):7.1f} ns")
+
+    assert max(ratios) <= max_ratio, f"plain assignments are {max(ratios):.1f}x slower than the reference"
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 4.0
+    )
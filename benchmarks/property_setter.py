@@ -0,0 +1,88 @@
+"""
+Property setter benchmark, measures ``Cursor.x``-like assignments:
+the former always-comparing wrapper, ``@notify_property_updated()`` and ``notify_property()``,
+with and without the ``property_updated()`` notifier
+
+Run from the repository root:
+    python -m benchmarks.property_setter [count]
+"""
+
+import sys
+import timeit
+from typing import Callable, Any
+
+from src.magique.declarative import NotifyUpdated, notify_property_updated, notify_property
+
+
+def always_comparing(get_value_function: Callable[[Any], Any]) -> Callable:
+    """ The wrapper before the fast path, reads and compares values on every assignment """
+
+    def decorator(target_function: Callable) -> Callable:
+        property_name: str = target_function.__name__
+
+        def wrapper(self, *args, **kwargs):
+            old_value: Any = get_value_function(self)
+            target_function(self, *args, **kwargs)
+
+            new_value: Any = get_value_function(self)
+            self.raise_property_update_if_values_diff(property_name, old_value, new_value)
+        return wrapper
+    return decorator
+
+
+class ComparingCursor(NotifyUpdated):
+    def __init__(self):
+        super().__init__()
+        self._x: int = 0
+
+    @property
+    def x(self) -> int: return self._x
+
+    @x.setter
+    @always_comparing(lambda self: self._x)
+    def x(self, new_x: int): self._x = new_x
+
+
+class DecoratedCursor(NotifyUpdated):
+    def __init__(self):
+        super().__init__()
+        self._x: int = 0
+
+    @property
+    def x(self) -> int: return self._x
+
+    @x.setter
+    @notify_property_updated(lambda self: self._x)
+    def x(self, new_x: int): self._x = new_x
+
+
+class CompiledCursor(NotifyUpdated):
+    def __init__(self):
+        super().__init__()
+        self._x: int = 0
+
+    x = notify_property("x")
+
+
+def nanoseconds_per_assignment(cursor: Any, count: int) -> float:
+    def assign() -> None:
+        for value in range(count):
+            cursor.x = value
+
+    return min(timeit.repeat(assign, number=1, repeat=5)) / count * 1e9
+
+
+def main(count: int = 1_000_000) -> None:
+    print(f"assignments: {count}")
+    for cursor_class in (ComparingCursor, DecoratedCursor, CompiledCursor):
+        idle: float = nanoseconds_per_assignment(cursor_class(), count)
+
+        listened: Any = cursor_class()
+        listened.property_updated("x").attach_on_update(lambda notifier: None)
+        subscribed: float = nanoseconds_per_assignment(listened, count)
+
+        print(f"{cursor_class.__name__:16} idle: {idle:7.1f} ns, with property_updated: {subscribed:7.1f} ns")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,52 @@
+"""
+Snapshot benchmark of a large ``@notify_property_dataclass`` model graph,
+measures capturing, serialization and restoring of field values
+
+Run from the repository root:
+    python -m benchmarks.snapshot_restore [count]
+"""
+
+import sys
+import time
+from typing import List
+
+from src.magique.declarative import ObservableList, notify_property_dataclass, snapshot, restore, Snapshot
+
+
+@notify_property_dataclass
+class Window:
+    x: int
+    y: int
+    width: int
+    height: int
+    title: str
+
+
+def main(count: int = 20_000) -> None:
+    windows: ObservableList[Window] = ObservableList([Window(i, i, 800, 600, f"window {i}") for i in range(count)])
+    events: List[int] = [0]
+    for window in windows:
+        window.attach_on_update(lambda placeholder: events.__setitem__(0, events[0] + 1))
+
+    print(f"fields: {count * len(Window.__notify_fields__)}")
+
+    start: float = time.perf_counter()
+    captured: Snapshot = snapshot(windows)
+    print(f"snapshot:   {time.perf_counter() - start:6.3f} s")
+
+    start = time.perf_counter()
+    data: bytes = captured.to_bytes()
+    captured = Snapshot.from_bytes(data)
+    print(f"serialize:  {time.perf_counter() - start:6.3f} s, {len(data) / 1024:8.1f} KiB")
+
+    for window in windows[::2]:
+        window.update(x=-1, title="moved")
+
+    events[0] = 0
+    start = time.perf_counter()
+    restore(windows, captured)
+    print(f"restore:    {time.perf_counter() - start:6.3f} s, {events[0]} update events")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -7,16 +7,48 @@ based on following classes
 """
 
 
-from .notify_updated import NotifyUpdated, notify_property_updated
+from .notify_updated import NotifyUpdated, PropertyChannel, notify_property_updated, notify_property
+from .batch import BatchScope, batch, is_batching
+from .subscription import Subscription
+from .async_observing import AsyncObserver, AsyncUpdates
+from .dispatchers import (
+    Dispatcher,
+    InlineDispatcher,
+    ThreadDispatcher,
+    ThreadPoolDispatcher,
+    AsyncioDispatcher,
+    set_default_dispatcher
+)
+from .equality import Equality, identity_equals, value_equals, array_equals, versioned
+from .instrumentation import (
+    NotifierStats,
+    HandlerStats,
+    Stats,
+    enable_instrumentation,
+    disable_instrumentation,
+    reset_stats,
+    stats
+)
 from .notify_properties_dataclass import notify_property_dataclass
 from .observable import Observable, obs
 from .observable_receiver import ObservableReceiver
 from .property_listener import PropertyListener
-from .binding import Binding, BindingMode, Converter, FunctionPair
-from .observable_list import ObservableList, olist, ol
-from .observable_dict import ObservableDict, odict, od
+from .binding import Binding, BindingMode, Converter, FunctionPair, UpdateTrigger
+from .multi_binding import MultiBinding
+from .binding_group import BindingGroup
+from .observable_list import ObservableList, ListChange, olist, ol
+from .nested_views import NestedChange
+from .observable_dict import ObservableDict, DictChange, odict, od
+from .history import History
+from .snapshot import Snapshot, snapshot, restore
+from .live_views import LiveView, FilteredView, MappedView, SortedView
 from .loop_metrics import LoopMetrics, loop_obs, loop_metrics
 from .hook_metrics import HookMetrics, hook_obs, hook_metrics
+from .computed import Computed, computed
+from .timer import SharedTimer, TimerHandle
+from .operators import Operator, Debounced, Throttled, Sampled, DistinctUntilChanged, Buffered
+
+from .graph import GraphNode, GraphEdge, DependencyGraph, dependency_graph
 
 from .when_condition import WhenCondition
 from .selective_when import SelectiveWhenCondition, selective_when
@@ -0,0 +1,189 @@
+import asyncio
+
+from threading import Lock
+from typing import Callable, Coroutine, Set, Any, Self
+
+from .subscription import Subscription
+
+
+AsyncHandler = Callable[[Any], Coroutine[Any, Any, Any]]
+
+
+def running_loop() -> asyncio.AbstractEventLoop | None:
+    """
+    :return: the event loop running on the current thread, ``None`` if there's no running loop
+    """
+
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _call_in_loop(loop: asyncio.AbstractEventLoop, function: Callable[..., Any], *args: Any) -> None:
+    if running_loop() is loop:
+        function(*args)
+        return
+
+    # the loop may be already closed, events from hook threads are just dropped then
+    if not loop.is_closed():
+        loop.call_soon_threadsafe(function, *args)
+
+
+class AsyncObserver:
+    """
+    Wraps a coroutine function subscribed to the update event, every event
+    starts a new task of the function in the event loop running while subscribing
+
+    Events raised from other threads are passed to the loop via
+    ``call_soon_threadsafe()``. If several events are raised before the
+    loop takes them, only the latest one starts the task
+    """
+
+    __slots__ = ("callback", "loop", "_lock", "_is_pending", "_latest", "_tasks")
+
+    def __init__(self, callback: AsyncHandler, loop: asyncio.AbstractEventLoop | None = None):
+        if loop is None:
+            loop = running_loop()
+            if loop is None:
+                raise RuntimeError("coroutine function can be subscribed only while an event loop is running")
+
+        self.callback: AsyncHandler = callback
+        self.loop: asyncio.AbstractEventLoop = loop
+        self._lock: Lock = Lock()
+        self._is_pending: bool = False
+        self._latest: Any = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __eq__(self, other: Any) -> bool:
+        return other is self or other == self.callback
+
+    def __hash__(self) -> int:
+        return id(self)
+
+    def __call__(self, argument: Any) -> None:
+        if running_loop() is self.loop:
+            self._start_task(argument)
+            return
+
+        with self._lock:
+            self._latest = argument
+            if self._is_pending:
+                return
+
+            self._is_pending = True
+
+        _call_in_loop(self.loop, self._start_latest_task)
+
+    def _start_latest_task(self) -> None:
+        with self._lock:
+            argument: Any = self._latest
+            self._latest = None
+            self._is_pending = False
+
+        self._start_task(argument)
+
+    def _start_task(self, argument: Any) -> None:
+        # the loop keeps weak references to tasks only
+        task: asyncio.Task = self.loop.create_task(self.callback(argument))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+class AsyncUpdates:
+    """
+    Asynchronous iterator over update events of the ``NotifyUpdated`` instance,
+    returns the value passed to subscribed functions
+
+    If the consumer is slower than updates, intermediate values are skipped,
+    and the latest value is returned. Events from other threads are passed to
+    the event loop via ``call_soon_threadsafe()``
+
+    Supports ``async with`` statement, closing the iterator on exit
+    """
+
+    def __init__(self, notifier: Any, loop: asyncio.AbstractEventLoop | None = None):
+        self._loop: asyncio.AbstractEventLoop = loop or asyncio.get_running_loop()
+        self._lock: Lock = Lock()
+        self._has_value: bool = False
+        self._latest: Any = None
+        self._is_wake_pending: bool = False
+        self._waiter: asyncio.Future | None = None
+        self._subscription: Subscription | None = notifier.attach_on_update(self._on_update)
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> Any:
+        while True:
+            with self._lock:
+                if self._has_value:
+                    value: Any = self._latest
+                    self._latest = None
+                    self._has_value = False
+                    return value
+
+            if self._subscription is None:
+                raise StopAsyncIteration
+
+            self._waiter = self._loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> bool:
+        self.close()
+        return False
+
+    def close(self) -> None:
+        """ Unsubscribes from updates, the iteration is stopped """
+
+        if self._subscription is None:
+            return
+
+        self._subscription.dispose()
+        self._subscription = None
+        _call_in_loop(self._loop, self._wake)
+
+    def _on_update(self, argument: Any) -> None:
+        with self._lock:
+            self._latest = argument
+            self._has_value = True
+            if self._is_wake_pending:
+                return
+
+            self._is_wake_pending = True
+
+        _call_in_loop(self._loop, self._wake)
+
+    def _wake(self) -> None:
+        with self._lock:
+            self._is_wake_pending = False
+
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+
+async def next_update(notifier: Any) -> Any:
+    """
+    Waits for the next update event of the ``NotifyUpdated`` instance
+
+    :return: the value passed to subscribed functions
+    """
+
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    future: asyncio.Future = loop.create_future()
+
+    def set_result(argument: Any) -> None:
+        if not future.done():
+            future.set_result(argument)
+
+    subscription: Subscription = notifier.attach_on_update(lambda argument: _call_in_loop(loop, set_result, argument))
+    try:
+        return await future
+    finally:
+        subscription.dispose()
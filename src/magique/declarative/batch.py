@@ -0,0 +1,114 @@
+from contextlib import ContextDecorator
+from threading import local, Lock
+from typing import Callable, Dict, Any, Self
+
+from .propagation import begin_wave, end_wave
+
+
+class _BatchState(local):
+    """ ``batch()`` scopes of the current thread, attributes are read without misses """
+
+    depth: int = 0
+
+    def __init__(self):
+        self.pending: Dict[int, Any] = {}
+
+
+_batch_state: _BatchState = _BatchState()
+
+# count of threads inside a scope, events skip the thread-local state while it's zero
+_active_threads: int = 0
+_active_threads_lock: Lock = Lock()
+
+
+def _count_active_thread(delta: int) -> None:
+    global _active_threads
+    with _active_threads_lock:
+        _active_threads += delta
+
+
+class BatchScope(ContextDecorator):
+    """
+    The scope deferring ``raise_update_event()`` invocations of every
+    ``NotifyUpdated`` instance until the outermost scope exits
+
+    When the outermost scope exits, every updated instance raises its
+    event at most once, in order of the first update, passing its final value
+
+    Scopes can be nested, every thread has its own independent scope
+    stack, so updates from other threads are not deferred
+    """
+
+    def __enter__(self) -> Self:
+        if _batch_state.depth == 0:
+            _count_active_thread(1)
+
+        _batch_state.depth += 1
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        _batch_state.depth -= 1
+        if _batch_state.depth == 0:
+            pending: Dict[int, Any] = _batch_state.pending
+            _batch_state.pending = {}
+            _count_active_thread(-1)
+
+            # single propagation wave, so derived nodes are updated once for the whole batch.
+            # Values are already set, so every notifier raises its event even if a handler fails
+            error: BaseException | None = None
+            begin_wave()
+            try:
+                for notifier in pending.values():
+                    try:
+                        notifier.raise_update_event()
+                    except BaseException as exception:
+                        if error is None:
+                            error = exception
+            finally:
+                end_wave()
+
+            if error is not None:
+                raise error
+
+        return False
+
+
+def batch(function: Callable | None = None) -> BatchScope | Callable:
+    """
+    Creates a scope deferring update events until the outermost scope exits,
+    then every updated ``NotifyUpdated`` instance raises a single event
+
+    Supports both ``with batch():`` and decorator ``@batch`` / ``@batch()`` syntax
+
+    :param function: a function to be decorated, if used as ``@batch``
+    :return: new ``BatchScope`` instance, or decorated function
+    """
+
+    if function is not None:
+        return BatchScope()(function)
+
+    return BatchScope()
+
+
+def is_batching() -> bool:
+    """
+    :return: ``True`` if the current thread is inside a ``batch()`` scope
+    """
+
+    return _batch_state.depth > 0
+
+
+def defer_update_event(notifier: Any) -> bool:
+    """
+    Remembers the notifier to raise its update event when the outermost
+    ``batch()`` scope exits
+
+    :param notifier: ``NotifyUpdated`` instance which event has to be raised
+    :return: ``True`` if the event is deferred, ``False`` if there's no active scope
+    """
+
+    if _active_threads == 0 or _batch_state.depth == 0:
+        return False
+
+    _batch_state.pending.setdefault(id(notifier), notifier)
+    return True
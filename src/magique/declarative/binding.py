@@ -1,24 +1,143 @@
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
-from typing import Callable, Any, Tuple
+from threading import Lock
+from typing import Callable, Any, Tuple, List, Dict
 
 from .notify_updated import NotifyUpdated, notify_property_updated
+from .subscription import Subscription
+from .async_observing import running_loop
+from .timer import TimerHandle, shared_timer
+from .propagation import (
+    height_of,
+    raise_height,
+    schedule,
+    begin_wave,
+    end_wave,
+    enter_binding,
+    exit_binding,
+    is_echo,
+    attach_node
+)
 
 
 FunctionPair = Tuple[Callable[[Any], Any], Callable[[Any], Any]]
 _sentinel: Any = object()
 
 
+class _LruCache:
+    """
+    The callable memoizing results of ``function`` for the last ``size`` arguments.
+    Arguments are keyed by type and value, unhashable arguments are passed through
+    """
+
+    __slots__ = ("function", "size", "inverse", "hits", "misses", "_entries", "_lock")
+
+    def __init__(self, function: Callable[[Any], Any], size: int):
+        self.function: Callable[[Any], Any] = function
+        self.size: int = size
+        self.inverse: _LruCache | None = None
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock: Lock = Lock()
+
+    def __call__(self, value: Any) -> Any:
+        key: Tuple[type, Any] = (value.__class__, value)
+        try:
+            with self._lock:
+                result: Any = self._entries[key]
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+        except KeyError:
+            pass
+        except TypeError:
+            self._count_miss()
+            return self.function(value)
+
+        result = self.function(value)
+        self._count_miss()
+        self.store(value, result)
+
+        # the converted value coming back is converted to the origin without the call,
+        # only if the converter declares its functions bijective
+        if self.inverse is not None:
+            self.inverse.store(result, value)
+
+        return result
+
+    def _count_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def store(self, value: Any, result: Any) -> None:
+        try:
+            with self._lock:
+                key: Tuple[type, Any] = (value.__class__, value)
+                self._entries[key] = result
+                self._entries.move_to_end(key)
+                if len(self._entries) > self.size:
+                    self._entries.popitem(last=False)
+        except TypeError:
+            pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
 @dataclass
 class Converter:
     """
     A special function pair for ``Binding`` value converting
      - ``convert`` - function to convert from ``source`` to ``destination``
      - ``convert_back`` - function to convert from ``destination`` to ``source``
+     - ``cache_size`` - memoize results for the last ``cache_size`` values of each direction,
+       disabled by default. Functions have to be pure
+     - ``bijective`` - functions are exact inverses of each other, so the value produced
+       by one of them is converted back to its origin from the cache, without the call.
+       Has no effect without ``cache_size``
     """
 
     convert: Callable[[Any], Any]
     convert_back: Callable[[Any], Any]
+    cache_size: int = 0
+    bijective: bool = False
+
+    def __post_init__(self):
+        if self.cache_size < 0:
+            raise ValueError("cache size can't be negative")
+
+        if self.cache_size > 0:
+            convert = _LruCache(self.convert, self.cache_size)
+            convert_back = _LruCache(self.convert_back, self.cache_size)
+            if self.bijective:
+                convert.inverse, convert_back.inverse = convert_back, convert
+
+            self.convert, self.convert_back = convert, convert_back
+
+    @property
+    def hits(self) -> int:
+        """ Count of conversions taken from the cache, in both directions """
+
+        return sum(cache.hits for cache in self._caches())
+
+    @property
+    def misses(self) -> int:
+        """ Count of conversions done by the functions, in both directions """
+
+        return sum(cache.misses for cache in self._caches())
+
+    def cache_clear(self) -> None:
+        """ Removes memoized results and resets counters """
+
+        for cache in self._caches():
+            cache.clear()
+
+    def _caches(self) -> List[_LruCache]:
+        return [f for f in (self.convert, self.convert_back) if isinstance(f, _LruCache)]
 
 
 class BindingMode(Enum):
@@ -52,6 +171,34 @@ class BindingMode(Enum):
     """Mode when ``destination`` update triggers ``source`` update **only once**"""
 
 
+@dataclass(frozen=True)
+class UpdateTrigger:
+    """
+    Decides when ``Binding`` passes updated values
+     - ``immediate`` - on every update, synchronously (default)
+     - ``explicit`` - only on ``Binding.flush()``
+     - ``deferred`` - once at the end of the propagation wave (so at the end of ``batch()``),
+       or of the asyncio event loop iteration if the loop is running in the thread
+     - ``rate_limited(hz)`` - at most ``hz`` times per second, the latest value is always
+       delivered, delayed values are passed from the shared timer thread
+    """
+
+    kind: str
+    hz: float | None = None
+
+    @staticmethod
+    def rate_limited(hz: float) -> "UpdateTrigger":
+        if hz <= 0:
+            raise ValueError("rate limit has to be positive")
+
+        return UpdateTrigger("rate_limited", hz)
+
+
+UpdateTrigger.immediate = UpdateTrigger("immediate")
+UpdateTrigger.explicit = UpdateTrigger("explicit")
+UpdateTrigger.deferred = UpdateTrigger("deferred")
+
+
 class Binding(NotifyUpdated):
     """
     The object allows automatically bind values updates between
@@ -59,6 +206,17 @@ class Binding(NotifyUpdated):
      - ``mode`` - one of binding modes setting the updating way
      - ``converters`` - the 2 functions for direct and reversed value converting
      - ``apply_immediately`` - raise update event manually after init
+     - ``weak`` - subscribe by weak references, the binding stops working when collected
+     - ``update_trigger`` - when updated values are passed, see ``UpdateTrigger``
+
+    Delayed values are counted: ``delivered_count`` - passed values, ``coalesced_count`` - values
+    replaced by a newer one before passing, ``dropped_count`` - values discarded by ``dispose()``
+    or mode change, and conflicting updates of both sides of two-way binding
+
+    The binding isn't applied back in the opposite direction during the propagation wave
+    (the event and all updates caused by it on the same thread) and isn't re-entered while
+    assigning, so values don't bounce back, and chains or rings of two-way bindings stop after
+    one round. Every later update of the same side during the wave is passed
     """
 
     def __init__(
@@ -67,10 +225,24 @@ class Binding(NotifyUpdated):
             destination: NotifyUpdated,
             mode: BindingMode = BindingMode.send,
             converter: Converter | FunctionPair = _sentinel,
-            apply_immediately: bool = False):
+            apply_immediately: bool = False,
+            weak: bool = False,
+            update_trigger: UpdateTrigger = UpdateTrigger.immediate):
 
         super().__init__()
         self._first_update_done: bool = False
+        self._weak: bool = weak
+        # subscriptions to updated instances, mapped to their direction, ``True`` to the destination
+        self._subscriptions: Dict[Subscription, bool] = {}
+
+        self.update_trigger: UpdateTrigger = update_trigger
+        self._lock: Lock = Lock()
+        self._pending: Dict[bool, Any] = {}
+        self._is_flush_scheduled: bool = False
+        self._timer_handle: TimerHandle | None = None
+        self._delivered_count: int = 0
+        self._coalesced_count: int = 0
+        self._dropped_count: int = 0
 
         self._source: NotifyUpdated = source
         self._destination: NotifyUpdated = destination
@@ -105,7 +277,7 @@ class Binding(NotifyUpdated):
     @source.setter
     @notify_property_updated(lambda self: self._source)
     def source(self, new_obs: NotifyUpdated):
-        self._disable_mode(self.mode)
+        self._disable_mode()
         self._source = new_obs
         self._enable_mode(self.mode)
 
@@ -115,7 +287,7 @@ class Binding(NotifyUpdated):
     @destination.setter
     @notify_property_updated(lambda self: self._destination)
     def destination(self, new_obs: NotifyUpdated):
-        self._disable_mode(self.mode)
+        self._disable_mode()
         self._destination = new_obs
         self._enable_mode(self.mode)
 
@@ -125,55 +297,188 @@ class Binding(NotifyUpdated):
     @mode.setter
     @notify_property_updated(lambda self: self._mode)
     def mode(self, new_mode: BindingMode):
-        self._disable_mode(self.mode)
+        self._disable_mode()
         self._enable_mode(new_mode)
         self._mode = new_mode
 
-    def _disable_mode(self, mode: BindingMode) -> None:
-        if mode == BindingMode.send:
-            self.source.detach_on_update(self._update_destination_from_source)
-        elif mode == BindingMode.receive:
-            self.destination.detach_on_update(self._update_source_from_destination)
-        elif mode == BindingMode.two_way:
-            self.source.detach_on_update(self._update_destination_from_source)
-            self.destination.detach_on_update(self._update_source_from_destination)
-        elif mode == BindingMode.single_send:
-            self.source.detach_on_update(self._one_time_update_destination_from_source)
-        elif mode == BindingMode.single_receive:
-            self.destination.detach_on_update(self._one_time_update_source_from_destination)
+    @property
+    def delivered_count(self) -> int: return self._delivered_count
+
+    @property
+    def coalesced_count(self) -> int: return self._coalesced_count
+
+    @property
+    def dropped_count(self) -> int: return self._dropped_count
+
+    @property
+    def pending_count(self) -> int:
+        """ Count of values waiting to be passed, one per direction at most """
+
+        return len(self._pending)
+
+    def dispose(self) -> None:
+        """
+        Stops the binding, unsubscribing it from ``source`` and ``destination`` updates
+        """
+
+        self._disable_mode()
+
+    def target_of(self, subscription: Subscription) -> NotifyUpdated | None:
+        """
+        :param subscription: the subscription of the binding to its ``source`` or ``destination``
+        :return: the instance updated when the subscription is invoked,
+            ``None`` if the subscription doesn't belong to the binding
+        """
+
+        to_destination: bool | None = self._subscriptions.get(subscription)
+        if to_destination is None:
+            return None
+
+        return self.destination if to_destination else self.source
+
+    def flush(self) -> bool:
+        """
+        Passes the waiting values immediately, whatever the ``update_trigger`` is
+
+        :return: ``True`` if there were waiting values
+        """
+
+        with self._lock:
+            self._is_flush_scheduled = False
+            pending: Dict[bool, Any] = self._pending
+            self._pending = {}
+
+        if not pending:
+            return False
+
+        # the own wave marks the applied direction, so the echo from the other side is ignored
+        begin_wave()
+        try:
+            for to_destination, new_value in pending.items():
+                if enter_binding(self, to_destination):
+                    try:
+                        self._assign(to_destination, new_value)
+                    finally:
+                        exit_binding(self)
+                else:
+                    # counters are updated by the timer thread too for rate-limited bindings
+                    with self._lock:
+                        self._dropped_count += 1
+        finally:
+            end_wave()
+
+        return True
+
+    def _disable_mode(self) -> None:
+        for subscription in self._subscriptions:
+            subscription.dispose()
+
+        self._subscriptions.clear()
+        with self._lock:
+            self._dropped_count += len(self._pending)
+            self._pending.clear()
+            if self._timer_handle is not None:
+                self._timer_handle.cancel()
+                self._timer_handle = None
 
     def _enable_mode(self, mode: BindingMode) -> None:
+        # bound instance is placed above its origin, so nodes depending on it are
+        # updated after it. Two-way bindings are cycles and don't change heights
+        if mode in {BindingMode.send, BindingMode.single_send}:
+            raise_height(self.destination, height_of(self.source) + 1)
+        elif mode in {BindingMode.receive, BindingMode.single_receive}:
+            raise_height(self.source, height_of(self.destination) + 1)
+
         if mode == BindingMode.send:
-            self.source.attach_on_update(self._update_destination_from_source)
+            self._subscribe(True, self._update_destination_from_source)
         elif mode == BindingMode.receive:
-            self.destination.attach_on_update(self._update_source_from_destination)
+            self._subscribe(False, self._update_source_from_destination)
         elif mode == BindingMode.two_way:
-            self.source.attach_on_update(self._update_destination_from_source)
-            self.destination.attach_on_update(self._update_source_from_destination)
+            self._subscribe(True, self._update_destination_from_source)
+            self._subscribe(False, self._update_source_from_destination)
         elif mode == BindingMode.single_send:
             self._first_update_done = False
-            self.source.attach_on_update(self._one_time_update_destination_from_source)
+            self._subscribe(True, self._one_time_update_destination_from_source)
         elif mode == BindingMode.single_receive:
             self._first_update_done = False
-            self.destination.attach_on_update(self._one_time_update_source_from_destination)
+            self._subscribe(False, self._one_time_update_source_from_destination)
 
-    def _update_destination_from_source(self, new_value: Any) -> None:
-        if self.destination.is_sending: return
-        if isinstance(new_value, NotifyUpdated):
-            new_value = new_value.value
+    def _subscribe(self, to_destination: bool, handler: Callable[[Any], Any]) -> None:
+        notifier: NotifyUpdated = self.source if to_destination else self.destination
+        self._subscriptions[attach_node(notifier, handler, self._weak)] = to_destination
 
-        self.source.is_sending = True
-        self.destination.value = self.converter.convert(new_value)
-        self.source.is_sending = False
+    def _update_destination_from_source(self, new_value: Any) -> None:
+        self._push(True, new_value)
 
     def _update_source_from_destination(self, new_value: Any) -> None:
-        if self.source.is_sending: return
+        self._push(False, new_value)
+
+    def _assign(self, to_destination: bool, new_value: Any) -> None:
         if isinstance(new_value, NotifyUpdated):
             new_value = new_value.value
 
-        self.destination.is_sending = True
-        self.source.value = self.converter.convert_back(new_value)
-        self.destination.is_sending = False
+        if to_destination:
+            self.destination.value = self.converter.convert(new_value)
+        else:
+            self.source.value = self.converter.convert_back(new_value)
+
+        with self._lock:
+            self._delivered_count += 1
+
+    def _push(self, to_destination: bool, new_value: Any) -> None:
+        kind: str = self.update_trigger.kind
+        if kind == "immediate":
+            if enter_binding(self, to_destination):
+                try:
+                    self._assign(to_destination, new_value)
+                finally:
+                    exit_binding(self)
+
+            return
+
+        # the update caused by the binding itself
+        if is_echo(self, to_destination):
+            return
+
+        with self._lock:
+            if to_destination in self._pending:
+                self._coalesced_count += 1
+
+            self._pending[to_destination] = new_value
+
+            if kind == "deferred":
+                is_scheduled: bool = self._is_flush_scheduled
+                self._is_flush_scheduled = True
+            elif kind == "rate_limited":
+                is_scheduled = self._timer_handle is not None
+                if not is_scheduled:
+                    self._timer_handle = shared_timer.call_later(1 / self.update_trigger.hz, self._rate_window_elapsed)
+            else:
+                return
+
+        if is_scheduled:
+            return
+
+        if kind == "rate_limited":
+            # the window is opened by the passed value, the next one waits for the window end
+            self.flush()
+            return
+
+        loop = running_loop()
+        if loop is not None:
+            loop.call_soon(self.flush)
+        else:
+            schedule(self, max(height_of(self.source), height_of(self.destination)), self.flush)
+
+    def _rate_window_elapsed(self) -> None:
+        with self._lock:
+            if not self._pending:
+                self._timer_handle = None
+                return
+
+            self._timer_handle = shared_timer.call_later(1 / self.update_trigger.hz, self._rate_window_elapsed)
+
+        self.flush()
 
     def _one_time_update_destination_from_source(self, new_value: Any) -> None:
         if self._first_update_done: return
@@ -0,0 +1,104 @@
+from typing import Callable, Iterable, List, Any
+
+from .notify_updated import NotifyUpdated
+from .subscription import Subscription
+from .binding import Converter
+from .propagation import height_of, raise_height, enter_binding, exit_binding, attach_node
+
+
+class BindingGroup(NotifyUpdated):
+    """
+    The object binding a single ``source`` to many ``destinations`` through
+    a single subscription. The converter is invoked once per source update,
+    and the converted value is assigned to every destination
+     - ``converter`` - a function or ``Converter`` (its ``convert`` is used)
+     - ``apply_immediately`` - assign the source value to destinations after init
+     - ``weak`` - subscribe by weak reference, the group stops working when collected
+
+    The group can be disabled and enabled again, destinations
+    are not updated while the group is disabled
+    """
+
+    def __init__(
+            self,
+            source: NotifyUpdated,
+            destinations: Iterable[NotifyUpdated] = (),
+            converter: Callable[[Any], Any] | Converter | None = None,
+            apply_immediately: bool = False,
+            weak: bool = False):
+
+        super().__init__()
+        self.source: NotifyUpdated = source
+        self.destinations: List[NotifyUpdated] = []
+        self.converter: Callable[[Any], Any] | None = converter.convert if isinstance(converter, Converter) else converter
+        self._weak: bool = weak
+        self._subscription: Subscription | None = None
+
+        for destination in destinations:
+            self.add(destination)
+
+        self.enable()
+        if apply_immediately:
+            self.apply()
+
+    def __repr__(self) -> str:
+        return (
+            f"<binding group: enabled={self.is_enabled}; "
+            f"from {self.source.__repr__()} to {len(self.destinations)} destinations>"
+        )
+
+    @property
+    def is_enabled(self) -> bool: return self._subscription is not None
+
+    def add(self, destination: NotifyUpdated) -> None:
+        """ Appends the destination, it's updated on the next source update """
+
+        raise_height(destination, height_of(self.source) + 1)
+        self.destinations.append(destination)
+
+    def remove(self, destination: NotifyUpdated) -> None:
+        """ Removes the destination, it's not updated by the group anymore """
+
+        self.destinations.remove(destination)
+
+    def enable(self) -> None:
+        """ Subscribes the group to source updates, if it's disabled """
+
+        if self._subscription is None:
+            self._subscription = attach_node(self.source, self._source_updated, self._weak)
+
+    def disable(self) -> None:
+        """ Unsubscribes the group from source updates, destinations are kept """
+
+        if self._subscription is not None:
+            self._subscription.dispose()
+            self._subscription = None
+
+    def dispose(self) -> None:
+        """ Unsubscribes the group from source updates and removes all destinations """
+
+        self.disable()
+        self.destinations.clear()
+
+    def apply(self) -> None:
+        """ Assigns the current source value to all destinations """
+
+        self._update_destinations(self.source.value)
+
+    def _source_updated(self, new_value: Any) -> None:
+        if not enter_binding(self, True): return
+        if isinstance(new_value, NotifyUpdated):
+            new_value = new_value.value
+
+        try:
+            self._update_destinations(new_value)
+        finally:
+            exit_binding(self)
+
+    def _update_destinations(self, new_value: Any) -> None:
+        if self.converter is not None:
+            new_value = self.converter(new_value)
+
+        # destinations may be removed by their update handlers
+        for destination in list(self.destinations):
+            destination.value = new_value
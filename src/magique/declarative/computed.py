@@ -0,0 +1,144 @@
+from typing import Callable, TypeVar, Dict, Any
+
+from .observable import Observable
+from .subscription import Subscription, Handler
+from .propagation import schedule, height_above, attach_node
+from .equality import Equality, value_equals
+from . import dependency_tracking
+
+
+T = TypeVar('T')
+
+
+class Computed(Observable[T]):
+    """
+    A read-only ``Observable`` calculated by the specified function
+
+    Every ``Observable.value`` and tracked property read during the function
+    invocation is recorded as a dependency, so the instance subscribes to exactly
+    the read instances, and re-tracks them on every recalculation
+
+    The dependency update only marks the value as outdated. The function is invoked
+    again when the ``value`` is read, or immediately if the instance has subscribed
+    functions, then ``raise_update_event()`` is invoked if the value is changed
+
+    The immediate recalculation is scheduled to the end of the propagation wave,
+    so the function is invoked once even if several dependencies are updated
+    """
+
+    def __init__(self, function: Callable[[], T], equals: Equality = value_equals):
+        super().__init__(None, equals)
+        self._function: Callable[[], T] = function
+        self._dependencies: Dict[int, Subscription] = {}
+        self._is_dirty: bool = True
+        self._is_computing: bool = False
+        self._is_scheduled: bool = False
+        self._value_before_update: T | None = None
+        self.propagation_height: int = 1
+
+    def __repr__(self) -> str:
+        return f"<computed: value={self._value.__repr__()}; dirty={self._is_dirty}; observers_len={self.observers_count}>"
+
+    def __call__(self) -> T:
+        return self.value
+
+    @property
+    def value(self) -> T:
+        if self._is_dirty:
+            self._recompute()
+
+        if dependency_tracking.active_frames:
+            dependency_tracking.track_read(self)
+
+        return self._value
+
+    @property
+    def is_dirty(self) -> bool:
+        """ Is the value outdated, to be recalculated on the next read """
+
+        return self._is_dirty
+
+    @property
+    def dependencies_count(self) -> int:
+        return len(self._dependencies)
+
+    def attach_on_update(self, callback: Handler, weak: bool = False) -> Subscription:
+        # dependencies are unknown until the first calculation,
+        # observed instance has to know them to be notified
+        if self._is_dirty:
+            self._recompute()
+
+        return super().attach_on_update(callback, weak)
+
+    def dispose(self) -> None:
+        """
+        Unsubscribes from all dependencies, the value is calculated
+        again and dependencies are tracked on the next read
+        """
+
+        for subscription in self._dependencies.values():
+            subscription.dispose()
+
+        self._dependencies.clear()
+        self._is_dirty = True
+
+    def _recompute(self) -> None:
+        if self._is_computing:
+            raise RecursionError("computed value depends on itself")
+
+        self._is_computing = True
+        try:
+            new_value, read_instances = dependency_tracking.tracked_call(self._function)
+        finally:
+            self._is_computing = False
+
+        self._value = new_value
+        self._is_dirty = False
+        self._retrack(read_instances)
+
+    def _retrack(self, read_instances: Dict[int, Any]) -> None:
+        read_instances.pop(id(self), None)
+        self.propagation_height = height_above(read_instances.values())
+
+        for key in [key for key in self._dependencies if key not in read_instances]:
+            self._dependencies.pop(key).dispose()
+
+        for key, notifier in read_instances.items():
+            if key not in self._dependencies:
+                self._dependencies[key] = attach_node(notifier, self._dependency_updated)
+
+    def _dependency_updated(self, placeholder: Any) -> None:
+        if self._is_dirty:
+            return
+
+        self._is_dirty = True
+        if not self._observers or self._is_scheduled:
+            return
+
+        self._is_scheduled = True
+        self._value_before_update = self._value
+        schedule(self, self.propagation_height, self._refresh)
+
+    def _refresh(self) -> None:
+        self._is_scheduled = False
+        if self._is_dirty:
+            self._recompute()
+
+        if not self._equals(self._value_before_update, self._value):
+            self.raise_update_event()
+
+
+def computed(function: Callable[[], T] | None = None, equals: Equality = value_equals) -> Computed[T] | Callable:
+    """
+    Creates an instance of ``Computed`` class, tracking dependencies
+    of the function automatically. Can be used as a decorator, ``@computed``
+    or ``@computed(equals=...)``
+
+    :param function: calculator of the value, reading ``Observable`` values
+    :param equals: the strategy comparing old and new calculated values
+    """
+
+    if function is None:
+        return lambda decorated_function: Computed(decorated_function, equals)
+
+    return Computed(function, equals)
@@ -0,0 +1,64 @@
+from threading import local, Lock
+from typing import Callable, Dict, Tuple, TypeVar, Any
+
+
+T = TypeVar('T')
+Dependencies = Dict[int, Any]
+
+_tracking_state = local()
+_counter_lock = Lock()
+
+active_frames: int = 0
+"""
+Count of running tracking frames over all threads,
+allows ``value`` getters to skip tracking when nobody records reads
+"""
+
+
+def track_read(notifier: Any) -> None:
+    """
+    Records the ``NotifyUpdated`` instance as a dependency
+    of the innermost running ``tracked_call()`` on the current thread
+    """
+
+    frames = getattr(_tracking_state, "frames", None)
+    if frames:
+        frames[-1].setdefault(id(notifier), notifier)
+
+
+def track_property_read(owner: Any, property_name: str) -> None:
+    """
+    Records owner's property channel as a dependency
+    of the innermost running ``tracked_call()`` on the current thread
+    """
+
+    if getattr(_tracking_state, "frames", None):
+        # noinspection PyProtectedMember
+        track_read(owner._property_channel(property_name))
+
+
+def tracked_call(function: Callable[[], T]) -> Tuple[T, Dependencies]:
+    """
+    Invokes the function recording every ``Observable.value``
+    and tracked property read during the invocation
+
+    :return: function result, and read ``NotifyUpdated`` instances by their ``id()``
+    """
+
+    global active_frames
+
+    frames = getattr(_tracking_state, "frames", None)
+    if frames is None:
+        frames = _tracking_state.frames = []
+
+    dependencies: Dependencies = {}
+    frames.append(dependencies)
+    with _counter_lock:
+        active_frames += 1
+
+    try:
+        return function(), dependencies
+    finally:
+        frames.pop()
+        with _counter_lock:
+            active_frames -= 1
@@ -0,0 +1,175 @@
+import sys
+import asyncio
+
+from abc import ABC, abstractmethod
+from queue import SimpleQueue
+from threading import Thread, Lock
+from typing import Callable, List, Tuple, Any
+
+
+ErrorHandler = Callable[[BaseException], Any]
+
+
+def _print_error(error: BaseException) -> None:
+    sys.excepthook(type(error), error, error.__traceback__)
+
+
+class Dispatcher(ABC):
+    """
+    Decides where and when subscribed functions of ``NotifyUpdated``
+    instances are invoked, after ``raise_update_event()``
+
+    Every dispatcher keeps the order of events of the same instance,
+    and counts queued events:
+     - ``queue_depth`` - count of events waiting to be delivered
+     - ``max_queue_depth`` - the highest ``queue_depth`` ever reached
+     - ``dispatched_count`` - count of delivered events
+    """
+
+    def __init__(self, error_handler: ErrorHandler = _print_error):
+        self.error_handler: ErrorHandler = error_handler
+        self._counters_lock: Lock = Lock()
+        self._queue_depth: int = 0
+        self._max_queue_depth: int = 0
+        self._dispatched_count: int = 0
+
+    @property
+    def queue_depth(self) -> int: return self._queue_depth
+
+    @property
+    def max_queue_depth(self) -> int: return self._max_queue_depth
+
+    @property
+    def dispatched_count(self) -> int: return self._dispatched_count
+
+    @abstractmethod
+    def dispatch(self, notifier: Any, argument: Any) -> None:
+        """
+        Delivers the event, invoking ``notifier``'s subscribed functions with the argument
+        """
+
+    def shutdown(self) -> None:
+        """ Stops dispatcher's threads, if there are any """
+
+    def _enqueued(self) -> None:
+        with self._counters_lock:
+            self._queue_depth += 1
+            if self._queue_depth > self._max_queue_depth:
+                self._max_queue_depth = self._queue_depth
+
+    def _deliver(self, notifier: Any, argument: Any) -> None:
+        try:
+            notifier._deliver_update(argument)
+        except Exception as error:
+            self.error_handler(error)
+        finally:
+            with self._counters_lock:
+                self._queue_depth -= 1
+                self._dispatched_count += 1
+
+
+class InlineDispatcher(Dispatcher):
+    """
+    Invokes subscribed functions immediately, in the thread raising the event.
+    It's the default behavior, errors are raised to the event invoker
+    """
+
+    def dispatch(self, notifier: Any, argument: Any) -> None:
+        notifier._deliver_update(argument)
+        with self._counters_lock:
+            self._dispatched_count += 1
+
+
+class _Worker:
+    def __init__(self, dispatcher: Dispatcher, name: str):
+        self.queue: SimpleQueue[Tuple[Any, Any] | None] = SimpleQueue()
+        self.thread: Thread = Thread(target=self.run, args=(dispatcher,), name=name, daemon=True)
+        self.thread.start()
+
+    def run(self, dispatcher: Dispatcher) -> None:
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+
+            dispatcher._deliver(*item)
+
+
+class ThreadDispatcher(Dispatcher):
+    """
+    Invokes subscribed functions in a single consumer thread, so slow
+    functions don't block the thread raising the event (e.g. input hooks).
+    Events are delivered in the order they are raised
+    """
+
+    def __init__(self, error_handler: ErrorHandler = _print_error):
+        super().__init__(error_handler)
+        self._worker: _Worker = _Worker(self, "magique-dispatcher")
+
+    def dispatch(self, notifier: Any, argument: Any) -> None:
+        self._enqueued()
+        self._worker.queue.put((notifier, argument))
+
+    def shutdown(self) -> None:
+        self._worker.queue.put(None)
+        self._worker.thread.join()
+
+
+class ThreadPoolDispatcher(Dispatcher):
+    """
+    Invokes subscribed functions in a pool of threads. Every ``NotifyUpdated``
+    instance is served by the same thread, so its events keep their order,
+    while events of different instances are delivered in parallel
+    """
+
+    def __init__(self, workers_count: int = 4, error_handler: ErrorHandler = _print_error):
+        super().__init__(error_handler)
+        self._workers: List[_Worker] = [
+            _Worker(self, f"magique-dispatcher-{i}") for i in range(workers_count)
+        ]
+
+    def dispatch(self, notifier: Any, argument: Any) -> None:
+        # object addresses are aligned, lower bits don't differ
+        worker: _Worker = self._workers[(id(notifier) >> 4) % len(self._workers)]
+        self._enqueued()
+        worker.queue.put((notifier, argument))
+
+    def shutdown(self) -> None:
+        for worker in self._workers:
+            worker.queue.put(None)
+
+        for worker in self._workers:
+            worker.thread.join()
+
+
+class AsyncioDispatcher(Dispatcher):
+    """
+    Invokes subscribed functions in the asyncio event loop thread,
+    events raised from other threads are passed via ``call_soon_threadsafe()``
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, error_handler: ErrorHandler = _print_error):
+        super().__init__(error_handler)
+        self.loop: asyncio.AbstractEventLoop = loop
+
+    def dispatch(self, notifier: Any, argument: Any) -> None:
+        self._enqueued()
+        self.loop.call_soon_threadsafe(self._deliver, notifier, argument)
+
+
+default_dispatcher: Dispatcher | None = None
+"""
+The dispatcher of instances without their own dispatcher,
+``None`` - subscribed functions are invoked inline
+"""
+
+
+def set_default_dispatcher(dispatcher: Dispatcher | None) -> None:
+    """
+    Sets the dispatcher of all ``NotifyUpdated`` instances without their own dispatcher
+
+    :param dispatcher: new dispatcher, ``None`` to invoke subscribed functions inline
+    """
+
+    global default_dispatcher
+    default_dispatcher = dispatcher
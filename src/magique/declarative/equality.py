@@ -0,0 +1,71 @@
+from typing import Callable, Any
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+Equality = Callable[[Any, Any], bool]
+"""
+A strategy comparing an old and a new value, ``True`` if the values are the same
+and the update event doesn't have to be raised
+"""
+
+
+def identity_equals(a: Any, b: Any) -> bool:
+    """
+    Values are the same only if it's the same object, O(1) for any value
+    """
+
+    return a is b
+
+
+def value_equals(a: Any, b: Any) -> bool:
+    """
+    The default strategy, compares values by ``==``.
+    Element-wise results (like arrays have) are compared via ``array_equals()``
+    """
+
+    if a is b:
+        return True
+
+    result: Any = a == b
+    if result is True or result is False:
+        return result
+
+    return array_equals(a, b)
+
+
+def array_equals(a: Any, b: Any) -> bool:
+    """
+    Compares arrays by shape and elements, instead of
+    element-wise ``==`` result, supports NumPy arrays if installed
+    """
+
+    if a is b:
+        return True
+
+    if numpy is not None and (isinstance(a, numpy.ndarray) or isinstance(b, numpy.ndarray)):
+        return bool(numpy.array_equal(a, b))
+
+    try:
+        return bool(a == b)
+    except ValueError:
+        return False
+
+
+def versioned(key: str | Callable[[Any], Any] = "version") -> Equality:
+    """
+    Creates a strategy comparing version stamps of values (a counter, a timestamp, a hash)
+    instead of their content, so large values are compared in O(1)
+
+    :param key: attribute name of the version stamp, or a function returning it
+    """
+
+    get_version: Callable[[Any], Any] = (lambda value: getattr(value, key, None)) if isinstance(key, str) else key
+
+    def version_equals(a: Any, b: Any) -> bool:
+        return get_version(a) == get_version(b)
+
+    return version_equals
@@ -0,0 +1,279 @@
+import json
+
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Iterable, Mapping, Dict, List, Tuple, Any
+
+from .notify_updated import NotifyUpdated, PropertyChannel
+from .binding import Binding
+from .multi_binding import MultiBinding
+from .binding_group import BindingGroup
+from .async_observing import AsyncObserver
+from .propagation import height_of
+from . import instrumentation
+
+
+@dataclass
+class GraphNode:
+    """
+    An instance of the dependency graph: ``NotifyUpdated`` instance,
+    ``WhenCondition`` or a subscribed function
+    """
+
+    id: int
+    kind: str
+    label: str
+    observers_count: int
+    height: int
+
+
+@dataclass
+class GraphEdge:
+    """
+    An update path between two nodes. ``calls_count`` and ``total_seconds`` are
+    measured only while the instrumentation is enabled, see ``enable_instrumentation()``.
+    The time includes the whole cascade started by the subscribed function
+    """
+
+    source: int
+    target: int
+    via: str
+    calls_count: int = 0
+    total_seconds: float = 0.0
+
+
+class DependencyGraph:
+    """
+    The snapshot of subscriptions between reactive instances, built by ``dependency_graph()``
+    """
+
+    def __init__(self, nodes: Dict[int, GraphNode], edges: List[GraphEdge]):
+        self.nodes: Dict[int, GraphNode] = nodes
+        self.edges: List[GraphEdge] = edges
+        self._targets: Dict[int, List[int]] = {key: [] for key in nodes}
+        for edge in edges:
+            self._targets[edge.source].append(edge.target)
+
+    def __repr__(self) -> str:
+        return f"<DependencyGraph: nodes_len={len(self.nodes)}; edges_len={len(self.edges)}>"
+
+    def fan_out(self, node_id: int) -> int:
+        """
+        :return: count of nodes directly updated by the node
+        """
+
+        return len(self._targets[node_id])
+
+    def cascade(self, node_id: int) -> Tuple[int, int]:
+        """
+        Walks all nodes reachable from the node, a single update of the node
+        can update each of them
+
+        :return: count of reachable nodes and the depth of the cascade
+        """
+
+        depths: Dict[int, int] = {node_id: 0}
+        queue: deque[int] = deque([node_id])
+        while queue:
+            current: int = queue.popleft()
+            for target in self._targets[current]:
+                if target not in depths:
+                    depths[target] = depths[current] + 1
+                    queue.append(target)
+
+        return len(depths) - 1, max(depths.values())
+
+    def cascade_size(self, node_id: int) -> int:
+        return self.cascade(node_id)[0]
+
+    def worst_cascade(self) -> Tuple[GraphNode | None, int]:
+        """
+        :return: the node which single update reaches the most of other nodes, and count of them
+        """
+
+        return self._worst_of({node_id: self.cascade(node_id) for node_id in self.nodes})
+
+    def _worst_of(self, cascades: Dict[int, Tuple[int, int]]) -> Tuple[GraphNode | None, int]:
+        worst: GraphNode | None = None
+        worst_size: int = 0
+        for node_id, (size, _) in cascades.items():
+            if size > worst_size:
+                worst, worst_size = self.nodes[node_id], size
+
+        return worst, worst_size
+
+    def as_dict(self) -> Dict[str, Any]:
+        # cascades are walked once per node, for both nodes and the worst cascade
+        cascades: Dict[int, Tuple[int, int]] = {node_id: self.cascade(node_id) for node_id in self.nodes}
+        nodes: List[Dict[str, Any]] = []
+        for node_id, node in self.nodes.items():
+            cascade_size, cascade_depth = cascades[node_id]
+            nodes.append(dict(
+                asdict(node),
+                fan_out=self.fan_out(node_id),
+                cascade_size=cascade_size,
+                cascade_depth=cascade_depth
+            ))
+
+        worst, worst_size = self._worst_of(cascades)
+        return {
+            "nodes": nodes,
+            "edges": [asdict(edge) for edge in self.edges],
+            "worst_cascade": {"node": None if worst is None else worst.id, "size": worst_size}
+        }
+
+    def to_json(self, **kwargs: Any) -> str:
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def to_dot(self, name: str = "magique") -> str:
+        """
+        :return: the graph in Graphviz DOT format
+        """
+
+        lines: List[str] = [f"digraph {name} {{"]
+        for node in self.nodes.values():
+            shape: str = "ellipse" if node.kind == "function" else "box"
+            lines.append(f'    n{node.id} [label="{_escape(node.label)}\\n{node.kind}", shape={shape}];')
+
+        for edge in self.edges:
+            label: str = edge.via
+            if edge.calls_count:
+                label += f"\\n{edge.calls_count} calls, {edge.total_seconds * 1000:.3f}ms"
+
+            lines.append(f'    n{edge.source} -> n{edge.target} [label="{_escape(label)}"];')
+
+        lines.append("}")
+        return "\n".join(lines)
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _function_label(function: Any) -> str:
+    function = getattr(function, "__func__", function)
+    return getattr(function, "__qualname__", type(function).__qualname__)
+
+
+class _GraphBuilder:
+    def __init__(self):
+        self.nodes: Dict[int, GraphNode] = {}
+        self.edges: List[GraphEdge] = []
+        self.queue: deque[Any] = deque()
+        # resolved weak callbacks are new objects, kept alive so their ids aren't reused
+        self.instances: List[Any] = []
+
+    def add_node(self, instance: Any, kind: str | None = None, label: str | None = None) -> int:
+        key: int = id(instance)
+        if key in self.nodes:
+            return key
+
+        self.instances.append(instance)
+        observers: Any = getattr(instance, "_observers", None)
+        self.nodes[key] = GraphNode(
+            key,
+            kind or type(instance).__name__,
+            label or f"{type(instance).__name__}@{key:#x}",
+            0 if observers is None else len(observers),
+            height_of(instance)
+        )
+
+        if isinstance(instance, (NotifyUpdated, PropertyChannel)):
+            self.queue.append(instance)
+
+        return key
+
+    def add_edge(self, source: Any, target: Any, via: str, subscription: Any = None) -> None:
+        calls_count, total_seconds = (0, 0.0) if subscription is None else instrumentation.subscription_cost(subscription)
+        self.edges.append(GraphEdge(id(source), id(target), via, calls_count, total_seconds))
+
+    def walk(self, notifier: NotifyUpdated) -> None:
+        for subscription, callback in list((notifier._observers or {}).items()):
+            if callback is None:
+                callback = subscription.callback
+                if callback is None:
+                    continue
+
+            self.walk_subscription(notifier, subscription, callback)
+
+        # property channels are raised by the owner, receivers update the owner
+        for name, channel in (getattr(notifier, "_property_observers", None) or {}).items():
+            if channel.observers_count:
+                self.add_node(channel, "property", f".{name}")
+                self.add_edge(notifier, channel, f"property({name})")
+
+            if channel.notifier is not None:
+                self.add_node(channel.notifier, label=f".{name}")
+                self.add_edge(notifier, channel.notifier, f"property_updated({name})")
+
+            if channel.receiver is not None:
+                self.add_node(channel.receiver, label=f".{name}")
+                self.add_edge(channel.receiver, notifier, f"property_received({name})")
+
+    def walk_subscription(self, notifier: NotifyUpdated, subscription: Any, callback: Any) -> None:
+        if isinstance(callback, AsyncObserver):
+            self.add_node(callback, "coroutine function", _function_label(callback.callback))
+            self.add_edge(notifier, callback, "async", subscription)
+            return
+
+        owner: Any = getattr(callback, "__self__", None)
+        method_name: str = _function_label(callback)
+
+        target: NotifyUpdated | None = owner.target_of(subscription) if isinstance(owner, Binding) else None
+        if target is not None:
+            self.add_node(target)
+            self.add_edge(notifier, target, f"Binding({owner.mode.name})", subscription)
+
+        elif owner is not None and (isinstance(owner, NotifyUpdated) or hasattr(owner, "propagation_height")):
+            # derived nodes: Computed, HookMetrics, PropertyListener, operators, when conditions
+            is_new: bool = id(owner) not in self.nodes
+            self.add_node(owner)
+            self.add_edge(notifier, owner, method_name.rsplit(".", 1)[-1], subscription)
+
+            # multi bindings and binding groups assign destinations without subscriptions
+            if is_new and isinstance(owner, (MultiBinding, BindingGroup)):
+                destinations: List[Any] = [owner.destination] if isinstance(owner, MultiBinding) else owner.destinations
+                for destination in destinations:
+                    self.add_node(destination)
+                    self.add_edge(owner, destination, "assign")
+
+        else:
+            self.add_node(callback, "function", method_name)
+            self.add_edge(notifier, callback, "handler", subscription)
+
+
+def dependency_graph(
+        *roots: NotifyUpdated,
+        redirects: Iterable[Mapping[Any, Iterable[Any]]] = ()) -> DependencyGraph:
+    """
+    Walks subscriptions of passed instances and all instances updated by them,
+    building the graph of nodes and update paths between them
+
+    Plain subscribed functions are leaf nodes. Bindings are edges between their
+    ``source`` and ``destination``, derived instances (``Computed``, ``HookMetrics``,
+    ``PropertyListener``, ``WhenCondition``, operators) are nodes
+
+    :param roots: instances to start the walk from
+    :param redirects: dictionaries redirecting updates from keys to values,
+    like ``OneOfKeys.redirect_dict`` and ``OneOfMouseButtons.redirect_dict``,
+    their keys are walked as roots too
+    :return: new ``DependencyGraph`` snapshot
+    """
+
+    builder: _GraphBuilder = _GraphBuilder()
+    redirects = list(redirects)
+
+    for root in roots:
+        builder.add_node(root)
+
+    for redirect_dict in redirects:
+        for source, targets in redirect_dict.items():
+            builder.add_node(source)
+            for target in targets:
+                builder.add_node(target)
+                builder.add_edge(source, target, "redirect")
+
+    while builder.queue:
+        builder.walk(builder.queue.popleft())
+
+    return DependencyGraph(builder.nodes, builder.edges)
@@ -0,0 +1,163 @@
+from collections import deque
+from typing import Any, Deque, List, Tuple
+
+from .notify_updated import NotifyUpdated
+from .observable import Observable
+from .observable_list import ObservableList
+from .observable_dict import ObservableDict
+from .subscription import Subscription
+from .batch import batch
+
+
+# ("value", old value, new value) for replaced values, ("change", collection change, None) for diffs
+_Operation = Tuple[str, Any, Any]
+_Entry = Tuple[_Operation, ...]
+
+
+class History(NotifyUpdated):
+    """
+    The bounded undo/redo history of the ``observable`` value
+
+    Replaced values are stored by reference. Mutations of ``ObservableList`` and
+    ``ObservableDict`` are stored as diffs (changed items only), not as collection copies.
+    Changes raising a single update event, e.g. made in a ``batch()`` scope
+    or by ``remove_many()``, are recorded as a single entry
+
+    Only the last ``capacity`` entries are kept, the oldest one is discarded first.
+    ``undo()`` and ``redo()`` raise a single update event of the observable.
+    The history raises its own update event when entries are recorded or restored
+    """
+
+    def __init__(self, observable: Observable, capacity: int = 100):
+        if capacity <= 0:
+            raise ValueError("history capacity has to be positive")
+
+        super().__init__()
+        self.observable: Observable = observable
+        self._undo_entries: Deque[_Entry] = deque(maxlen=capacity)
+        self._redo_entries: List[_Entry] = []
+        self._pending: List[_Operation] = []
+        self._last_value: Any = observable._value
+        self._is_restoring: bool = False
+
+        self._subscriptions: List[Subscription] = [observable.attach_on_update(self._observable_updated)]
+        if isinstance(observable, (ObservableList, ObservableDict)):
+            self._subscriptions.append(observable.attach_on_change(self._collection_changed))
+
+    def __repr__(self) -> str:
+        return f"<history: undo_count={self.undo_count}; redo_count={self.redo_count}; of {self.observable!r}>"
+
+    @property
+    def capacity(self) -> int: return self._undo_entries.maxlen
+
+    @property
+    def undo_count(self) -> int: return len(self._undo_entries)
+
+    @property
+    def redo_count(self) -> int: return len(self._redo_entries)
+
+    @property
+    def can_undo(self) -> bool: return len(self._undo_entries) > 0
+
+    @property
+    def can_redo(self) -> bool: return len(self._redo_entries) > 0
+
+    def undo(self) -> bool:
+        """
+        Reverts the last recorded entry. Changes made in the running ``batch()`` scope
+        are recorded as an entry first, so they're reverted
+
+        :return: ``False`` if there's nothing to undo
+        """
+
+        self._commit()
+        if not self._undo_entries:
+            return False
+
+        entry: _Entry = self._undo_entries.pop()
+        self._restore(entry, reverse=True)
+        self._redo_entries.append(entry)
+        self.raise_update_event()
+        return True
+
+    def redo(self) -> bool:
+        """
+        Applies the last reverted entry again
+
+        :return: ``False`` if there's nothing to redo
+        """
+
+        # changes made in the running ``batch()`` scope discard reverted entries
+        if self._commit():
+            self.raise_update_event()
+
+        if not self._redo_entries:
+            return False
+
+        entry: _Entry = self._redo_entries.pop()
+        self._restore(entry, reverse=False)
+        self._undo_entries.append(entry)
+        self.raise_update_event()
+        return True
+
+    def clear(self) -> None:
+        """ Discards all recorded entries """
+
+        self._undo_entries.clear()
+        self._redo_entries.clear()
+        self.raise_update_event()
+
+    def dispose(self) -> None:
+        """ Stops recording, recorded entries are kept """
+
+        for subscription in self._subscriptions:
+            subscription.dispose()
+
+        self._subscriptions.clear()
+
+    def _collection_changed(self, change: Any) -> None:
+        if self._is_restoring:
+            return
+
+        # records of the replaced value are covered by the recorded replacement
+        self._record_replacement()
+        if not self.observable._is_replacing:
+            self._pending.append(("change", change, None))
+
+    def _observable_updated(self, placeholder: Any) -> None:
+        if self._is_restoring:
+            return
+
+        if self._commit():
+            self.raise_update_event()
+
+    def _commit(self) -> bool:
+        # records pending operations as an entry
+        self._record_replacement()
+        if not self._pending:
+            return False
+
+        self._undo_entries.append(tuple(self._pending))
+        self._pending.clear()
+        self._redo_entries.clear()
+        return True
+
+    def _record_replacement(self) -> None:
+        current_value: Any = self.observable._value
+        if current_value is not self._last_value:
+            self._pending.append(("value", self._last_value, current_value))
+            self._last_value = current_value
+
+    def _restore(self, entry: _Entry, reverse: bool) -> None:
+        self._is_restoring = True
+        try:
+            # a single update event of the observable, even for a group of operations
+            with batch():
+                for kind, first, second in (reversed(entry) if reverse else entry):
+                    if kind == "value":
+                        self.observable.set(first if reverse else second, force=True)
+                    else:
+                        self.observable._apply_change(first, reverse)
+        finally:
+            self._is_restoring = False
+            self._last_value = self.observable._value
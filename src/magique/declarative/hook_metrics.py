@@ -1,5 +1,8 @@
 from .notify_updated import NotifyUpdated
 from .observable import Observable
+from .subscription import Subscription
+from .propagation import schedule, height_above, attach_node
+from .equality import Equality, value_equals
 from typing import Callable, TypeVar, List, Any
 from queue import Queue
 
@@ -24,6 +27,9 @@ class HookMetrics(Observable[T]):
     If you want save the in-coded function, in __init__,
     you can set ``metrics_iteration_function`` value = None, calling
     ``super().__init__(initial_value, initial_value=None, *triggers)``
+
+    Recalculation is scheduled to the end of the propagation wave, so when
+    several triggers are updated by the same source, the function is invoked once
     """
 
     def __init__(
@@ -31,12 +37,15 @@ class HookMetrics(Observable[T]):
             metrics_iteration_function: Callable[[], T] = _sentinel,
             initial_value: T | None = None,
             start_immediately: bool = False,
-            *triggers: NotifyUpdated):
+            *triggers: NotifyUpdated,
+            equals: Equality = value_equals):
 
-        super().__init__(initial_value)
+        super().__init__(initial_value, equals)
         self.updates_queue: Queue[T] = Queue()
         self.listening: bool = False
         self.triggers: List[NotifyUpdated] = list(triggers)
+        self._subscriptions: List[Subscription] = []
+        self.propagation_height: int = height_above(self.triggers)
 
         if metrics_iteration_function is not _sentinel:
             self.metrics_iteration: Callable[[], T] = metrics_iteration_function
@@ -54,8 +63,8 @@ class HookMetrics(Observable[T]):
             return
 
         self.listening = True
-        for trigger in self.triggers:
-            trigger += self.notify_updated_handler
+        self.propagation_height = height_above(self.triggers)
+        self._subscriptions = [attach_node(trigger, self.notify_updated_handler) for trigger in self.triggers]
 
     def stop_metrics_hooks(self) -> None:
         """
@@ -67,10 +76,15 @@ class HookMetrics(Observable[T]):
             return
 
         self.listening = False
-        for trigger in self.triggers:
-            trigger -= self.notify_updated_handler
+        for subscription in self._subscriptions:
+            subscription.dispose()
+
+        self._subscriptions.clear()
 
     def notify_updated_handler(self, placeholder: Any) -> None:
+        schedule(self, self.propagation_height, self._update_metrics_value)
+
+    def _update_metrics_value(self) -> None:
         self.value = self.metrics_iteration()
 
     def metrics_iteration(self) -> T:
@@ -90,7 +104,8 @@ def hook_obs(
         *triggers: NotifyUpdated,
         metrics_function: Callable[[], T] | None = None,
         initial_value: T | None = None,
-        start_immediately: bool = False) -> HookMetrics:
+        start_immediately: bool = False,
+        equals: Equality = value_equals) -> HookMetrics:
     """
     Creates an instance of HookMetrics class
     :param metrics_function: calculator of new metrics value
@@ -99,15 +114,17 @@ def hook_obs(
     is a trigger to invoke ``metrics_iteration_function()``
     :param start_immediately: if equals ``True`` the ``start_hook_metrics()``
     invokes immediately
+    :param equals: the strategy comparing old and new metrics values
     """
 
-    return HookMetrics(metrics_function, initial_value, start_immediately, *triggers)
+    return HookMetrics(metrics_function, initial_value, start_immediately, *triggers, equals=equals)
 
 
 def hook_metrics(
         *triggers: NotifyUpdated,
         initial_value: T | None = None,
-        start_immediately: bool = False):
+        start_immediately: bool = False,
+        equals: Equality = value_equals):
     """
     A decorator creating an instance of HookMetrics class
     :param initial_value: start value to be initialized
@@ -115,12 +132,13 @@ def hook_metrics(
     is trigger to invoke ``metrics_iteration_function()``
     :param start_immediately: if equals ``True`` the ``start_hook_metrics()``
     invokes immediately
+    :param equals: the strategy comparing old and new metrics values
 
     The returned ``HookMetrics`` allows direct call () via ``__call__()`` the
     magic method
     """
 
     def decorator(metrics_iteration_function: Callable[[], T]) -> HookMetrics:
-        return HookMetrics(metrics_iteration_function, initial_value, start_immediately, *triggers)
+        return HookMetrics(metrics_iteration_function, initial_value, start_immediately, *triggers, equals=equals)
 
     return decorator
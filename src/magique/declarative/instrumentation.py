@@ -0,0 +1,235 @@
+import time
+
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Callable, Dict, List, Tuple, Any
+from weakref import finalize, WeakKeyDictionary
+
+
+HISTOGRAM_BOUNDS: Tuple[float, ...] = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+"""
+Upper bounds (seconds) of handler latency histogram buckets,
+the last bucket counts calls longer than 1s
+"""
+
+SlowHandlerCallback = Callable[["HandlerStats", float], Any]
+
+
+enabled: bool = False
+"""
+Is the instrumentation enabled, checked by ``NotifyUpdated`` on every event
+"""
+
+_lock: Lock = Lock()
+_budget_seconds: float | None = None
+_on_slow_handler: SlowHandlerCallback | None = None
+_notifiers: Dict[int, "NotifierStats"] = {}
+# statistics of collected instances are merged per type, so the table doesn't grow
+_collected_notifiers: Dict[str, "NotifierStats"] = {}
+_handlers: Dict[Any, "HandlerStats"] = {}
+# kept while subscriptions are alive, ids of collected ones may be reused
+_subscription_costs: WeakKeyDictionary = WeakKeyDictionary()
+
+
+@dataclass
+class NotifierStats:
+    """
+    Update events statistics of the ``NotifyUpdated`` instance. Statistics of
+    collected instances are merged into a single entry per type,
+    ``instances_count`` is the count of merged instances
+    """
+
+    name: str
+    raise_count: int = 0
+    is_alive: bool = True
+    instances_count: int = 1
+
+
+@dataclass
+class HandlerStats:
+    """
+    Invocation statistics of the subscribed function, functions are identified
+    by their code, so bound methods of all instances of a class are merged
+    """
+
+    name: str
+    calls_count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    slow_calls_count: int = 0
+    histogram: List[int] = field(default_factory=lambda: [0] * (len(HISTOGRAM_BOUNDS) + 1))
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls_count if self.calls_count else 0.0
+
+
+@dataclass
+class Stats:
+    """
+    A snapshot of collected statistics, notifiers are sorted by raised events count,
+    handlers are sorted by total invocation time
+    """
+
+    notifiers: List[NotifierStats]
+    handlers: List[HandlerStats]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "notifiers": [vars(notifier) for notifier in self.notifiers],
+            "handlers": [dict(vars(handler), mean_seconds=handler.mean_seconds) for handler in self.handlers],
+            "histogram_bounds": list(HISTOGRAM_BOUNDS)
+        }
+
+
+def enable_instrumentation(
+        slow_handler_budget_seconds: float | None = None,
+        on_slow_handler: SlowHandlerCallback | None = None) -> None:
+    """
+    Starts collecting statistics of update events and subscribed functions.
+    While disabled, the only cost is a single flag check per event
+
+    :param slow_handler_budget_seconds: functions running longer are counted as slow
+    :param on_slow_handler: invoked with ``HandlerStats`` and the duration of every slow call
+    """
+
+    global enabled, _budget_seconds, _on_slow_handler
+    _budget_seconds = slow_handler_budget_seconds
+    _on_slow_handler = on_slow_handler
+    enabled = True
+
+
+def disable_instrumentation() -> None:
+    """ Stops collecting statistics, already collected statistics are kept """
+
+    global enabled
+    enabled = False
+
+
+def reset_stats() -> None:
+    """ Clears all collected statistics """
+
+    with _lock:
+        for notifier_stats in _notifiers.values():
+            notifier_stats.raise_count = 0
+
+        _collected_notifiers.clear()
+        _handlers.clear()
+        _subscription_costs.clear()
+
+
+def stats() -> Stats:
+    """
+    :return: a snapshot of collected statistics
+    """
+
+    with _lock:
+        notifiers: List[NotifierStats] = [
+            NotifierStats(**vars(notifier_stats))
+            for notifier_stats in (*_notifiers.values(), *_collected_notifiers.values())
+        ]
+
+        handlers: List[HandlerStats] = [
+            HandlerStats(**dict(vars(handler_stats), histogram=list(handler_stats.histogram)))
+            for handler_stats in _handlers.values()
+        ]
+
+    notifiers.sort(key=lambda notifier_stats: notifier_stats.raise_count, reverse=True)
+    handlers.sort(key=lambda handler_stats: handler_stats.total_seconds, reverse=True)
+    return Stats(notifiers, handlers)
+
+
+def _collect_notifier(key: int, type_name: str) -> None:
+    with _lock:
+        notifier_stats: NotifierStats | None = _notifiers.pop(key, None)
+        if notifier_stats is None or not notifier_stats.raise_count:
+            return
+
+        merged_stats: NotifierStats | None = _collected_notifiers.get(type_name)
+        if merged_stats is None:
+            _collected_notifiers[type_name] = NotifierStats(
+                f"{type_name} (collected)", notifier_stats.raise_count, False
+            )
+        else:
+            merged_stats.raise_count += notifier_stats.raise_count
+            merged_stats.instances_count += 1
+
+
+def record_raise(notifier: Any) -> None:
+    key: int = id(notifier)
+    with _lock:
+        notifier_stats: NotifierStats | None = _notifiers.get(key)
+        if notifier_stats is None:
+            type_name: str = type(notifier).__name__
+            notifier_stats = NotifierStats(f"{type_name}@{key:#x}")
+            _notifiers[key] = notifier_stats
+            finalize(notifier, _collect_notifier, key, type_name)
+
+        notifier_stats.raise_count += 1
+
+
+def _handler_key(handler: Any) -> Tuple[Any, str]:
+    function: Any = getattr(handler, "callback", handler)
+    function = getattr(function, "__func__", function)
+    code: Any = getattr(function, "__code__", None)
+    if code is None:
+        return type(function), type(function).__qualname__
+
+    return code, f"{function.__module__}.{function.__qualname__}:{code.co_firstlineno}"
+
+
+def subscription_cost(subscription: Any) -> Tuple[int, float]:
+    """
+    :return: count of calls and total seconds spent in the function of the subscription
+    """
+
+    with _lock:
+        calls_count, total_seconds = _subscription_costs.get(subscription, (0, 0.0))
+
+    return int(calls_count), total_seconds
+
+
+def timed_call(subscription: Any, handler: Callable[[Any], Any], argument: Any) -> None:
+    """
+    Invokes the subscribed function, recording its duration
+    """
+
+    start: float = time.perf_counter()
+    try:
+        handler(argument)
+    finally:
+        duration: float = time.perf_counter() - start
+        _record_call(subscription, handler, duration)
+
+
+def _record_call(subscription: Any, handler: Any, duration: float) -> None:
+    key, name = _handler_key(handler)
+    bucket: int = 0
+    while bucket < len(HISTOGRAM_BOUNDS) and duration > HISTOGRAM_BOUNDS[bucket]:
+        bucket += 1
+
+    is_slow: bool = _budget_seconds is not None and duration > _budget_seconds
+    with _lock:
+        handler_stats: HandlerStats | None = _handlers.get(key)
+        if handler_stats is None:
+            handler_stats = HandlerStats(name)
+            _handlers[key] = handler_stats
+
+        handler_stats.calls_count += 1
+        handler_stats.total_seconds += duration
+        handler_stats.histogram[bucket] += 1
+        if duration > handler_stats.max_seconds:
+            handler_stats.max_seconds = duration
+
+        if is_slow:
+            handler_stats.slow_calls_count += 1
+
+        cost: List[float] | None = _subscription_costs.get(subscription)
+        if cost is None:
+            _subscription_costs[subscription] = [1, duration]
+        else:
+            cost[0] += 1
+            cost[1] += duration
+
+    if is_slow and _on_slow_handler is not None:
+        _on_slow_handler(handler_stats, duration)
@@ -0,0 +1,300 @@
+from abc import abstractmethod
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, List, Tuple
+
+from .batch import batch
+from .notify_updated import NotifyUpdated
+from .observable_list import ObservableList, ListChange
+from .nested_views import NestedChange
+from .propagation import height_of, raise_height
+from .subscription import Subscription
+
+
+class LiveView(ObservableList):
+    """
+    The base class of lists derived from the ``source`` list and maintained incrementally:
+    the view consumes ``ListChange`` records of the source, so every source change costs
+    work proportional to the changed items, not to the whole list. The replaced source
+    ``value`` rebuilds the view
+
+    If ``watch`` is set, items being ``NotifyUpdated`` instances are re-evaluated
+    when they raise their update events, e.g. ``notify_property_dataclass`` items
+    when any of their fields changes. Nested lists and dicts mutated
+    through the source are re-evaluated always
+
+    Views are derived values, they're not supposed to be mutated directly. Every source
+    change raises a single update event of the view, views can be chained
+    """
+
+    def __init__(self, source: ObservableList, watch: bool = False):
+        super().__init__([])
+        self.source: ObservableList = source
+        self.propagation_height: int = height_of(source) + 1
+        raise_height(self, self.propagation_height)
+
+        self._is_watching: bool = watch
+        self._watched: Dict[int, List] = {}
+        # id of the watched item -> its positions in the source, rebuilt lazily after changes
+        self._positions: Dict[int, List[int]] | None = None
+        self._source_list: List = source._value
+        self._subscriptions: List[Subscription] = [
+            source.attach_on_change(self._source_changed),
+            source.attach_on_update(self._source_updated),
+        ]
+
+        self._watch(self._source_list)
+        self._reset(self._source_list)
+
+    def dispose(self) -> None:
+        """ Stops maintaining the view, unsubscribing it from the source and its items """
+
+        for subscription in self._subscriptions:
+            subscription.dispose()
+
+        self._subscriptions.clear()
+        for subscription, count in self._watched.values():
+            subscription.dispose()
+
+        self._watched.clear()
+        self._positions = None
+
+    def _source_changed(self, change: ListChange | NestedChange) -> None:
+        with batch():
+            if change.__class__ is NestedChange:
+                position: int = change.path[0]
+                self._reevaluate(position, self._source_list[position])
+                return
+
+            if change.kind == "move":
+                self._positions = None
+                self._removed(change.index, change.old_items)
+                self._inserted(change.new_index, change.new_items)
+                return
+
+            if change.old_items:
+                self._unwatch(change.old_items)
+                self._removed(change.index, change.old_items)
+
+            if change.new_items:
+                self._watch(change.new_items)
+
+            self._update_positions(change)
+            if change.new_items:
+                self._inserted(change.index, change.new_items)
+
+    def _source_updated(self, placeholder: Any) -> None:
+        # the whole source value is replaced, no change records are reported then
+        if self.source._value is self._source_list:
+            return
+
+        self._unwatch(self._source_list)
+        self._positions = None
+        self._source_list = self.source._value
+        self._watch(self._source_list)
+        with batch():
+            self._reset(self._source_list)
+
+    def _item_updated(self, item: Any) -> None:
+        if self._positions is None:
+            self._positions = {}
+            for position, source_item in enumerate(self._source_list):
+                if id(source_item) in self._watched:
+                    self._positions.setdefault(id(source_item), []).append(position)
+
+        with batch():
+            for position in self._positions.get(id(item), ()):
+                self._reevaluate(position, item)
+
+    def _update_positions(self, change: ListChange) -> None:
+        if self._positions is None:
+            return
+
+        # changes at the end of the source don't shift other positions, any other change
+        # drops the index, so it's rebuilt once by the next item event, not on every change
+        if change.index != len(self._source_list) - len(change.new_items):
+            self._positions = None
+            return
+
+        for item in change.old_items:
+            positions: List[int] | None = self._positions.get(id(item))
+            if positions is not None:
+                positions.pop()
+                if not positions:
+                    del self._positions[id(item)]
+
+        for position, item in enumerate(change.new_items, change.index):
+            if id(item) in self._watched:
+                self._positions.setdefault(id(item), []).append(position)
+
+    def _watch(self, items: List) -> None:
+        if not self._is_watching:
+            return
+
+        for item in items:
+            if not isinstance(item, NotifyUpdated):
+                continue
+
+            entry: List | None = self._watched.get(id(item))
+            if entry is None:
+                self._watched[id(item)] = [self._subscribe_item(item), 1]
+            else:
+                entry[1] += 1
+
+    def _unwatch(self, items: List) -> None:
+        if not self._is_watching:
+            return
+
+        for item in items:
+            entry: List | None = self._watched.get(id(item))
+            if entry is None:
+                continue
+
+            entry[1] -= 1
+            if entry[1] == 0:
+                entry[0].dispose()
+                del self._watched[id(item)]
+
+    def _subscribe_item(self, item: NotifyUpdated) -> Subscription:
+        return item.attach_on_update(lambda placeholder: self._item_updated(item))
+
+    @abstractmethod
+    def _reset(self, items: List) -> None: pass
+
+    @abstractmethod
+    def _inserted(self, index: int, items: List) -> None: pass
+
+    @abstractmethod
+    def _removed(self, index: int, items: List) -> None: pass
+
+    @abstractmethod
+    def _reevaluate(self, position: int, item: Any) -> None: pass
+
+
+class FilteredView(LiveView):
+    """
+    The live view of ``source`` items satisfying the ``predicate``, in order of the source.
+    See ``ObservableList.where()``
+    """
+
+    def __init__(self, source: ObservableList, predicate: Callable[[Any], bool], watch: bool = False):
+        self.predicate: Callable[[Any], bool] = predicate
+        self._mask: bytearray = bytearray()
+        super().__init__(source, watch)
+
+    def _reset(self, items: List) -> None:
+        self._mask = bytearray(bool(self.predicate(item)) for item in items)
+        self[:] = [item for item, is_selected in zip(items, self._mask) if is_selected]
+
+    def _inserted(self, index: int, items: List) -> None:
+        flags: bytearray = bytearray(bool(self.predicate(item)) for item in items)
+        view_index: int = self._mask.count(1, 0, index)
+        self._mask[index:index] = flags
+
+        selected: List = [item for item, is_selected in zip(items, flags) if is_selected]
+        if selected:
+            self[view_index:view_index] = selected
+
+    def _removed(self, index: int, items: List) -> None:
+        end: int = index + len(items)
+        view_index: int = self._mask.count(1, 0, index)
+        selected_count: int = self._mask.count(1, index, end)
+        del self._mask[index:end]
+
+        if selected_count:
+            del self[view_index:view_index + selected_count]
+
+    def _reevaluate(self, position: int, item: Any) -> None:
+        is_selected: bool = bool(self.predicate(item))
+        if is_selected == self._mask[position]:
+            return
+
+        view_index: int = self._mask.count(1, 0, position)
+        self._mask[position] = is_selected
+        if is_selected:
+            self.insert(view_index, item)
+        else:
+            del self[view_index]
+
+
+class MappedView(LiveView):
+    """
+    The live view of ``function`` results for every ``source`` item, in order of the source.
+    See ``ObservableList.select()``
+    """
+
+    def __init__(self, source: ObservableList, function: Callable[[Any], Any], watch: bool = False):
+        self.function: Callable[[Any], Any] = function
+        super().__init__(source, watch)
+
+    def _reset(self, items: List) -> None:
+        self[:] = [self.function(item) for item in items]
+
+    def _inserted(self, index: int, items: List) -> None:
+        self[index:index] = [self.function(item) for item in items]
+
+    def _removed(self, index: int, items: List) -> None:
+        del self[index:index + len(items)]
+
+    def _reevaluate(self, position: int, item: Any) -> None:
+        self[position] = self.function(item)
+
+
+class SortedView(LiveView):
+    """
+    The live view of ``source`` items sorted by the ``key`` function, items with equal
+    keys are kept in order of arrival. Positions are found by binary search over
+    the list of keys, so keys have to be comparable. See ``ObservableList.sorted_by()``
+    """
+
+    def __init__(self, source: ObservableList, key: Callable[[Any], Any], watch: bool = False):
+        self.key: Callable[[Any], Any] = key
+        self._keys: List = []
+        self._source_keys: List = []
+        super().__init__(source, watch)
+
+    def _reset(self, items: List) -> None:
+        self._source_keys = [self.key(item) for item in items]
+        pairs: List[Tuple[Any, Any]] = sorted(zip(self._source_keys, items), key=lambda pair: pair[0])
+        self._keys = [key for key, item in pairs]
+        self[:] = [item for key, item in pairs]
+
+    def _inserted(self, index: int, items: List) -> None:
+        keys: List = [self.key(item) for item in items]
+        self._source_keys[index:index] = keys
+        for key, item in zip(keys, items):
+            self._insert_sorted(key, item)
+
+    def _removed(self, index: int, items: List) -> None:
+        end: int = index + len(items)
+        for key, item in zip(self._source_keys[index:end], items):
+            self._remove_sorted(key, item)
+
+        del self._source_keys[index:end]
+
+    def _reevaluate(self, position: int, item: Any) -> None:
+        old_key: Any = self._source_keys[position]
+        new_key: Any = self.key(item)
+        if new_key == old_key:
+            return
+
+        self._source_keys[position] = new_key
+        self._remove_sorted(old_key, item)
+        self._insert_sorted(new_key, item)
+
+    def _insert_sorted(self, key: Any, item: Any) -> None:
+        position: int = bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self.insert(position, item)
+
+    def _remove_sorted(self, key: Any, item: Any) -> None:
+        start: int = bisect_left(self._keys, key)
+        end: int = bisect_right(self._keys, key, start)
+        for position in range(start, end):
+            if self._value[position] is item:
+                break
+        else:
+            # equal, but not the same object, e.g. ints
+            position = start + [value == item for value in self._value[start:end]].index(True)
+
+        del self._keys[position]
+        del self[position]
@@ -1,6 +1,7 @@
 import time
 
 from .observable import Observable
+from .equality import Equality, value_equals
 from typing import Callable, TypeVar, Tuple, Any
 from threading import Thread, Lock
 from queue import Queue
@@ -40,9 +41,10 @@ class LoopMetrics(Observable[T]):
             metrics_iteration_function: Callable[[], T] = _sentinel,
             initial_value: T | None = None,
             loop_delay_seconds: float = 0.5,
-            start_immediately: bool = False):
+            start_immediately: bool = False,
+            equals: Equality = value_equals):
 
-        super().__init__(initial_value)
+        super().__init__(initial_value, equals)
         self.updates_queue: Queue[T] = Queue()
         self.listening: bool = False
         self.loop_delay_seconds: float = loop_delay_seconds
@@ -131,7 +133,8 @@ class LoopMetrics(Observable[T]):
 
         while True:
             value = self.updates_queue.get()
-            if value == self.terminate_queue_value:
+            # element-wise comparable values (like arrays) can't be compared via ==
+            if value_equals(value, self.terminate_queue_value):
                 self.updates_queue.task_done()
                 break
 
@@ -155,7 +158,8 @@ def loop_obs(
         metrics_iteration_function: Callable[[], T] | None = None,
         initial_value: T | None = None,
         loop_delay_seconds: float = 0.5,
-        start_immediately: bool = False) -> LoopMetrics:
+        start_immediately: bool = False,
+        equals: Equality = value_equals) -> LoopMetrics:
     """
     Creates an instance of LoopMetrics class
     :param metrics_iteration_function: calculator of new metrics value
@@ -164,20 +168,23 @@ def loop_obs(
     the ``metrics_iteration_function``. By default, equals 0.5s
     :param start_immediately: if equals ``True`` the ``start_hook_metrics()``
     invokes immediately
+    :param equals: the strategy comparing old and new metrics values
     """
 
     return LoopMetrics(
         metrics_iteration_function,
         initial_value,
         loop_delay_seconds,
-        start_immediately
+        start_immediately,
+        equals
     )
 
 
 def loop_metrics(
         initial_value: T | None = None,
         loop_delay_seconds: float = 0.5,
-        start_immediately: bool = False):
+        start_immediately: bool = False,
+        equals: Equality = value_equals):
     """
     A decorator creating an instance of LoopMetrics class based on decorated function
     as a ``metrics_iteration_function``
@@ -186,6 +193,7 @@ def loop_metrics(
     the ``metrics_iteration_function``. By default, equals 0.5s
     :param start_immediately: if equals ``True`` the ``start_hook_metrics()``
     invokes immediately
+    :param equals: the strategy comparing old and new metrics values
 
     The returned ``LoopMetrics`` allows direct call () via ``__call__()`` the
     magic method
@@ -196,7 +204,8 @@ def loop_metrics(
             metrics_iteration_function,
             initial_value,
             loop_delay_seconds,
-            start_immediately
+            start_immediately,
+            equals
         )
 
     return decorator
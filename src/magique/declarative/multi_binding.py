@@ -0,0 +1,64 @@
+from typing import Callable, Iterable, List, Any
+
+from .notify_updated import NotifyUpdated
+from .subscription import Subscription
+from .propagation import schedule, height_above, raise_height, attach_node
+
+
+class MultiBinding(NotifyUpdated):
+    """
+    The object binding several ``source`` instances to a single ``destination``,
+    the destination value is calculated by the ``aggregator`` function from
+    values of all sources, in order of sources
+
+    The calculation is scheduled to the end of the propagation wave, so when
+    several sources are updated together (e.g. in a ``batch()`` scope),
+    the aggregator is invoked once
+     - ``apply_immediately`` - calculate the destination value after init
+     - ``weak`` - subscribe by weak references, the binding stops working when collected
+    """
+
+    def __init__(
+            self,
+            sources: Iterable[NotifyUpdated],
+            destination: NotifyUpdated,
+            aggregator: Callable[..., Any],
+            apply_immediately: bool = False,
+            weak: bool = False):
+
+        super().__init__()
+        self.sources: List[NotifyUpdated] = list(sources)
+        self.destination: NotifyUpdated = destination
+        self.aggregator: Callable[..., Any] = aggregator
+        self.propagation_height: int = height_above(self.sources)
+        raise_height(destination, self.propagation_height + 1)
+
+        self._subscriptions: List[Subscription] = [
+            attach_node(source, self._source_updated, weak) for source in self.sources
+        ]
+
+        if apply_immediately:
+            self.apply()
+
+    def __repr__(self) -> str:
+        return f"<multi binding: sources_len={len(self.sources)}; to {self.destination.__repr__()}>"
+
+    def apply(self) -> None:
+        """
+        Calculates the destination value from current values of sources
+        """
+
+        self.destination.value = self.aggregator(*(source.value for source in self.sources))
+
+    def dispose(self) -> None:
+        """
+        Stops the binding, unsubscribing it from sources updates
+        """
+
+        for subscription in self._subscriptions:
+            subscription.dispose()
+
+        self._subscriptions.clear()
+
+    def _source_updated(self, placeholder: Any) -> None:
+        schedule(self, self.propagation_height, self.apply)
@@ -0,0 +1,164 @@
+from dataclasses import dataclass
+from typing import Any, Tuple
+from weakref import WeakValueDictionary
+
+from .batch import defer_update_event
+
+
+@dataclass(frozen=True, slots=True)
+class NestedChange:
+    """
+    The record of a nested collection mutation, delivered to change subscribers of its parents
+     - ``path`` - keys (indexes) to the changed collection from the notified one
+     - ``change`` - ``ListChange`` or ``DictChange`` record of the changed collection
+    """
+
+    path: Tuple
+    change: Any
+
+    def reversed(self) -> "NestedChange":
+        """ :return: the change reverting this one """
+
+        return NestedChange(self.path, self.change.reversed())
+
+
+class NestedViews:
+    """
+    The mixin of ``ObservableList`` and ``ObservableDict`` wrapping nested lists and dicts
+    into child views. A view is created on the first access and cached weakly by the
+    identity of the wrapped value, so the same view is returned while it's alive
+
+    A view shares the nested value with its parent, its mutations raise update events
+    of the view and of all its parents, and change records of the view are delivered
+    to change subscribers of parents as ``NestedChange`` records. The view is detached,
+    when its value isn't contained by the parent anymore
+    """
+
+    __slots__ = ()
+
+    _views: WeakValueDictionary | None = None
+    _parent: Any = None
+    _parent_key: Any = None
+    _parents_deferred: bool = False
+    # change records of the whole value replacement are being delivered, see ``History``
+    _is_replacing: bool = False
+
+    @property
+    def parent(self) -> Any:
+        """ The collection containing the view, ``None`` for root or detached collections """
+
+        if self._parent is None or self._locate() is None:
+            return None
+
+        return self._parent
+
+    @property
+    def path(self) -> Tuple | None:
+        """
+        Keys (indexes) to the view value from the root collection,
+        empty for the root, ``None`` if the view is detached
+        """
+
+        keys: list = []
+        view: Any = self
+        while view._parent is not None:
+            key: Any = view._locate()
+            if key is None:
+                return None
+
+            keys.append(key)
+            view = view._parent
+
+        return tuple(reversed(keys))
+
+    def raise_update_event(self) -> None:
+        if defer_update_event(self):
+            # parents are deferred too, and raise their own events once at the batch exit
+            if self._parent is not None and self._locate() is not None:
+                self._parents_deferred = True
+                self._parent.raise_update_event()
+
+            return
+
+        self._invoke_observers(self._value)
+        if self._parents_deferred:
+            self._parents_deferred = False
+        elif self._parent is not None and self._locate() is not None:
+            self._parent.raise_update_event()
+
+    def _is_change_observed(self) -> bool:
+        # records are built only if somebody listens to them, here or in parents
+        view: Any = self
+        while view is not None:
+            if view._has_change_observers():
+                return True
+
+            view = view._parent
+
+        return False
+
+    def _forward_change(self, change: Any) -> None:
+        if self._parent is None:
+            return
+
+        key: Any = self._locate()
+        if key is None:
+            return
+
+        if change.__class__ is NestedChange:
+            self._parent._notify_change(NestedChange((key,) + change.path, change.change))
+        else:
+            self._parent._notify_change(NestedChange((key,), change))
+
+    def _apply_nested(self, change: NestedChange, reverse: bool) -> None:
+        view: Any = self
+        for key in change.path:
+            view = view._child(key, view._value[key])
+
+        view._apply_change(change.change, reverse)
+
+    def _child(self, key: Any, value: Any) -> Any:
+        value_type: type = value.__class__
+        if value_type is not list and value_type is not dict:
+            return value
+
+        if self._views is None:
+            self._views = WeakValueDictionary()
+
+        view: Any = self._views.get(id(value))
+        if view is None or view._value is not value:
+            view = _make_view(value)
+            self._views[id(value)] = view
+
+        view._parent = self
+        view._parent_key = key
+        return view
+
+    def _locate(self) -> Any:
+        # the key is checked in O(1), the value is searched only if it's moved
+        parent_value: Any = self._parent._value
+        try:
+            if parent_value[self._parent_key] is self._value:
+                return self._parent_key
+        except (IndexError, KeyError, TypeError):
+            pass
+
+        items = parent_value.items() if isinstance(parent_value, dict) else enumerate(parent_value)
+        for key, item in items:
+            if item is self._value:
+                self._parent_key = key
+                return key
+
+        return None
+
+
+def _make_view(value: Any) -> Any:
+    from .observable_list import ObservableList
+    from .observable_dict import ObservableDict
+
+    if value.__class__ is list:
+        return ObservableList(value)
+
+    view: ObservableDict = ObservableDict()
+    view._value = view._target_dict = value
+    return view
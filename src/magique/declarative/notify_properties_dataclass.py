@@ -1,67 +1,170 @@
-from typing import Tuple, Dict, Type, Any
-from .notify_updated import NotifyUpdated, notify_property_updated
+from typing import Callable, Tuple, List, Dict, Any
+from .notify_updated import NotifyUpdated
+from .equality import value_equals
+from .batch import BatchScope
+from . import dependency_tracking
 
 
 _sentinel: Any = object()
 
+_property_template: str = """
+def get_{name}(self):
+    if dependency_tracking.active_frames:
+        dependency_tracking.track_property_read(self, "{name}")
+
+    return self._{name}
+
+def set_{name}(self, new_value):
+    property_observers = self._property_observers
+    if property_observers is None or "{name}" not in property_observers:
+        # without the property channel only the instance subscribers are notified, as by update()
+        old_value = self._{name}
+        self._{name} = new_value
+        if self._observers and not value_equals(old_value, new_value):
+            self.raise_update_event()
+
+        return
+
+    old_value = self._{name}
+    self._{name} = new_value
+    self.raise_property_update_if_values_diff("{name}", old_value, new_value)
+
+{name} = property(get_{name}, set_{name})
+"""
+
+
+def _generate_source(class_name: str, fields: Tuple[str, ...], defaults: Dict[str, Any], eq: bool) -> str:
+    init_parameters: List[str] = ["self"]
+    for name in fields:
+        init_parameters.append(f"{name}=__default_{name}" if name in defaults else f"{name}=None")
+
+    lines: List[str] = [
+        f"def __init__({', '.join(init_parameters)}):",
+        "    NotifyUpdated.__init__(self)",
+        *(f"    self._{name} = {name}" for name in fields),
+        "",
+        "def __repr__(self):",
+        f"    return f\"<{class_name} as notify_property_dataclass: "
+        + "; ".join(f"{name}={{self._{name}!r}}" for name in fields) + ">\"",
+        "",
+        "def update(self, **fields):",
+        "    unknown = fields.keys() - __fields_set",
+        "    if unknown:",
+        f"        raise TypeError(f\"{class_name} has no fields: {{', '.join(sorted(unknown))}}\")",
+        "",
+        "    changed = [name for name, value in fields.items() if not value_equals(getattr(self, '_' + name), value)]",
+        "    if not changed:",
+        "        return changed",
+        "",
+        "    # events are deferred, property notifiers are raised before the instance, once",
+        "    property_observers = self._property_observers or {}",
+        "    with BatchScope():",
+        "        for name in changed:",
+        "            setattr(self, '_' + name, fields[name])",
+        "            channel = property_observers.get(name)",
+        "            if channel is not None:",
+        "                channel.raise_update(fields[name])",
+        "",
+        "        self.raise_update_event()",
+        "",
+        "    return changed",
+    ]
+
+    if eq:
+        compared: str = ", ".join(f"self._{name}" for name in fields)
+        other_compared: str = ", ".join(f"other._{name}" for name in fields)
+        lines += [
+            "",
+            "def __eq__(self, other):",
+            "    if other.__class__ is not self.__class__:",
+            "        return NotImplemented",
+            "",
+            f"    return ({compared},) == ({other_compared},)",
+        ]
+
+    source: str = "\n".join(lines) + "\n"
+    for name in fields:
+        source += _property_template.format(name=name)
+
+    return source
+
+
+def _process_class(cls: type, slots: bool, eq: bool) -> type:
+    fields: Tuple[str, ...] = tuple(cls.__dict__.get("__annotations__", {}))
+    for name in fields:
+        if not name.isidentifier():
+            raise ValueError(f"invalid field name: {name!r}")
+
+    # class attributes of fields are default values of ``__init__`` parameters
+    defaults: Dict[str, Any] = {name: cls.__dict__[name] for name in fields if name in cls.__dict__}
+    for name, value in defaults.items():
+        # defaults are shared by all instances, as dataclasses do, unhashable ones are rejected
+        if value.__class__.__hash__ is None:
+            raise ValueError(f"mutable default {value.__class__} for field {name} is not allowed")
+
+    namespace: Dict[str, Any] = {
+        name: value for name, value in cls.__dict__.items()
+        if name not in ("__dict__", "__weakref__") and name not in defaults
+    }
+
+    if slots:
+        namespace["__slots__"] = tuple(f"_{name}" for name in fields)
+
+    generated: Dict[str, Any] = {
+        "NotifyUpdated": NotifyUpdated,
+        "BatchScope": BatchScope,
+        "value_equals": value_equals,
+        "dependency_tracking": dependency_tracking,
+        "__fields_set": frozenset(fields),
+        **{f"__default_{name}": value for name, value in defaults.items()}
+    }
+
+    # all methods are compiled once per class, instances don't create functions or properties
+    exec(_generate_source(cls.__name__, fields, defaults, eq), generated)
+
+    methods: List[str] = ["__init__", "__repr__", "update", *fields]
+    if eq:
+        methods.append("__eq__")
+
+    for name in methods:
+        function: Any = generated[name]
+        if callable(function):
+            function.__qualname__ = f"{cls.__qualname__}.{name}"
+
+        namespace[name] = function
+
+    namespace["__str__"] = namespace["__repr__"]
+    namespace["__notify_fields__"] = fields
+    if eq:
+        # mutable instances aren't hashable when compared by values, as dataclasses do
+        namespace["__hash__"] = None
+
+    return type(cls.__name__, (NotifyUpdated,), namespace)
+
+
+def notify_property_dataclass(cls: type | None = None, slots: bool = True, eq: bool = False) -> type | Callable:
+    """
+    Recreates the class as inherited from ``NotifyUpdated``
 
-def add_property(cls, self, attribute: str, source: Tuple | Dict = _sentinel):
-    private_attribute: str = f"_{attribute}"
-
-    def get_attribute(self):
-        return getattr(self, private_attribute)
-
-    @notify_property_updated(get_attribute, attribute)
-    def set_attribute(self, new_value):
-        setattr(self, private_attribute, new_value)
-
-    init_value = getattr(cls, attribute) if source is None else None
-    setattr(cls, attribute, property(get_attribute, set_attribute))
-
-    if isinstance(source, Dict):
-        kwargs: Dict = source
-        setattr(self, private_attribute, kwargs[attribute])
-    elif isinstance(source, Tuple):
-        args: Tuple = source
-        setattr(self, private_attribute, args[0])
-    else:
-        setattr(self, private_attribute, init_value)
-
+    Adds properties on the fields defined in that class. Every property setter
+    raises ``raise_property_update_if_values_diff()`` by field name, as
+    ``@notify_property_updated()`` does, and the update event of the instance
+    if the value is changed. Class attributes of fields are default values,
+    mutable (unhashable) defaults like ``list`` are rejected, as ``dataclasses`` do
 
-def notify_property_dataclass(cls):
-    """
-    Recreates the class as inherited from ``NotifyUpdated`` if that class
-    is not used as a parent class
+    Like ``dataclasses``, ``__init__``, properties, ``__repr__``, ``__eq__`` and ``update()``
+    are generated once when the class is decorated. ``update(**fields)`` assigns
+    several fields, and raises the update event of the instance once
 
-    Adds dunder properties on the fields defined in that class. Every
-    property setter, uses ``@notify_property_updated()`` by field name
+    Supports both ``@notify_property_dataclass`` and ``@notify_property_dataclass(eq=True)``
 
     :param cls: target class to be decorated
+    :param slots: store fields in ``__slots__``, instances don't have ``__dict__`` then
+    :param eq: generate ``__eq__`` comparing fields, instances aren't hashable then.
+    By default instances are compared and hashed by identity, as other ``NotifyUpdated`` objects
     """
 
-    cls_annotations: Dict[str, Type] = cls.__annotations__
-    if cls.__mro__[1] != NotifyUpdated:
-        cls = type(cls.__name__, (NotifyUpdated,), dict(cls.__dict__))
-
-    def __init__(self, *args, **kwargs):
-        NotifyUpdated.__init__(self)
-
-        for attribute in cls_annotations.keys():
-            if len(args) > 0:
-                add_property(cls, self, attribute, args)
-                args = args[1:]
-
-            elif attribute in kwargs:
-                add_property(cls, self, attribute, kwargs)
-
-            else:
-                add_property(cls, self, attribute)
-
-    def item_repr(self) -> str:
-        properties_str = (f"{attr}={getattr(self, attr).__repr__()}" for attr in cls_annotations.keys())
-        return f"<{cls.__name__} as {notify_property_dataclass.__name__}: {'; '.join(properties_str)}>"
+    if cls is None:
+        return lambda decorated_cls: _process_class(decorated_cls, slots, eq)
 
-    cls.__init__ = __init__
-    cls.__repr__ = item_repr
-    cls.__str__ = item_repr
-    return cls
+    return _process_class(cls, slots, eq)
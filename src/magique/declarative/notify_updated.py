@@ -1,7 +1,12 @@
+from inspect import iscoroutinefunction
 from typing import Callable, List, Any, Self, Dict
-
-
-Handler = Callable[[Any], Any]
+from .batch import defer_update_event
+from .subscription import Subscription, Handler, ObserverTable, mutable_observers
+from .propagation import begin_wave, end_wave
+from .async_observing import AsyncObserver, AsyncUpdates, next_update
+from .dispatchers import Dispatcher
+from . import dispatchers, instrumentation
+from .equality import Equality, value_equals
 
 
 class NotifyUpdated:
@@ -16,20 +21,79 @@ class NotifyUpdated:
     and have the same notify and update tools, functions and compatible
     """
 
-    def __init__(self):
-        self._observers: List[Handler] = []
-        self._property_observers: Dict[str, Self] = {}
-        self._property_receivers: Dict[str, Self] = {}
-        self._property_two_way_listeners: Dict[str, Self] = {}
+    __slots__ = (
+        "_observers",
+        "_property_observers",
+        "_value",
+        "_dispatcher",
+        "__weakref__",
+    )
 
-        if not hasattr(self, "value"):
-            self._value: Any = None
-            self.value: Any = None
+    # tokens returned by ``attach_on_update()``
+    _subscription_type: type = Subscription
 
-        self.is_sending: bool = False
+    def __init__(self):
+        # observer list and property table are allocated on the first use,
+        # most of instances are never subscribed by property
+        self._observers: ObserverTable | None = None
+        self._property_observers: Dict[str, PropertyChannel] | None = None
+
+        self._value: Any = None
+        self._dispatcher: Dispatcher | None = None
 
     def __repr__(self) -> str:
-        return f"<NotifyUpdated: observers_len={len(self._observers)}, value={self.value}>"
+        return f"<NotifyUpdated: observers_len={self.observers_count}, value={self.value}>"
+
+    @property
+    def value(self) -> Any: return self._value
+
+    @value.setter
+    def value(self, new_value: Any): self._value = new_value
+
+    @property
+    def dispatcher(self) -> Dispatcher | None:
+        """
+        The dispatcher invoking subscribed functions of the instance,
+        ``None`` - the default dispatcher is used, see ``set_default_dispatcher()``
+        """
+
+        return self._dispatcher
+
+    @dispatcher.setter
+    def dispatcher(self, new_dispatcher: Dispatcher | None): self._dispatcher = new_dispatcher
+
+    @property
+    def observers_count(self) -> int:
+        """ Count of functions subscribed to the update event """
+
+        return 0 if self._observers is None else len(self._observers)
+
+    def _property_channel(self, property_name: str) -> "PropertyChannel":
+        if self._property_observers is None:
+            self._property_observers = {}
+
+        channel: PropertyChannel | None = self._property_observers.get(property_name)
+        if channel is None:
+            channel = PropertyChannel(self, property_name)
+            self._property_observers[property_name] = channel
+
+        return channel
+
+    def attach_on_property_update(self, property_name: str, callback: Handler, weak: bool = False) -> Subscription:
+        """
+        Subscribes specified function to updates of the property by its name,
+        the function receives the new property value
+
+        Unlike ``property_updated()``, it doesn't create a ``NotifyUpdated`` instance
+        per property, subscriptions are stored in the instance's property table
+
+        :param property_name: ``str`` name of specified property
+        :param callback: a function to be subscribed to the property update event
+        :param weak: hold the function by weak reference
+        :return: ``Subscription`` token, its ``dispose()`` unsubscribes the function in O(1)
+        """
+
+        return self._property_channel(property_name).attach_on_update(callback, weak)
 
     def property_updated(self, property_name: str) -> Self:
         """
@@ -38,13 +102,13 @@ class NotifyUpdated:
         :return: New ``NotifyUpdated`` instance calling ``raise_update_event()`` when only the property changed
         """
 
-        if property_name in self._property_observers:
-            return self._property_observers[property_name]
+        channel: PropertyChannel = self._property_channel(property_name)
+        if channel.notifier is None:
+            notify_prop_updated = NotifyUpdated()
+            notify_prop_updated.value = getattr(self, property_name)
+            channel.notifier = notify_prop_updated
 
-        notify_prop_updated = NotifyUpdated()
-        notify_prop_updated.value = getattr(self, property_name)
-        self._property_observers[property_name] = notify_prop_updated
-        return notify_prop_updated
+        return channel.notifier
 
     def property_received(self, property_name: str) -> Self:
         """
@@ -55,12 +119,14 @@ class NotifyUpdated:
 
         from .observable_receiver import ObservableReceiver
 
-        if property_name in self._property_receivers:
-            return self._property_receivers[property_name]
+        channel: PropertyChannel = self._property_channel(property_name)
+        if channel.receiver is None:
+            channel.receiver = ObservableReceiver(
+                lambda v: setattr(self, property_name, v),
+                getattr(self, property_name)
+            )
 
-        receiver = ObservableReceiver(lambda v: setattr(self, property_name, v), getattr(self, property_name))
-        self._property_receivers[property_name] = receiver
-        return receiver
+        return channel.receiver
 
     def property(self, property_name: str) -> Self:
         """
@@ -76,13 +142,15 @@ class NotifyUpdated:
 
         from .property_listener import PropertyListener
 
-        if property_name in self._property_two_way_listeners:
-            return self._property_two_way_listeners[property_name]
+        channel: PropertyChannel = self._property_channel(property_name)
+        if channel.listener is None:
+            # noinspection PyTypeChecker
+            channel.listener = PropertyListener(
+                self.property_updated(property_name),
+                self.property_received(property_name)
+            )
 
-        # noinspection PyTypeChecker
-        listener = PropertyListener(self.property_updated(property_name), self.property_received(property_name))
-        self._property_two_way_listeners[property_name] = listener
-        return listener
+        return channel.listener
 
     def properties_updated(self, *property_names: str) -> List[Self]:
         """
@@ -117,14 +185,72 @@ class NotifyUpdated:
         :return: new ``List`` of ``PropertyListener`` instances for two-way property listening
         """
 
+        return [self.property(name) for name in property_names]
+
     def raise_update_event(self) -> None:
         """
         Raises the whole object update event, invoking subscribed functions.
         Supports to be invoked manually
+
+        Inside a ``batch()`` scope the event is deferred until the scope exits
+
+        Derived nodes (``HookMetrics``, ``Computed``, ``WhenCondition``) are updated
+        after all subscribed functions, in topological order, at most once per event
+
+        Functions are invoked by the instance's ``dispatcher``, inline by default
         """
 
-        for observer_func in self._observers:
-            observer_func(self)
+        if defer_update_event(self):
+            return
+
+        self._invoke_observers(self)
+
+    def _invoke_observers(self, argument: Any) -> None:
+        if instrumentation.enabled:
+            instrumentation.record_raise(self)
+
+        if not self._observers:
+            return
+
+        dispatcher: Dispatcher | None = self._dispatcher or dispatchers.default_dispatcher
+        if dispatcher is None:
+            self._deliver_update(argument)
+        else:
+            dispatcher.dispatch(self, argument)
+
+    def _deliver_update(self, argument: Any) -> None:
+        observers = self._observers
+        if not observers:
+            return
+
+        is_timed: bool = instrumentation.enabled
+        # handlers mutating the table replace it with a copy, see ``ObserverTable``
+        observers.is_frozen = True
+        # only events reaching derived nodes need the propagation wave
+        opens_wave: bool = observers.opens_wave
+        if opens_wave:
+            begin_wave()
+
+        try:
+            for subscription, observer_func in observers.items():
+                # skip subscriptions disposed by previous handlers of the event
+                if self._observers is not observers and subscription not in (self._observers or ()):
+                    continue
+
+                # weak subscriptions are stored with None, resolved on every event
+                if observer_func is None:
+                    observer_func = subscription.callback
+                    if observer_func is None:
+                        subscription.dispose()
+                        continue
+
+                if is_timed:
+                    instrumentation.timed_call(subscription, observer_func, argument)
+                else:
+                    observer_func(argument)
+        finally:
+            if opens_wave:
+                end_wave()
 
     def raise_property_update(self, property_name: str) -> None:
         """
@@ -135,12 +261,13 @@ class NotifyUpdated:
         :param property_name: property name which event to be raised
         """
 
-        if property_name not in self._property_observers: return
+        if self._property_observers is None: return
+        channel: PropertyChannel | None = self._property_observers.get(property_name)
+        if channel is None: return
 
-        notify_prop_updated: Self = self._property_observers[property_name]
-        notify_prop_updated.raise_update_event()
+        channel.raise_update(getattr(self, property_name))
 
-    def raise_update_if_values_diff(self, a: Any, b: Any) -> bool:
+    def raise_update_if_values_diff(self, a: Any, b: Any, equals: Equality = value_equals) -> bool:
         """
         Raises the whole object update event, invoking subscribed functions
         if passed values are different (a != b)
@@ -148,17 +275,23 @@ class NotifyUpdated:
 
         :param a: an old value
         :param b: a new value, to be compared with the old value
+        :param equals: the strategy comparing values, by default ``==``
         :return: are passed value different (a != b)
         """
 
-        are_same: bool = a == b
+        are_same: bool = equals(a, b)
         if are_same:
             return False
 
         self.raise_update_event()
         return True
 
-    def raise_property_update_if_values_diff(self, property_name: str, a: Any, b: Any) -> bool:
+    def raise_property_update_if_values_diff(
+            self,
+            property_name: str,
+            a: Any,
+            b: Any,
+            equals: Equality = value_equals) -> bool:
         """
         Raises the property update by its name, invoking subscribed functions
         to ``property_updated`` functions if passed parameters are different (a != b).
@@ -167,28 +300,46 @@ class NotifyUpdated:
         :param property_name: property name which event to be raised
         :param a: an old property value
         :param b: a new property value, to be compared with the old value
+        :param equals: the strategy comparing values, by default ``==``
         """
 
-        if property_name not in self._property_observers:
-            return False
+        if self._property_observers is None: return False
+        channel: PropertyChannel | None = self._property_observers.get(property_name)
+        if channel is None: return False
 
-        notify_prop_updated: Self = self._property_observers[property_name]
-        notify_prop_updated.value = b
-        if notify_prop_updated.raise_update_if_values_diff(a, b):
-            self.raise_update_event()
-            return True
+        if channel.notifier is not None:
+            channel.notifier.value = b
 
-        return False
+        if equals(a, b):
+            return False
 
-    def attach_on_update(self, callback: Handler) -> None:
+        channel.raise_update(b)
+        self.raise_update_event()
+        return True
+
+    def attach_on_update(self, callback: Handler, weak: bool = False) -> Subscription:
         """
         Subscribes specified function to the ``raise_update_event()``.
         If object instance is updated, your function will be invoked
 
         :param callback: a function to be subscribed to an update event
+        :param weak: hold the function by weak reference (bound methods via ``WeakMethod``),
+        the subscription is removed when the function or its owner is collected
+        :return: ``Subscription`` token, its ``dispose()`` unsubscribes the function in O(1)
+
+        Coroutine functions are supported while an event loop is running, every
+        event starts a task in that loop, even if the event is raised from another thread
         """
 
-        self._observers.append(callback)
+        if iscoroutinefunction(callback):
+            if weak:
+                raise ValueError("coroutine functions can't be subscribed by weak reference")
+
+            callback = AsyncObserver(callback)
+
+        subscription = self._subscription_type(self, callback, weak)
+        mutable_observers(self)[subscription] = None if weak else callback
+        return subscription
 
     def detach_on_update(self, callback: Handler) -> bool:
         """
@@ -200,13 +351,104 @@ class NotifyUpdated:
 
         Also, alternative C#-like syntax is supported, through
         ``some_obj += callback``
+
+        Prefer ``Subscription.dispose()`` of the ``attach_on_update()`` result,
+        it doesn't search the function among all subscribed ones
         """
 
-        if callback in self._observers:
-            self._observers.remove(callback)
-            return True
+        if self._observers is None:
+            return False
+
+        for subscription, observer_func in self._observers.items():
+            if observer_func is None:
+                observer_func = subscription.callback
+
+            if observer_func == callback:
+                return subscription.dispose()
+
         return False
 
+    async def changed(self) -> Any:
+        """
+        Waits for the next update event, events raised from other
+        threads are passed to the running event loop
+
+        :return: the value passed to subscribed functions
+        """
+
+        return await next_update(self)
+
+    def values(self) -> AsyncUpdates:
+        """
+        Asynchronous iterator over update events, ``async for value in obs.values()``.
+        If updates are faster than the consumer, the latest value is returned
+
+        :return: new ``AsyncUpdates`` instance, subscribed until ``close()``
+        """
+
+        return AsyncUpdates(self)
+
+    def debounce(self, seconds: float) -> Any:
+        """
+        Creates an ``Observable`` raising the event with the latest value,
+        when the current instance has no updates during the specified time
+
+        :param seconds: the quiet time after the last update
+        :return: new ``Debounced`` instance
+        """
+
+        from .operators import Debounced
+        return Debounced(self, seconds)
+
+    def throttle(self, seconds: float, leading: bool = True, trailing: bool = True) -> Any:
+        """
+        Creates an ``Observable`` raising at most one event per the specified time window
+
+        :param seconds: the window length
+        :param leading: raise the event immediately with the value opening the window
+        :param trailing: raise the event with the latest value, when the window is closed
+        :return: new ``Throttled`` instance
+        """
+
+        from .operators import Throttled
+        return Throttled(self, seconds, leading, trailing)
+
+    def sample(self, seconds: float) -> Any:
+        """
+        Creates an ``Observable`` raising the event with the latest value
+        once per the specified period, if the current instance was updated
+
+        :param seconds: the sampling period
+        :return: new ``Sampled`` instance
+        """
+
+        from .operators import Sampled
+        return Sampled(self, seconds)
+
+    def distinct_until_changed(self, key: Callable[[Any], Any] | None = None) -> Any:
+        """
+        Creates an ``Observable`` raising the event only if the key
+        of the value is different to the key of the previous value
+
+        :param key: a function returning the compared part of the value, by default the value itself
+        :return: new ``DistinctUntilChanged`` instance
+        """
+
+        from .operators import DistinctUntilChanged
+        return DistinctUntilChanged(self, key)
+
+    def buffer(self, size: float | int) -> Any:
+        """
+        Creates an ``Observable`` raising the event with the ``list`` of collected values
+
+        :param size: ``int`` - count of values in every list,
+        ``float`` - seconds of the collecting window
+        :return: new ``Buffered`` instance
+        """
+
+        from .operators import Buffered
+        return Buffered(self, size)
+
     def detach_all_handlers(self) -> None:
         """
         Unsubscribes all functions which are subscribed to current
@@ -216,7 +458,7 @@ class NotifyUpdated:
         ``some_obj -= callback``
         """
 
-        self._observers.clear()
+        self._observers = None
 
     def __add__(self, callback: Handler) -> Self:
         self.attach_on_update(callback)
@@ -227,9 +469,65 @@ class NotifyUpdated:
         return self
 
 
+class PropertyChannel:
+    """
+    The entry of ``NotifyUpdated`` property table, subscribers of a single property
+
+    Functions subscribed via ``attach_on_property_update()`` are stored here directly
+    and receive the new property value. ``property_updated()``, ``property_received()``
+    and ``property()`` instances are created on the first request only,
+    e.g. when a ``Binding`` needs them
+    """
+
+    __slots__ = ("_observers", "owner", "name", "value", "notifier", "receiver", "listener", "__weakref__")
+
+    def __init__(self, owner: NotifyUpdated, name: str):
+        self._observers: ObserverTable | None = None
+        self.owner: NotifyUpdated = owner
+        self.name: str = name
+        self.value: Any = None
+        self.notifier: NotifyUpdated | None = None
+        self.receiver: Any = None
+        self.listener: Any = None
+
+    def __repr__(self) -> str:
+        return f"<PropertyChannel: name={self.name}; observers_len={self.observers_count}>"
+
+    @property
+    def _dispatcher(self) -> Dispatcher | None: return self.owner._dispatcher
+
+    # the channel delivers events the same way as its owner does
+    _subscription_type: type = Subscription
+    observers_count = NotifyUpdated.observers_count
+    attach_on_update = NotifyUpdated.attach_on_update
+    detach_on_update = NotifyUpdated.detach_on_update
+    _invoke_observers = NotifyUpdated._invoke_observers
+    _deliver_update = NotifyUpdated._deliver_update
+
+    def raise_update(self, new_value: Any) -> None:
+        """
+        Invokes property subscribers with the new value,
+        then the ``property_updated()`` instance if it's created
+        """
+
+        self.value = new_value
+        self.raise_update_event()
+
+        if self.notifier is not None:
+            self.notifier.value = new_value
+            self.notifier.raise_update_event()
+
+    def raise_update_event(self) -> None:
+        if defer_update_event(self):
+            return
+
+        self._invoke_observers(self.value)
+
+
 def notify_property_updated(
         get_value_function: Callable[[NotifyUpdated], Any],
-        property_name: str | None = None) -> Callable:
+        property_name: str | None = None,
+        equals: Equality = value_equals) -> Callable:
     """
     Decorator for class methods (NotifyUpdated and its child classes), allows
     automatically notify if property is updated, invoking
@@ -238,16 +536,66 @@ def notify_property_updated(
     :param get_value_function: invoke value getter, to check the value before
     :param property_name: change updating property name, if method name doesn't same to property name
     and after decorated method invokation
+    :param equals: the strategy comparing old and new property values, by default ``==``
     """
 
     def decorator(target_function: Callable) -> Callable:
         final_property_name: str = property_name or target_function.__name__
 
         def wrapper(self, *args, **kwargs):
+            # the event is raised via the property notifier only, so without it
+            # neither reads before and after, nor the comparison are needed
+            property_observers: Dict[str, NotifyUpdated] | None = self._property_observers
+            if property_observers is None or final_property_name not in property_observers:
+                target_function(self, *args, **kwargs)
+                return
+
             old_value: Any = get_value_function(self)
             target_function(self, *args, **kwargs)
 
             new_value: Any = get_value_function(self)
-            self.raise_property_update_if_values_diff(final_property_name, old_value, new_value)
+            self.raise_property_update_if_values_diff(final_property_name, old_value, new_value, equals)
         return wrapper
     return decorator
+
+
+_notify_property_template: str = """
+def get_value(self):
+    return self.{attribute}
+
+def set_value(self, new_value):
+    property_observers = self._property_observers
+    if property_observers is None or "{name}" not in property_observers:
+        self.{attribute} = new_value
+        return
+
+    old_value = self.{attribute}
+    self.{attribute} = new_value
+    self.raise_property_update_if_values_diff("{name}", old_value, new_value, equals)
+"""
+
+
+def notify_property(
+        property_name: str,
+        attribute_name: str | None = None,
+        equals: Equality = value_equals) -> property:
+    """
+    Creates a property storing its value to the backing attribute, and raising
+    ``raise_property_update_if_values_diff()`` as ``@notify_property_updated()`` does
+
+    The getter and setter are compiled once, access the attribute directly
+    and skip the comparison when the property has no ``property_updated()`` notifier.
+    Suits properties without side effects: ``x = notify_property("x")``
+
+    :param property_name: the name of the property, used for ``property_updated()``
+    :param attribute_name: the backing attribute (or slot), by default ``_`` + property name
+    :param equals: the strategy comparing old and new property values, by default ``==``
+    """
+
+    attribute_name = attribute_name or f"_{property_name}"
+    if not property_name.isidentifier() or not attribute_name.isidentifier():
+        raise ValueError(f"invalid property name: {property_name!r}, {attribute_name!r}")
+
+    namespace: Dict[str, Any] = {"equals": equals}
+    exec(_notify_property_template.format(name=property_name, attribute=attribute_name), namespace)
+    return property(namespace["get_value"], namespace["set_value"])
@@ -1,5 +1,8 @@
 from .notify_updated import NotifyUpdated
-from typing import Callable, List, TypeVar, Generic, Any
+from .batch import defer_update_event
+from .equality import Equality, value_equals
+from . import dependency_tracking
+from typing import TypeVar, Generic
 
 
 T = TypeVar('T')
@@ -10,34 +13,68 @@ class Observable(Generic[T], NotifyUpdated):
     A container inherited from ``NotifyUpdated`` with the ``value``
     property, which  invoked ``raise_update_event()`` when the
     ``value`` property is updated by new different value
+
+    Values are compared by the ``equals`` strategy, by default ``==``
+    is used. See ``identity_equals``, ``array_equals`` and ``versioned()``
+    for large values, which deep comparison is expensive
     """
 
-    def __init__(self, initial_value: T | None = None):
+    __slots__ = ("_equals",)
+
+    def __init__(self, initial_value: T | None = None, equals: Equality = value_equals):
         super().__init__()
         self._value = initial_value
-        self._observers: List[Callable[[T], Any]] = []
+        self._equals: Equality = equals
 
     def __str__(self) -> str:
         return f"obs({self._value.__str__()})"
 
     def __repr__(self) -> str:
-        return f"<obs: value={self._value.__repr__()}; observers_len={len(self._observers)}>"
+        return f"<obs: value={self._value.__repr__()}; observers_len={self.observers_count}>"
 
     def __lshift__(self, other: T):
         self.value = other
 
     @property
     def value(self) -> T:
+        if dependency_tracking.active_frames:
+            dependency_tracking.track_read(self)
+
         return self._value
 
     @value.setter
     def value(self, new_value: T):
-        if new_value == self._value:
+        if self._equals(self._value, new_value):
             return
 
         self._value = new_value
         self.raise_update_event()
 
+    @property
+    def equals(self) -> Equality:
+        """ The strategy comparing old and new values """
+
+        return self._equals
+
+    @equals.setter
+    def equals(self, new_equals: Equality): self._equals = new_equals
+
+    def set(self, new_value: T, force: bool = False) -> bool:
+        """
+        Updates the value, the same as ``value`` property setter
+
+        :param new_value: new value to be stored
+        :param force: raise the update event even if values are the same
+        :return: is the update event raised
+        """
+
+        if not force and self._equals(self._value, new_value):
+            return False
+
+        self._value = new_value
+        self.raise_update_event()
+        return True
+
     def no_event_set_value(self, new_value: T):
         """
         The way to update Observable's value without
@@ -55,14 +92,17 @@ class Observable(Generic[T], NotifyUpdated):
         of the class instance like ``NotifyUpdated`` instances
         """
 
-        for observer_func in self._observers:
-            observer_func(self._value)
+        if defer_update_event(self):
+            return
+
+        self._invoke_observers(self._value)
 
 
-def obs(initial_value: T | None = None) -> Observable[T]:
+def obs(initial_value: T | None = None, equals: Equality = value_equals) -> Observable[T]:
     """
     Creates a new instance of ``Observable[T]`` object
     :param initial_value: start value to be stored
+    :param equals: the strategy comparing old and new values
     """
 
-    return Observable(initial_value)
+    return Observable(initial_value, equals)
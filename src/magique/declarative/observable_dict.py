@@ -1,5 +1,10 @@
-from typing import TypeVar, Generic, Dict, Callable, Iterable, Any
+from collections.abc import MutableMapping, KeysView, ItemsView, ValuesView
+from dataclasses import dataclass
+from typing import TypeVar, Generic, Dict, Callable, Iterable, Iterator, Any, Tuple
+from .notify_updated import NotifyUpdated
 from .observable import Observable
+from .subscription import Subscription
+from .nested_views import NestedViews, NestedChange
 
 
 K = TypeVar("K")
@@ -7,12 +12,103 @@ V = TypeVar("V")
 _sentinel: Any = object()
 
 
-class ObservableDict(Observable[Dict], Generic[K, V]):
+@dataclass(frozen=True, slots=True)
+class DictChange:
+    """
+    The record of a single key change of ``ObservableDict``
+     - ``kind`` - ``"insert"``, ``"remove"`` or ``"replace"``
+     - ``key`` - the changed key
+     - ``old_value`` - value before the change, ``None`` for insertion
+     - ``new_value`` - value after the change, ``None`` for removal
+    """
+
+    kind: str
+    key: Any
+    old_value: Any = None
+    new_value: Any = None
+
+    def reversed(self) -> "DictChange":
+        """ :return: the change reverting this one """
+
+        kind: str = {"insert": "remove", "remove": "insert"}.get(self.kind, self.kind)
+        return DictChange(kind, self.key, self.new_value, self.old_value)
+
+
+def _key_change(key: Any, old_value: Any, new_value: Any) -> DictChange:
+    if old_value is _sentinel:
+        return DictChange("insert", key, None, new_value)
+
+    if new_value is _sentinel:
+        return DictChange("remove", key, old_value, None)
+
+    return DictChange("replace", key, old_value, new_value)
+
+
+class _KeySubscription(Subscription):
+    """ The subscription to the key channel, the last disposed one drops the channel """
+
+    __slots__ = ()
+
+    def dispose(self) -> bool:
+        channel: _KeyChannel | None = self._notifier
+        if not super().dispose():
+            return False
+
+        if not channel._observers:
+            channel.owner._drop_key_channel(channel)
+
+        return True
+
+
+class _KeyChannel(NotifyUpdated):
+    """ Subscribers of a single ``ObservableDict`` key, see ``ObservableDict.key_updated()`` """
+
+    __slots__ = ("owner", "key")
+
+    _subscription_type: type = _KeySubscription
+
+    def __init__(self, owner: "ObservableDict", key: Any):
+        super().__init__()
+        self.owner: ObservableDict = owner
+        self.key: Any = key
+
+    @property
+    def value(self) -> Any:
+        """ The current value of the key, ``None`` if it's missing """
+
+        return self.owner._value.get(self.key)
+
+    def attach_on_update(self, callback: Callable[[DictChange], Any], weak: bool = False) -> Subscription:
+        # channels are registered by subscriptions only, the key has a single registered channel
+        channels: Dict | None = self.owner._key_channels
+        if channels is None:
+            self.owner._key_channels = channels = {}
+
+        channel: _KeyChannel = channels.setdefault(self.key, self)
+        if channel is not self:
+            return channel.attach_on_update(callback, weak)
+
+        return super().attach_on_update(callback, weak)
+
+
+class ObservableDict(NestedViews, Observable[Dict], MutableMapping, Generic[K, V]):
     """
     It's a standard ``Dict``, but every mutation operation
     invokes ``raise_update_event()`` with its subscribed
     functions, supports all basic list operations
 
+    Implements ``MutableMapping``, every operation, including ``update()`` and ``clear()``,
+    raises a single event. ``values()`` returns values of the dict, as ``Mapping`` does,
+    use ``AsyncUpdates(observable_dict)`` to iterate update events asynchronously.
+    Instances are compared by identity, as other ``NotifyUpdated`` instances
+
+    Nested dicts and lists are returned as cached child views, see ``NestedViews``
+
+    Functions subscribed by ``attach_on_change()`` receive a ``DictChange`` record
+    per changed key, and ``NestedChange`` records of nested dicts and lists mutations.
+    Subscribers of ``key_updated(key)`` receive records of the key only,
+    other keys' changes don't invoke them
+
     If no argument is given, the constructor creates a new empty dict.
     The argument must be an iterable if specified
     """
@@ -30,35 +126,252 @@ class ObservableDict(Observable[Dict], Generic[K, V]):
         self._target_dict.update(kwargs)
         super().__init__(initial_value=self._target_dict)
 
+        # records are built only if somebody listens to them
+        self._changes: NotifyUpdated | None = None
+        self._key_channels: Dict[K, NotifyUpdated] | None = None
+
+    def attach_on_change(self, callback: Callable[[DictChange], Any], weak: bool = False) -> Subscription:
+        """
+        Subscribes the function to key change records of all keys. Records
+        are delivered immediately, they're not deferred by ``batch()``
+
+        :param callback: a function receiving ``DictChange`` records
+        :param weak: hold the function by weak reference
+        :return: ``Subscription`` token, its ``dispose()`` unsubscribes the function
+        """
+
+        if self._changes is None:
+            self._changes = NotifyUpdated()
+
+        return self._changes.attach_on_update(callback, weak)
+
+    def key_updated(self, key: K) -> NotifyUpdated:
+        """
+        The channel of the key, its subscribed functions receive ``DictChange``
+        records of the key only. The channel is found by the key in O(1), so
+        the count of other keys' subscribers doesn't slow down updates
+
+        The replaced ``value`` of the dict notifies channels of keys
+        with different values. A channel is registered by its first subscription
+        and dropped with its last disposed one, so lookups don't slow down updates
+
+        :param key: the key, may be missing in the dict yet
+        :return: the same ``NotifyUpdated`` instance for the same key while it's subscribed,
+            its ``value`` is the current value of the key, ``None`` if it's missing
+        """
+
+        channel: NotifyUpdated | None = None if self._key_channels is None else self._key_channels.get(key)
+        return _KeyChannel(self, key) if channel is None else channel
+
+    @Observable.value.setter
+    def value(self, new_value: Dict):
+        self.set(new_value)
+
+    def set(self, new_value: Dict, force: bool = False) -> bool:
+        """
+        Replaces the whole dict, the same as ``value`` property setter.
+        ``attach_on_change()`` subscribers and channels of keys with different values
+        receive their ``DictChange`` records
+
+        :param new_value: new dict to be stored
+        :param force: raise the update event even if dicts are equal
+        :return: is the update event raised
+        """
+
+        if not force and self._equals(self._value, new_value):
+            return False
+
+        old_dict: Dict = self._value
+        self._value = new_value
+        if self._has_change_observers():
+            self._notify_replacement(old_dict, new_value)
+
+        self.raise_update_event()
+        return True
+
+    def _notify_replacement(self, old_dict: Dict, new_dict: Dict) -> None:
+        # without change subscribers only keys of channels are compared
+        if self._changes is None:
+            keys: Iterable = list(self._key_channels)
+        else:
+            keys = [*old_dict, *(key for key in new_dict if key not in old_dict)]
+
+        self._is_replacing = True
+        try:
+            for key in keys:
+                old_value: Any = old_dict.get(key, _sentinel)
+                new_value: Any = new_dict.get(key, _sentinel)
+                if old_value is new_value or old_value == new_value:
+                    continue
+
+                change: DictChange = _key_change(key, old_value, new_value)
+                if self._changes is not None:
+                    self._changes._invoke_observers(change)
+
+                channel: NotifyUpdated | None = None if self._key_channels is None else self._key_channels.get(key)
+                if channel is not None:
+                    channel._invoke_observers(change)
+        finally:
+            self._is_replacing = False
+
     def __setitem__(self, key: K, value: V):
-        self._value[key] = value
+        if not self._is_change_observed():
+            self._value[key] = value
+        else:
+            old_value: V = self._value.get(key, _sentinel)
+            self._value[key] = value
+            self._notify_change(_key_change(key, old_value, value))
+
         self.raise_update_event()
 
     def __delitem__(self, key: K):
-        del self._value[key]
+        old_value: V = self._value.pop(key)
+        if self._is_change_observed():
+            self._notify_change(DictChange("remove", key, old_value, None))
+
         self.raise_update_event()
 
     def clear(self):
         """ Remove all items from the dictionary """
 
-        self._value.clear()
+        if self._is_change_observed():
+            removed: Dict = self._value.copy()
+            self._value.clear()
+            for key, value in removed.items():
+                self._notify_change(DictChange("remove", key, value, None))
+        else:
+            self._value.clear()
+
         self.raise_update_event()
 
     def update(self, *args, **kwargs):
         """ Adds new key-value pairs, or changes existing """
 
-        self._value.update(*args, **kwargs)
+        if self._is_change_observed():
+            items: Dict = dict(*args, **kwargs)
+            old_values: Dict = {key: self._value.get(key, _sentinel) for key in items}
+            self._value.update(items)
+            for key, value in items.items():
+                self._notify_change(_key_change(key, old_values[key], value))
+        else:
+            self._value.update(*args, **kwargs)
+
         self.raise_update_event()
 
+    def pop(self, key: K, default: V = _sentinel) -> V:
+        """
+        Removes the key and returns its value, or ``default`` if the key is missing
+
+        Raises ``KeyError`` if the key is missing and ``default`` is not given
+        """
+
+        if key not in self._value:
+            if default is _sentinel:
+                raise KeyError(key)
+
+            return default
+
+        value: V = self._value[key]
+        del self[key]
+        return value
+
+    def popitem(self) -> Tuple[K, V]:
+        """
+        Removes and returns the last inserted pair
+
+        Raises ``KeyError`` if the dict is empty
+        """
+
+        if not self._value:
+            raise KeyError("popitem(): dictionary is empty")
+
+        key: K = next(reversed(self._value))
+        return key, self.pop(key)
+
+    def setdefault(self, key: K, default: V = None) -> V:
+        """ Returns the value of the key, sets it to ``default`` if the key is missing """
+
+        if key not in self._value:
+            self[key] = default
+
+        return self._child(key, self._value[key])
+
+    def get(self, key: K, default: V = None) -> V:
+        value: V = self.value.get(key, _sentinel)
+        return default if value is _sentinel else self._child(key, value)
+
+    def keys(self) -> KeysView:
+        return self.value.keys()
+
+    def items(self) -> ItemsView:
+        return self.value.items()
+
+    def values(self) -> ValuesView:
+        return self.value.values()
+
     def __getitem__(self, key: K) -> V:
-        return self._value[key]
+        return self._child(key, self.value[key])
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.value
+
+    def __iter__(self) -> Iterator[K]:
+        return self.value.__iter__()
+
+    def __reversed__(self) -> Iterator[K]:
+        return self.value.__reversed__()
 
     def __len__(self) -> int:
-        return len(self._value)
+        return len(self.value)
+
+    # compared by identity, ``Mapping`` compares by content
+    __eq__ = NotifyUpdated.__eq__
+    __hash__ = NotifyUpdated.__hash__
 
     def __repr__(self) -> str:
         return repr(self._value)
 
+    def _has_change_observers(self) -> bool:
+        return self._changes is not None or self._key_channels is not None
+
+    def _notify_change(self, change: DictChange | NestedChange):
+        if self._changes is not None:
+            self._changes._invoke_observers(change)
+
+        if self._key_channels is not None:
+            is_nested: bool = change.__class__ is NestedChange
+            channel: NotifyUpdated | None = self._key_channels.get(change.path[0] if is_nested else change.key)
+            if channel is not None:
+                channel._invoke_observers(change)
+
+        self._forward_change(change)
+
+    def _drop_key_channel(self, channel: _KeyChannel):
+        if self._key_channels is not None and self._key_channels.get(channel.key) is channel:
+            del self._key_channels[channel.key]
+            if not self._key_channels:
+                self._key_channels = None
+
+    def _apply_change(self, change: DictChange | NestedChange, reverse: bool = False):
+        """ Applies the recorded change, or reverts it, raising a single update event """
+
+        if change.__class__ is NestedChange:
+            self._apply_nested(change, reverse)
+            return
+
+        if reverse:
+            change = change.reversed()
+
+        if change.kind == "remove":
+            del self._value[change.key]
+        else:
+            self._value[change.key] = change.new_value
+
+        if self._is_change_observed():
+            self._notify_change(change)
+
+        self.raise_update_event()
+
 
 def od(initial_dict: Dict | zip | Iterable = _sentinel) -> ObservableDict:
     """
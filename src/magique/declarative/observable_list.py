@@ -1,17 +1,70 @@
-from typing import Any, List, TypeVar, Generic, Iterable, Iterator, Callable
+import sys
+from collections import Counter
+from collections.abc import MutableSequence
+from dataclasses import dataclass
+from typing import Any, List, TypeVar, Generic, Iterable, Iterator, Callable, Self
+from .notify_updated import NotifyUpdated
 from .observable import Observable
+from .subscription import Subscription
+from .nested_views import NestedViews, NestedChange
 
 
 T = TypeVar('T')
 _sentinel: Any = object()
 
 
-class ObservableList(Observable[List], Generic[T]):
+@dataclass(frozen=True, slots=True)
+class ListChange:
+    """
+    The record of a single ``ObservableList`` mutation
+     - ``kind`` - ``"insert"``, ``"remove"``, ``"replace"`` or ``"move"``
+     - ``index`` - position of the first changed item
+     - ``old_items`` - items at ``index`` before the mutation, empty for insertion
+     - ``new_items`` - items at ``index`` after the mutation, empty for removal
+     - ``new_index`` - new position of the item, only for ``"move"``
+    """
+
+    kind: str
+    index: int
+    old_items: List
+    new_items: List
+    new_index: int | None = None
+
+    def reversed(self) -> "ListChange":
+        """ :return: the change reverting this one """
+
+        if self.kind == "move":
+            return ListChange("move", self.new_index, self.new_items, self.old_items, self.index)
+
+        return _splice_change(self.index, self.new_items, self.old_items)
+
+
+def _splice_change(index: int, old_items: List, new_items: List) -> ListChange:
+    if not old_items:
+        return ListChange("insert", index, old_items, new_items)
+
+    if not new_items:
+        return ListChange("remove", index, old_items, new_items)
+
+    return ListChange("replace", index, old_items, new_items)
+
+
+class ObservableList(NestedViews, Observable[List], MutableSequence, Generic[T]):
     """
     It's a standard ``List``, but every mutation operation
     invokes ``raise_update_event()`` with its subscribed
     functions, supports all basic list operations
 
+    Implements ``MutableSequence``, every operation, including bulk ones
+    (``extend()``, ``remove_many()``, ``sort()``, slice assignment), raises a single event
+
+    Functions subscribed by ``attach_on_change()`` receive a ``ListChange``
+    record per mutation instead, so they don't need to process the whole list,
+    and ``NestedChange`` records of nested lists and dicts mutations
+
+    Nested lists and dicts are returned as cached child views, see ``NestedViews``.
+    Slices are returned as detached copies
+
     If no argument is given, the constructor creates a new empty list.
     The argument must be an iterable if specified
     """
@@ -26,10 +79,58 @@ class ObservableList(Observable[List], Generic[T]):
 
         super().__init__(initial_value=self._initializer_list)
 
+        # records are built only if somebody listens to them
+        self._changes: NotifyUpdated | None = None
+
+    def attach_on_change(self, callback: Callable[[ListChange], Any], weak: bool = False) -> Subscription:
+        """
+        Subscribes the function to mutation records. Records are delivered
+        immediately in order of mutations, they're not deferred by ``batch()``.
+        Bulk operations (``extend()``, ``clear()``, slice assignments) are single records
+
+        :param callback: a function receiving ``ListChange`` records
+        :param weak: hold the function by weak reference
+        :return: ``Subscription`` token, its ``dispose()`` unsubscribes the function
+        """
+
+        if self._changes is None:
+            self._changes = NotifyUpdated()
+
+        return self._changes.attach_on_update(callback, weak)
+
     def append(self, item: T):
         """ Appends object to the end of the list """
 
         self._value.append(item)
+        if self._is_change_observed():
+            self._notify_change(ListChange("insert", len(self._value) - 1, [], [item]))
+
+        self.raise_update_event()
+
+    def insert(self, index: int, item: T):
+        """ Inserts object before the index """
+
+        size: int = len(self._value)
+        index = max(0, size + index) if index < 0 else min(index, size)
+        self._value.insert(index, item)
+        if self._is_change_observed():
+            self._notify_change(ListChange("insert", index, [], [item]))
+
+        self.raise_update_event()
+
+    def move(self, old_index: int, new_index: int):
+        """
+        Moves the item from ``old_index`` to ``new_index``,
+        the new index is the item position after the move
+        """
+
+        size: int = len(self._value)
+        old_index, new_index = range(size)[old_index], range(size)[new_index]
+        item: T = self._value.pop(old_index)
+        self._value.insert(new_index, item)
+        if self._is_change_observed():
+            self._notify_change(ListChange("move", old_index, [item], [item], new_index))
+
         self.raise_update_event()
 
     def remove(self, item: T):
@@ -39,7 +140,13 @@ class ObservableList(Observable[List], Generic[T]):
         Raises ``ValueError`` if the value is not present
         """
 
-        self._value.remove(item)
+        if self._is_change_observed():
+            index: int = self._value.index(item)
+            change: ListChange = ListChange("remove", index, [self._value.pop(index)], [])
+            self._notify_change(change)
+        else:
+            self._value.remove(item)
+
         self.raise_update_event()
 
     def remove_many(self, items: Iterable[T]):
@@ -47,49 +154,284 @@ class ObservableList(Observable[List], Generic[T]):
         Performs multiply ``remove()`` operations, but with
         single ``raise_update_event``, because it's recognized
         as single operation
+
+        Hashable items are removed in a single pass, O(n + m), unhashable ones one by one.
+        Raises ``ValueError`` if any item is not present, the list is not changed then.
+        Adjacent removed items are reported as a single record
         """
 
-        for item in items:
-            self._value.remove(item)
+        items = list(items)
+        try:
+            counts: Counter = Counter(items)
+        except TypeError:
+            self._remove_one_by_one(items)
+            return
+
+        kept: List = []
+        removed_positions: List[int] = []
+        for position, item in enumerate(self._value):
+            try:
+                is_removed: bool = counts.get(item, 0) > 0
+            except TypeError:
+                is_removed = False
+
+            if is_removed:
+                counts[item] -= 1
+                removed_positions.append(position)
+            else:
+                kept.append(item)
+
+        if any(count > 0 for count in counts.values()):
+            raise ValueError("list.remove(x): x not in list")
+
+        changes: List[ListChange] = []
+        if self._is_change_observed():
+            # ranges of removed positions, shifted by items removed before them
+            shift: int = 0
+            start: int = 0
+            for index, position in enumerate(removed_positions):
+                is_last: bool = index + 1 == len(removed_positions)
+                if is_last or removed_positions[index + 1] != position + 1:
+                    run: List[int] = removed_positions[start:index + 1]
+                    changes.append(ListChange("remove", run[0] - shift, [self._value[p] for p in run], []))
+                    shift += len(run)
+                    start = index + 1
+
+        self._value[:] = kept
+        for change in changes:
+            self._notify_change(change)
 
         self.raise_update_event()
 
+    def pop(self, index: int = -1) -> T:
+        """
+        Removes and returns the item at the index, the last one by default
+
+        Raises ``IndexError`` if the list is empty or the index is out of range
+        """
+
+        index = range(len(self._value))[index]
+        item: T = self._value.pop(index)
+        if self._is_change_observed():
+            self._notify_change(ListChange("remove", index, [item], []))
+
+        self.raise_update_event()
+        return item
+
+    def sort(self, *, key: Callable[[T], Any] | None = None, reverse: bool = False):
+        """ Sorts the list in place, stable """
+
+        self._reorder(lambda: self._value.sort(key=key, reverse=reverse))
+
+    def reverse(self):
+        """ Reverses the list in place """
+
+        self._reorder(self._value.reverse)
+
+    def index(self, item: T, start: int = 0, stop: int = sys.maxsize) -> int:
+        """
+        :return: the first index of the item
+
+        Raises ``ValueError`` if the value is not present
+        """
+
+        return self.value.index(item, start, stop)
+
+    def count(self, item: T) -> int:
+        """ :return: number of occurrences of the item """
+
+        return self.value.count(item)
+
+    def __iadd__(self, other: Iterable[T] | Callable) -> Self:
+        # a function is subscribed, as ``NotifyUpdated.__add__``, an iterable extends the list
+        if callable(other):
+            self.attach_on_update(other)
+        else:
+            self.extend(other)
+
+        return self
+
     def clear(self):
         """ Removes all items from list """
 
-        self._value.clear()
+        if self._is_change_observed() and self._value:
+            removed: List = self._value[:]
+            self._value.clear()
+            self._notify_change(ListChange("remove", 0, removed, []))
+        else:
+            self._value.clear()
+
         self.raise_update_event()
 
     def extend(self, items: Iterable[T]):
         """ Extends list by appending elements from the iterable """
 
-        self._value.extend(items)
+        if self._is_change_observed():
+            items = list(items)
+            index: int = len(self._value)
+            self._value.extend(items)
+            if items:
+                self._notify_change(ListChange("insert", index, [], items))
+        else:
+            self._value.extend(items)
+
         self.raise_update_event()
 
+    def where(self, predicate: Callable[[T], bool], watch: bool = False) -> Any:
+        """
+        Creates a live view of items satisfying the predicate, maintained per change
+
+        :param predicate: the function selecting items
+        :param watch: re-evaluate ``NotifyUpdated`` items when they raise update events
+        :return: new ``FilteredView`` instance
+        """
+
+        from .live_views import FilteredView
+        return FilteredView(self, predicate, watch)
+
+    def select(self, function: Callable[[T], Any], watch: bool = False) -> Any:
+        """
+        Creates a live view of function results for every item, maintained per change
+
+        :param function: the function converting items
+        :param watch: re-evaluate ``NotifyUpdated`` items when they raise update events
+        :return: new ``MappedView`` instance
+        """
+
+        from .live_views import MappedView
+        return MappedView(self, function, watch)
+
+    def sorted_by(self, key: Callable[[T], Any], watch: bool = False) -> Any:
+        """
+        Creates a live view of items sorted by the key, maintained per change
+        by binary search, so every change costs O(log n) comparisons
+
+        :param key: the function returning comparable sort keys
+        :param watch: re-evaluate ``NotifyUpdated`` items when they raise update events
+        :return: new ``SortedView`` instance
+        """
+
+        from .live_views import SortedView
+        return SortedView(self, key, watch)
+
     def __getitem__(self, index):
-        value: T = self._value[index]
-        return ObservableList(value) if isinstance(value, list) else value
+        value: T = self.value[index]
+        if isinstance(index, slice):
+            return ObservableList(value)
+
+        return self._child(index, value)
 
     def __setitem__(self, index, value):
-        self._value[index] = value
+        if self._is_change_observed():
+            if isinstance(index, slice):
+                value = list(value)
+
+            change: ListChange = self._change_of(index, value)
+            self._value[index] = value
+            self._notify_change(change)
+        else:
+            self._value[index] = value
+
         self.raise_update_event()
 
     def __delitem__(self, index):
-        del self._value[index]
+        if self._is_change_observed():
+            change: ListChange = self._change_of(index, [] if isinstance(index, slice) else _sentinel)
+            del self._value[index]
+            self._notify_change(change)
+        else:
+            del self._value[index]
+
         self.raise_update_event()
 
     def __contains__(self, item: Any) -> bool:
-        return item in self._value
+        return item in self.value
 
     def __iter__(self) -> Iterator[T]:
-        return self._value.__iter__()
+        return self.value.__iter__()
+
+    def __reversed__(self) -> Iterator[T]:
+        return self.value.__reversed__()
 
     def __len__(self):
-        return len(self._value)
+        return len(self.value)
 
     def __repr__(self):
         return repr(self._value)
 
+    def _remove_one_by_one(self, items: List[T]):
+        # unhashable items are searched by equality in a copy first, so missing ones don't change the list
+        remaining: List = self._value[:]
+        for item in items:
+            remaining.remove(item)
+
+        if self._is_change_observed():
+            for item in items:
+                index: int = self._value.index(item)
+                self._notify_change(ListChange("remove", index, [self._value.pop(index)], []))
+        else:
+            self._value[:] = remaining
+
+        self.raise_update_event()
+
+    def _reorder(self, reorder: Callable[[], Any]):
+        if self._is_change_observed() and self._value:
+            old_items: List = self._value[:]
+            reorder()
+            self._notify_change(ListChange("replace", 0, old_items, self._value[:]))
+        else:
+            reorder()
+
+        self.raise_update_event()
+
+    def _change_of(self, index: int | slice, value: Any) -> ListChange:
+        # the change made by assignment (or deletion if ``value`` is ``_sentinel``) by index
+        if not isinstance(index, slice):
+            position: int = range(len(self._value))[index]
+            return _splice_change(position, [self._value[position]], [] if value is _sentinel else [value])
+
+        positions: range = range(len(self._value))[index]
+        if positions.step == 1:
+            return _splice_change(positions.start, self._value[index], value)
+
+        # extended slices change items one by one, reported as a whole list replacement
+        updated: List = self._value[:]
+        if value:
+            updated[index] = value
+        else:
+            del updated[index]
+
+        return _splice_change(0, self._value[:], updated)
+
+    def _has_change_observers(self) -> bool:
+        return self._changes is not None and bool(self._changes._observers)
+
+    def _notify_change(self, change: ListChange | NestedChange):
+        if self._changes is not None:
+            self._changes._invoke_observers(change)
+
+        self._forward_change(change)
+
+    def _apply_change(self, change: ListChange | NestedChange, reverse: bool = False):
+        """ Applies the recorded change, or reverts it, raising a single update event """
+
+        if change.__class__ is NestedChange:
+            self._apply_nested(change, reverse)
+            return
+
+        if reverse:
+            change = change.reversed()
+
+        if change.kind == "move":
+            self._value.insert(change.new_index, self._value.pop(change.index))
+        else:
+            self._value[change.index:change.index + len(change.old_items)] = change.new_items
+
+        if self._is_change_observed():
+            self._notify_change(change)
+
+        self.raise_update_event()
+
 
 def ol(initial_iterable: Iterable[T] = _sentinel) -> ObservableList[T]:
     """
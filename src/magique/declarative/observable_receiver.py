@@ -1,5 +1,6 @@
 from typing import Any, TypeVar, Callable
 from .observable import Observable
+from .equality import Equality, value_equals
 
 
 T = TypeVar('T')
@@ -15,14 +16,19 @@ class ObservableReceiver(Observable[T]):
     is updated
     """
 
-    def __init__(self, setter_function: Callable[[Any], Any], initial_value: T | None = None):
-        super().__init__(initial_value)
+    def __init__(
+            self,
+            setter_function: Callable[[Any], Any],
+            initial_value: T | None = None,
+            equals: Equality = value_equals):
+
+        super().__init__(initial_value, equals)
         self.setter_function = setter_function
 
     @Observable.value.setter
     def value(self, new_value: T):
         self.setter_function(new_value)
-        if new_value == self._value:
+        if self._equals(self._value, new_value):
             return
 
         self._value = new_value
@@ -0,0 +1,257 @@
+import time
+
+from threading import Lock
+from typing import Callable, TypeVar, List, Any
+
+from .notify_updated import NotifyUpdated
+from .observable import Observable
+from .subscription import Subscription
+from .propagation import height_of
+from .equality import value_equals
+from .timer import TimerHandle, shared_timer
+from . import dependency_tracking
+
+
+T = TypeVar('T')
+_sentinel: Any = object()
+
+
+class Operator(Observable[T]):
+    """
+    A read-only ``Observable`` deriving its updates from the source ``NotifyUpdated``
+    instance. The operator receives values passed to subscribed functions of the
+    source, and decides which of them are raised as its own update events
+
+    Time-based operators are driven by the single ``shared_timer`` thread, so delayed
+    events are raised from that thread. Every forwarded value raises the event,
+    even if it's the same as the previous one
+    """
+
+    def __init__(self, source: NotifyUpdated):
+        super().__init__(source.value)
+        self.source: NotifyUpdated = source
+        self.propagation_height: int = height_of(source) + 1
+        self._lock: Lock = Lock()
+        self._timer_handle: TimerHandle | None = None
+        self._subscription: Subscription | None = source.attach_on_update(self._source_updated)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: value={self._value.__repr__()}; observers_len={self.observers_count}>"
+
+    @property
+    def value(self) -> T:
+        if dependency_tracking.active_frames:
+            dependency_tracking.track_read(self)
+
+        return self._value
+
+    def dispose(self) -> None:
+        """
+        Unsubscribes from the source and cancels the pending timer,
+        the operator doesn't raise events anymore
+        """
+
+        if self._subscription is not None:
+            self._subscription.dispose()
+            self._subscription = None
+
+        with self._lock:
+            self._cancel_timer()
+
+    def _source_updated(self, argument: Any) -> None:
+        """ Receives the value passed by the source to its subscribed functions """
+
+    def _emit(self, new_value: T) -> None:
+        self._value = new_value
+        self.raise_update_event()
+
+    def _start_timer(self, delay_seconds: float) -> None:
+        self._timer_handle = shared_timer.call_later(delay_seconds, self._timer_elapsed)
+
+    def _cancel_timer(self) -> None:
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+            self._timer_handle = None
+
+    def _timer_elapsed(self) -> None:
+        """ Invoked in the timer thread, when the started timer is elapsed """
+
+
+class Debounced(Operator[T]):
+    """
+    Raises the event with the latest value, when the source
+    has no updates during the specified time
+    """
+
+    def __init__(self, source: NotifyUpdated, seconds: float):
+        self.seconds: float = seconds
+        self._deadline: float = 0.0
+        self._latest: Any = None
+        super().__init__(source)
+
+    def _source_updated(self, argument: Any) -> None:
+        with self._lock:
+            self._latest = argument
+            self._deadline = time.monotonic() + self.seconds
+
+            # the running timer is extended when elapsed, instead of
+            # rescheduling on every update of the high-frequency source
+            if self._timer_handle is None:
+                self._start_timer(self.seconds)
+
+    def _timer_elapsed(self) -> None:
+        with self._lock:
+            remaining: float = self._deadline - time.monotonic()
+            if remaining > 0:
+                self._start_timer(remaining)
+                return
+
+            self._timer_handle = None
+            latest: Any = self._latest
+            self._latest = None
+
+        self._emit(latest)
+
+
+class Throttled(Operator[T]):
+    """
+    Raises at most one event per the specified time window
+
+    :param leading: raise the event immediately with the value opening the window
+    :param trailing: raise the event with the latest value received
+    during the window, when the window is closed
+    """
+
+    def __init__(self, source: NotifyUpdated, seconds: float, leading: bool = True, trailing: bool = True):
+        self.seconds: float = seconds
+        self.leading: bool = leading
+        self.trailing: bool = trailing
+        self._latest: Any = _sentinel
+        super().__init__(source)
+
+    def _source_updated(self, argument: Any) -> None:
+        with self._lock:
+            if self._timer_handle is not None:
+                if self.trailing:
+                    self._latest = argument
+
+                return
+
+            self._start_timer(self.seconds)
+            if not self.leading:
+                self._latest = argument
+                return
+
+        self._emit(argument)
+
+    def _timer_elapsed(self) -> None:
+        with self._lock:
+            latest: Any = self._latest
+            self._latest = _sentinel
+            if latest is _sentinel or not self.trailing:
+                self._timer_handle = None
+                return
+
+            # the trailing event opens the next window
+            self._start_timer(self.seconds)
+
+        self._emit(latest)
+
+
+class Sampled(Operator[T]):
+    """
+    Raises the event with the latest value once per the specified period,
+    if the source was updated during the period. The timer is stopped
+    while the source has no updates
+    """
+
+    def __init__(self, source: NotifyUpdated, seconds: float):
+        self.seconds: float = seconds
+        self._latest: Any = _sentinel
+        super().__init__(source)
+
+    def _source_updated(self, argument: Any) -> None:
+        with self._lock:
+            self._latest = argument
+            if self._timer_handle is None:
+                self._start_timer(self.seconds)
+
+    def _timer_elapsed(self) -> None:
+        with self._lock:
+            latest: Any = self._latest
+            self._latest = _sentinel
+            if latest is _sentinel:
+                self._timer_handle = None
+                return
+
+            self._start_timer(self.seconds)
+
+        self._emit(latest)
+
+
+class DistinctUntilChanged(Operator[T]):
+    """
+    Raises the event only if the key of the received value is different
+    to the key of the previous raised value
+
+    :param key: a function returning the compared part of the value, by default the value itself
+    """
+
+    def __init__(self, source: NotifyUpdated, key: Callable[[Any], Any] | None = None):
+        self.key: Callable[[Any], Any] | None = key
+        self._last_key: Any = _sentinel
+        super().__init__(source)
+
+    def _source_updated(self, argument: Any) -> None:
+        new_key: Any = argument if self.key is None else self.key(argument)
+        with self._lock:
+            if self._last_key is not _sentinel and value_equals(self._last_key, new_key):
+                return
+
+            self._last_key = new_key
+
+        self._emit(argument)
+
+
+class Buffered(Operator[List[T]]):
+    """
+    Collects received values and raises the event with the ``list`` of them
+
+    :param size: ``int`` - count of values in every raised list,
+    ``float`` - seconds of the collecting window, the event isn't raised for empty windows
+    """
+
+    def __init__(self, source: NotifyUpdated, size: float | int):
+        self.size: float | int = size
+        self._items: List[Any] = []
+        super().__init__(source)
+        self._value = []
+
+    @property
+    def is_time_based(self) -> bool: return not isinstance(self.size, int)
+
+    def _source_updated(self, argument: Any) -> None:
+        with self._lock:
+            self._items.append(argument)
+            if self.is_time_based:
+                if self._timer_handle is None:
+                    self._start_timer(self.size)
+
+                return
+
+            if len(self._items) < self.size:
+                return
+
+            items: List[Any] = self._items
+            self._items = []
+
+        self._emit(items)
+
+    def _timer_elapsed(self) -> None:
+        with self._lock:
+            self._timer_handle = None
+            items: List[Any] = self._items
+            self._items = []
+
+        if items:
+            self._emit(items)
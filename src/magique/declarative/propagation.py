@@ -0,0 +1,205 @@
+from heapq import heappush, heappop
+from itertools import count
+from threading import local
+from typing import Callable, Dict, List, Tuple, Iterable, Any
+from weakref import finalize
+
+
+class _PropagationState(local):
+    """
+    The propagation wave of the current thread. Plain deliveries only count their
+    nesting, the queue and binding marks are allocated by the first ``schedule()``
+    or binding application during the wave
+    """
+
+    depth: int = 0
+    is_open: bool = False
+    queue: List | None = None
+    scheduled: Dict | None = None
+    directions: Dict | None = None
+    active_bindings: set | None = None
+
+
+_propagation_state: _PropagationState = _PropagationState()
+_sequence = count()
+
+# heights of plain ``NotifyUpdated`` instances, assigned by bindings,
+# nodes like ``HookMetrics`` or ``Computed`` keep their own height
+_heights: Dict[int, int] = {}
+
+
+def height_of(notifier: Any) -> int:
+    """
+    :return: the height of the instance in the dependency graph,
+    0 for sources, ``1 + max(dependencies heights)`` for derived values
+    """
+
+    node_height: int | None = getattr(notifier, "propagation_height", None)
+    if node_height is not None:
+        return node_height
+
+    return _heights.get(id(notifier), 0)
+
+
+def height_above(notifiers: Iterable[Any]) -> int:
+    """
+    :return: the lowest height to be updated after all passed instances
+    """
+
+    return 1 + max((height_of(notifier) for notifier in notifiers), default=0)
+
+
+def raise_height(notifier: Any, height: int) -> None:
+    """
+    Assigns the height to the plain ``NotifyUpdated`` instance,
+    if it's higher than the current one
+    """
+
+    key: int = id(notifier)
+    if key not in _heights:
+        finalize(notifier, _heights.pop, key, None)
+    elif _heights[key] >= height:
+        return
+
+    _heights[key] = height
+
+
+def attach_node(notifier: Any, handler: Callable[[Any], Any], weak: bool = False) -> Any:
+    """
+    Subscribes the handler of a derived node (``Computed``, bindings, conditions)
+    to the notifier. Events of notifiers with subscribed nodes open propagation waves,
+    plain events don't touch the propagation state at all
+
+    :return: ``Subscription`` token of the handler
+    """
+
+    subscription: Any = notifier.attach_on_update(handler, weak)
+    notifier._observers.opens_wave = True
+    return subscription
+
+
+def _open_wave(state: _PropagationState) -> None:
+    state.queue = []
+    state.scheduled = {}
+    state.is_open = True
+
+
+def begin_wave() -> None:
+    """
+    Starts the propagation wave on the current thread, or joins the running one.
+    Scheduled nodes are updated when the outermost wave ends
+    """
+
+    _propagation_state.depth += 1
+
+
+def end_wave() -> None:
+    """
+    Ends the propagation wave. When the outermost wave ends, scheduled nodes
+    are updated in order of their heights, so every node is updated at most
+    once and after all its dependencies
+    """
+
+    state: _PropagationState = _propagation_state
+    if state.depth > 1 or not state.is_open:
+        state.depth -= 1
+        return
+
+    queue: List[Tuple[int, int, int, Callable[[], Any]]] = state.queue
+    try:
+        while queue:
+            _, _, key, action = heappop(queue)
+            del state.scheduled[key]
+            action()
+    finally:
+        state.queue = state.scheduled = state.directions = None
+        state.is_open = False
+        state.depth = 0
+
+
+def schedule(node: Any, height: int, action: Callable[[], Any]) -> None:
+    """
+    Schedules the node update to the end of the running propagation wave.
+    The node scheduled several times during the wave is updated only once
+
+    Outside a propagation wave the action is invoked immediately
+
+    :param node: the updated node, the key to avoid double updates
+    :param height: the node height, lower nodes are updated first
+    :param action: the function updating the node
+    """
+
+    state: _PropagationState = _propagation_state
+    if state.depth == 0:
+        action()
+        return
+
+    if not state.is_open:
+        _open_wave(state)
+
+    key: int = id(node)
+    if key in state.scheduled:
+        return
+
+    state.scheduled[key] = node
+    heappush(state.queue, (height, next(_sequence), key, action))
+
+
+def enter_binding(binding: Any, forward: bool) -> bool:
+    """
+    Marks the two-way binding as applying its value in the direction during the running
+    propagation wave, ``exit_binding()`` has to be called after the value is assigned
+
+    The binding isn't entered again while it's assigning, and it isn't applied backwards
+    during the wave it was applied forwards in (and vice versa), so values don't bounce
+    back and rings of bindings stop after the first round. Later updates of the same side
+    during the wave are applied again. Waves are thread-local
+
+    :param binding: the binding to be applied
+    :param forward: ``True`` for the source to destination direction
+    :return: ``False`` if the update is an echo of the value assigned by the binding
+    """
+
+    state: _PropagationState = _propagation_state
+    if state.active_bindings is None:
+        state.active_bindings = set()
+
+    key: int = id(binding)
+    if key in state.active_bindings:
+        return False
+
+    if state.depth:
+        if not state.is_open:
+            _open_wave(state)
+
+        if state.directions is None:
+            state.directions = {}
+
+        if state.directions.setdefault(key, forward) != forward:
+            return False
+
+    state.active_bindings.add(key)
+    return True
+
+
+def exit_binding(binding: Any) -> None:
+    """ Marks the binding entered by ``enter_binding()`` as not assigning anymore """
+
+    _propagation_state.active_bindings.discard(id(binding))
+
+
+def is_echo(binding: Any, forward: bool) -> bool:
+    """
+    :return: ``True`` if the binding can't be entered in the direction now,
+    see ``enter_binding()``
+    """
+
+    state: _PropagationState = _propagation_state
+    key: int = id(binding)
+    if state.active_bindings is not None and key in state.active_bindings:
+        return True
+
+    if state.depth == 0 or state.directions is None:
+        return False
+
+    return state.directions.get(key, forward) != forward
@@ -2,6 +2,8 @@ from typing import TypeVar, Any
 from .notify_updated import NotifyUpdated
 from .observable import Observable
 from .observable_receiver import ObservableReceiver
+from .subscription import Subscription
+from .equality import Equality, value_equals
 
 
 T = TypeVar('T')
@@ -21,11 +23,14 @@ class PropertyListener(Observable[T]):
     def __init__(
             self,
             property_updated: NotifyUpdated,
-            property_received: ObservableReceiver):
+            property_received: ObservableReceiver,
+            equals: Equality = value_equals):
 
-        super().__init__(property_received.value)
+        super().__init__(property_received.value, equals)
         self._property_updated: NotifyUpdated = property_updated
         self._property_received: ObservableReceiver = property_received
+        self._updated_subscription: Subscription | None = None
+        self._received_subscription: Subscription | None = None
 
         self._subscribe_updated(self._property_updated)
         self._subscribe_received(self._property_received)
@@ -52,7 +57,7 @@ class PropertyListener(Observable[T]):
 
     @Observable.value.setter
     def value(self, new_value: T):
-        if new_value == self._value:
+        if self._equals(self._value, new_value):
             return
 
         self._value = new_value
@@ -60,20 +65,24 @@ class PropertyListener(Observable[T]):
         self.raise_update_event()
 
     def _subscribe_updated(self, property_updated: NotifyUpdated):
-        property_updated.attach_on_update(self._property_updated_handler)
+        self._updated_subscription = property_updated.attach_on_update(self._property_updated_handler)
 
     def _unsubscribe_updated(self, property_updated: NotifyUpdated):
-        property_updated.detach_on_update(self._property_updated_handler)
+        if self._updated_subscription is not None:
+            self._updated_subscription.dispose()
+            self._updated_subscription = None
 
     def _subscribe_received(self, property_received: ObservableReceiver):
-        property_received.attach_on_update(self._property_received_handler)
+        self._received_subscription = property_received.attach_on_update(self._property_received_handler)
 
     def _unsubscribe_received(self, property_received: ObservableReceiver):
-        property_received.detach_on_update(self._property_received_handler)
+        if self._received_subscription is not None:
+            self._received_subscription.dispose()
+            self._received_subscription = None
 
     def _property_updated_handler(self, notifier: NotifyUpdated) -> None:
         # to avoid double raise event
-        if self._value == notifier.value:
+        if self._equals(self._value, notifier.value):
             return
 
         self._value = notifier.value
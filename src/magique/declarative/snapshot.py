@@ -0,0 +1,285 @@
+import io
+import pickle
+import sys
+from typing import Any, NamedTuple, Dict, List, Iterable
+
+from .notify_updated import NotifyUpdated
+from .observable import Observable
+from .observable_list import ObservableList
+from .observable_dict import ObservableDict
+from .computed import Computed
+from .operators import Operator
+from .hook_metrics import HookMetrics
+from .loop_metrics import LoopMetrics
+from .observable_receiver import ObservableReceiver
+from .property_listener import PropertyListener
+from .live_views import LiveView
+from .batch import batch
+
+
+# values of these observables are calculated from other sources, they are not a state
+_derived_types: tuple = (
+    Computed,
+    Operator,
+    HookMetrics,
+    LoopMetrics,
+    ObservableReceiver,
+    PropertyListener,
+    LiveView
+)
+
+
+class _State(NamedTuple):
+    """ Captured state of a ``NotifyUpdated`` instance, or of a container with them """
+
+    kind: str
+    type: Any
+    payload: Any
+
+
+_skipped: _State = _State("skipped", None, None)
+_scalar_types: frozenset = frozenset((int, float, str, bool, bytes, type(None)))
+
+# plain values ``from_bytes()`` loads without ``trusted_types``
+_builtin_types: frozenset = frozenset((
+    list, tuple, dict, set, frozenset, bytearray, complex, slice, range, type(None)
+))
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """
+    Loads only classes the snapshot writes: ``NotifyUpdated`` subclasses from
+    already imported modules, plain containers and the trusted types
+    """
+
+    def __init__(self, data: bytes, trusted_types: Iterable[type]):
+        super().__init__(io.BytesIO(data))
+        self._trusted_types: frozenset = _builtin_types | frozenset(trusted_types)
+
+    def find_class(self, module: str, name: str) -> Any:
+        # modules aren't imported while loading, so untrusted data can't run their code
+        found: Any = sys.modules.get(module)
+        for part in name.split("."):
+            found = getattr(found, part, None)
+
+        is_state_type: bool = isinstance(found, type) and (found is _State or issubclass(found, NotifyUpdated))
+        if not is_state_type and found not in self._trusted_types:
+            raise pickle.UnpicklingError(f"{module}.{name} isn't allowed in snapshots")
+
+        return found
+
+
+class Snapshot:
+    """
+    Values captured by ``snapshot()``, without observers, bindings and derived values
+
+    Values are captured shallowly: ``ObservableList`` and ``ObservableDict`` items
+    are copied, but other values are kept by reference. ``to_bytes()`` makes a compact
+    independent copy, classes of captured instances are stored by their import path
+
+    An instance reached several times, e.g. by a cycle, is captured once
+    and restored as the same instance
+    """
+
+    __slots__ = ("_state",)
+
+    def __init__(self, state: Any):
+        self._state: Any = state
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Snapshot) and self._state == other._state
+
+    def __repr__(self) -> str:
+        return f"<snapshot: {self._state!r}>"
+
+    def to_bytes(self) -> bytes:
+        return pickle.dumps(self._state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def from_bytes(data: bytes, trusted_types: Iterable[type] = ()) -> "Snapshot":
+        """
+        Loads the snapshot made by ``to_bytes()``. The data is a pickle, so only
+        ``NotifyUpdated`` subclasses of imported modules, builtin values and containers
+        are loaded, other classes raise ``pickle.UnpicklingError``. Still, load only
+        data from trusted sources: constructors of allowed classes are invoked by the data
+
+        :param data: bytes made by ``to_bytes()``
+        :param trusted_types: classes of other captured values, e.g. enums kept in observables
+        :return: new ``Snapshot`` instance
+        """
+
+        return Snapshot(_SnapshotUnpickler(data, trusted_types).load())
+
+    def restore(self, root: Any) -> Any:
+        """ The same as ``restore(root, snapshot)`` """
+
+        return restore(root, self)
+
+
+def snapshot(root: Any) -> Snapshot:
+    """
+    Captures values of the ``root`` state graph: ``Observable``, ``ObservableList``,
+    ``ObservableDict``, ``notify_property_dataclass`` instances and lists, tuples and dicts
+    of them, nested in any combination. Derived values, e.g. ``Computed``, are skipped
+
+    :param root: the root of the state graph
+    :return: captured values, which can be restored by ``restore()``
+    """
+
+    return Snapshot(_capture(root, {}, set()))
+
+
+def restore(root: Any, captured: Snapshot) -> Any:
+    """
+    Restores values of the ``root`` state graph from the snapshot, within a single
+    ``batch()`` scope. Instances are updated in place, only changed instances raise
+    their update event, once. Instances missing in the graph are created again
+
+    :param root: the root of the state graph captured before
+    :param captured: values to be restored
+    :return: the restored root, the same object if it's not replaced
+    """
+
+    with batch():
+        return _restored(root, captured._state, [])
+
+
+def _capture(value: Any, visited: Dict[int, int], containers: set) -> Any:
+    """
+    :param visited: ordinals of captured instances by their ids, in order of capture,
+    an instance captured again is stored as the reference to its ordinal
+    :param containers: ids of plain containers being captured
+    """
+
+    value_type: type = value.__class__
+    if value_type in _scalar_types:
+        return value
+
+    if isinstance(value, NotifyUpdated):
+        if isinstance(value, _derived_types):
+            return _skipped
+
+        key: int = id(value)
+        ordinal: int | None = visited.get(key)
+        if ordinal is not None:
+            return _State("reference", None, ordinal)
+
+        fields: tuple | None = getattr(value_type, "__notify_fields__", None)
+        if fields is not None:
+            visited[key] = len(visited)
+            payload: Dict = {name: _capture(getattr(value, name), visited, containers) for name in fields}
+            return _State("fields", value_type, payload)
+
+        if isinstance(value, ObservableList):
+            visited[key] = len(visited)
+            return _State("list", value_type, [_capture(item, visited, containers) for item in value._value])
+
+        if isinstance(value, ObservableDict):
+            visited[key] = len(visited)
+            payload = {item_key: _capture(item, visited, containers) for item_key, item in value._value.items()}
+            return _State("dict", value_type, payload)
+
+        if isinstance(value, Observable):
+            visited[key] = len(visited)
+            return _State("value", value_type, _capture(value._value, visited, containers))
+
+        return _skipped
+
+    if value_type is list or value_type is tuple or value_type is dict:
+        # plain containers are kept by reference if they don't contain instances,
+        # a container reached again through a cycle is kept by reference too
+        if id(value) in containers:
+            return value
+
+        containers.add(id(value))
+        try:
+            if value_type is dict:
+                captured: Dict = {key: _capture(item, visited, containers) for key, item in value.items()}
+                if any(item is not value[key] for key, item in captured.items()):
+                    return _State("plain_dict", dict, captured)
+            else:
+                items: List = [_capture(item, visited, containers) for item in value]
+                if any(item is not origin for item, origin in zip(items, value)):
+                    return _State("plain_list", value_type, items)
+        finally:
+            containers.discard(id(value))
+
+    return value
+
+
+def _restored(current: Any, state: Any, instances: List) -> Any:
+    """
+    :param instances: restored instances in order of capture, references are resolved by them
+    """
+
+    if state.__class__ is not _State:
+        return state
+
+    kind: str = state.kind
+    if kind == "skipped":
+        return current
+
+    if kind == "reference":
+        return instances[state.payload]
+
+    if kind == "plain_list":
+        old_items: List = [] if current.__class__ is not state.type else current
+        return state.type(
+            _restored(old_items[index] if index < len(old_items) else None, item, instances)
+            for index, item in enumerate(state.payload)
+        )
+
+    if kind == "plain_dict":
+        old_dict: Dict = current if current.__class__ is dict else {}
+        return {key: _restored(old_dict.get(key), item, instances) for key, item in state.payload.items()}
+
+    # missing instances are created empty and filled in place,
+    # so references to them from their own items are resolved
+    if current.__class__ is not state.type:
+        current = state.type(None) if kind == "value" else state.type()
+
+    instances.append(current)
+    if kind == "fields":
+        changed: Dict = {}
+        for name, item in state.payload.items():
+            old_value: Any = getattr(current, name)
+            new_value: Any = _restored(old_value, item, instances)
+            if new_value is not old_value:
+                changed[name] = new_value
+
+        current.update(**changed)
+        return current
+
+    if kind == "list":
+        old_items = current._value
+        items: List = [
+            _restored(old_items[index] if index < len(old_items) else None, item, instances)
+            for index, item in enumerate(state.payload)
+        ]
+
+        if items != current._value:
+            current[:] = items
+
+        return current
+
+    if kind == "dict":
+        old_dict = current._value
+        restored_dict: Dict = {
+            key: _restored(old_dict.get(key), item, instances) for key, item in state.payload.items()
+        }
+        changed_items: Dict = {
+            key: item for key, item in restored_dict.items()
+            if key not in old_dict or not (old_dict[key] is item or old_dict[key] == item)
+        }
+
+        for key in [key for key in old_dict if key not in restored_dict]:
+            del current[key]
+
+        if changed_items:
+            current.update(changed_items)
+
+        return current
+
+    # "value"
+    current.value = _restored(current._value, state.payload, instances)
+    return current
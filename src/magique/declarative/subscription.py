@@ -0,0 +1,113 @@
+from inspect import ismethod
+from typing import Callable, Any, Self
+from weakref import ref, WeakMethod
+
+
+Handler = Callable[[Any], Any]
+
+
+class ObserverTable(dict):
+    """
+    Subscriptions of a notifier mapped to their functions, ``None`` for weak ones
+
+    Event delivery iterates the table without copying, so the delivered table is frozen:
+    subscribing and unsubscribing replace it with a mutable copy, the copy is made
+    only by the first mutation after the event
+
+    ``opens_wave`` is set if derived nodes are subscribed, see ``attach_node()``,
+    events of other notifiers are delivered without propagation waves
+    """
+
+    __slots__ = ("is_frozen", "opens_wave")
+
+    def __init__(self, *args: Any, opens_wave: bool = False):
+        super().__init__(*args)
+        self.is_frozen: bool = False
+        self.opens_wave: bool = opens_wave
+
+
+def mutable_observers(notifier: Any) -> ObserverTable:
+    """ :return: the observer table of the notifier, which can be mutated in place """
+
+    observers: ObserverTable | None = notifier._observers
+    if observers is None:
+        observers = notifier._observers = ObserverTable()
+    elif observers.is_frozen:
+        observers = notifier._observers = ObserverTable(observers, opens_wave=observers.opens_wave)
+
+    return observers
+
+
+class Subscription:
+    """
+    A disposable token returned by ``attach_on_update()``, allows
+    to unsubscribe the function in O(1) via ``dispose()``
+
+    A weak subscription holds the function by weak reference (``WeakMethod`` for
+    bound methods), so the subscription doesn't keep the method owner alive.
+    When the function is collected, the subscription is removed on the next event
+
+    Supports ``with`` statement, disposing the subscription on exit
+    """
+
+    __slots__ = ("_notifier", "_callback", "_is_weak", "__weakref__")
+
+    def __init__(self, notifier: Any, callback: Handler, weak: bool = False):
+        self._notifier: Any = notifier
+        self._is_weak: bool = weak
+
+        if not weak:
+            self._callback: Any = callback
+        elif ismethod(callback):
+            self._callback: Any = WeakMethod(callback)
+        else:
+            self._callback: Any = ref(callback)
+
+    def __repr__(self) -> str:
+        return f"<Subscription: active={self.is_active}, weak={self._is_weak}, callback={self.callback!r}>"
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        self.dispose()
+        return False
+
+    @property
+    def callback(self) -> Handler | None:
+        """ Subscribed function, ``None`` if the weakly referenced function is collected """
+
+        return self._callback() if self._is_weak else self._callback
+
+    @property
+    def is_weak(self) -> bool:
+        return self._is_weak
+
+    @property
+    def is_active(self) -> bool:
+        """ Is the function still subscribed to the update event """
+
+        if self._notifier is None:
+            return False
+
+        observers = self._notifier._observers
+        return observers is not None and self in observers
+
+    def dispose(self) -> bool:
+        """
+        Unsubscribes the function from the update event
+
+        :return: ``True`` if the function was subscribed before
+        """
+
+        notifier: Any = self._notifier
+        if notifier is None:
+            return False
+
+        self._notifier = None
+        observers: ObserverTable | None = notifier._observers
+        if observers is None or self not in observers:
+            return False
+
+        del mutable_observers(notifier)[self]
+        return True
@@ -0,0 +1,94 @@
+import sys
+import time
+
+from heapq import heappush, heappop
+from itertools import count
+from threading import Thread, Condition
+from typing import Callable, List, Tuple, Any
+
+
+class TimerHandle:
+    """
+    The scheduled function of the shared timer, can be cancelled before invocation
+    """
+
+    __slots__ = ("deadline", "action", "is_cancelled")
+
+    def __init__(self, deadline: float, action: Callable[[], Any]):
+        self.deadline: float = deadline
+        self.action: Callable[[], Any] = action
+        self.is_cancelled: bool = False
+
+    def cancel(self) -> None:
+        self.is_cancelled = True
+
+
+class SharedTimer:
+    """
+    Invokes scheduled functions in a single daemon thread, started on the first
+    ``call_later()``, so any count of time-based operators costs one thread
+
+    Functions are invoked in order of their deadlines, a slow function
+    delays the following ones, so functions have to be short
+    """
+
+    def __init__(self, name: str = "magique-timer"):
+        self.name: str = name
+        self._condition: Condition = Condition()
+        self._queue: List[Tuple[float, int, TimerHandle]] = []
+        self._sequence = count()
+        self._thread: Thread | None = None
+
+    @property
+    def pending_count(self) -> int: return len(self._queue)
+
+    def call_later(self, delay_seconds: float, action: Callable[[], Any]) -> TimerHandle:
+        """
+        Schedules the function to be invoked in the timer thread
+
+        :param delay_seconds: the time to wait before the invocation
+        :param action: a function without parameters
+        :return: the handle to cancel the invocation
+        """
+
+        handle: TimerHandle = TimerHandle(time.monotonic() + delay_seconds, action)
+        with self._condition:
+            heappush(self._queue, (handle.deadline, next(self._sequence), handle))
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+            # the new deadline may be earlier than the one the thread is waiting for
+            self._condition.notify()
+
+        return handle
+
+    def _next_handle(self) -> TimerHandle:
+        with self._condition:
+            while True:
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+
+                remaining: float = self._queue[0][0] - time.monotonic()
+                if remaining <= 0:
+                    return heappop(self._queue)[2]
+
+                self._condition.wait(remaining)
+
+    def _run(self) -> None:
+        while True:
+            handle: TimerHandle = self._next_handle()
+            if handle.is_cancelled:
+                continue
+
+            try:
+                handle.action()
+            except Exception as error:
+                sys.excepthook(type(error), error, error.__traceback__)
+
+
+shared_timer: SharedTimer = SharedTimer()
+"""
+The timer of all time-based operators
+"""
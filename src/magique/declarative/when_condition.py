@@ -1,5 +1,6 @@
 from typing import List, Callable, Any, Iterable
 from .notify_updated import NotifyUpdated
+from .propagation import schedule, height_of, height_above, attach_node
 
 
 class WhenCondition:
@@ -30,9 +31,10 @@ class WhenCondition:
         self.is_active: bool = True
         self.max_activation_count: int | None = max_activation_count
         self.done_activations: int = 0
+        self.propagation_height: int = height_above(self.observables)
 
         for observable in self.observables:
-            observable.attach_on_update(self.observables_handler)
+            attach_node(observable, self.observables_handler)
 
     def add_observable(self, observable: NotifyUpdated):
         """
@@ -41,7 +43,8 @@ class WhenCondition:
         """
 
         self.observables.append(observable)
-        observable.attach_on_update(self.observables_handler)
+        self.propagation_height = max(self.propagation_height, height_of(observable) + 1)
+        attach_node(observable, self.observables_handler)
 
     def remove_observable(self, observable: NotifyUpdated):
         """
@@ -56,10 +59,14 @@ class WhenCondition:
         """
         Service method is subscribed to all using ``NotifyUpdated``  updates
 
-        Checks ``is_active`` state and activation count limits, before
-        handlers invokation
+        Schedules conditions checking to the end of the propagation wave, so
+        conditions are checked once when several observables are updated together
         """
 
+        schedule(self, self.propagation_height, self._check_conditions)
+
+    def _check_conditions(self) -> None:
+        # checks ``is_active`` state and activation count limits, before handlers invokation
         if not self.is_active:
             return
 
@@ -5,6 +5,8 @@ import keyboard
 
 
 class MagiqueKey(NotifyUpdated):
+    __slots__ = ("pyguiauto_string", "canonical_string")
+
     def __init__(self, pyautogui_string: str, canonical_string: str):
         super().__init__()
         self.pyguiauto_string: str = pyautogui_string
@@ -18,12 +20,16 @@ class MagiqueKey(NotifyUpdated):
 
 
 class CrossPlatformKey(MagiqueKey):
+    __slots__ = ()
+
     def __init__(self, win_or_linux_key: MagiqueKey, macos_key: MagiqueKey):
         initializer: MagiqueKey = macos_key if sys.platform == "darwin" else win_or_linux_key
         super().__init__(initializer.pyguiauto_string, initializer.canonical_string)
 
 
 class AnyKey(MagiqueKey):
+    __slots__ = ("pressed",)
+
     def __init__(self):
         super().__init__("", "")
         self.pressed: bool = False
@@ -36,6 +42,7 @@ class AnyKey(MagiqueKey):
 
 
 class OneOfKeys(MagiqueKey):
+    __slots__ = ("keys",)
     redirect_dict: Dict[MagiqueKey, List[Self]] = {}
 
     # noinspection PyTypeChecker
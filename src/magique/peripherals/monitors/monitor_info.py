@@ -1,7 +1,7 @@
 from screeninfo import Monitor
 from typing import List, Final, Any
 
-from ...declarative import NotifyUpdated, ObservableList, notify_property_updated
+from ...declarative import NotifyUpdated, ObservableList, notify_property_updated, notify_property
 
 
 class MonitorInfo(NotifyUpdated):
@@ -14,53 +14,18 @@ class MonitorInfo(NotifyUpdated):
         self._name: str = info.name
         self._is_primary: bool = info.is_primary
 
+    x = notify_property("x")
+    y = notify_property("y")
+    width = notify_property("width")
+    height = notify_property("height")
+    name = notify_property("name")
+    is_primary = notify_property("is_primary")
+
     def is_cursor_inside(self, position_x: int, position_y: int) -> bool:
         inside_x: bool = self.x <= position_x < self.x + self.width
         inside_y: bool = self.y <= position_y < self.y + self.height
         return inside_x and inside_y
 
-    @property
-    def x(self) -> int: return self._x
-
-    @x.setter
-    @notify_property_updated(lambda self: self._x)
-    def x(self, new_x: int): self._x = new_x
-
-    @property
-    def y(self) -> int: return self._y
-
-    @y.setter
-    @notify_property_updated(lambda self: self._y)
-    def y(self, new_y: int): self._y = new_y
-
-    @property
-    def width(self) -> int: return self._width
-
-    @width.setter
-    @notify_property_updated(lambda self: self._width)
-    def width(self, new_width: int): self._width = new_width
-
-    @property
-    def height(self) -> int: return self._height
-
-    @height.setter
-    @notify_property_updated(lambda self: self._height)
-    def height(self, new_height: int): self._height = new_height
-
-    @property
-    def name(self) -> str: return self._name
-
-    @name.setter
-    @notify_property_updated(lambda self: self._name)
-    def name(self, new_name: str): self._name = new_name
-
-    @property
-    def is_primary(self) -> bool: return self._is_primary
-
-    @is_primary.setter
-    @notify_property_updated(lambda self: self._is_primary)
-    def is_primary(self, new_is_primary: bool): self._is_primary = new_is_primary
-
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, MonitorInfo):
             return False
@@ -7,6 +7,8 @@ ButtonType = Literal["left", "right", "middle", "wheel"]
 
 
 class MagiqueMouseButton(NotifyUpdated):
+    __slots__ = ("button",)
+
     def __init__(self, button_name: ButtonType):
         super().__init__()
         self.button = button_name
@@ -19,6 +21,8 @@ class MagiqueMouseButton(NotifyUpdated):
 
 
 class AnyMouseButton(MagiqueMouseButton):
+    __slots__ = ("pressed",)
+
     def __init__(self):
         super().__init__("left")
         self.pressed: bool = False
@@ -31,6 +35,7 @@ class AnyMouseButton(MagiqueMouseButton):
 
 
 class OneOfMouseButtons(MagiqueMouseButton):
+    __slots__ = ("buttons",)
     redirect_dict: Dict[MagiqueMouseButton, List[Self]] = {}
 
     # noinspection PyTypeChecker
@@ -0,0 +1,55 @@
+from typing import List
+
+from src.magique.declarative import Observable, BindingGroup, Converter
+
+
+class TestBindingGroup:
+    def test_fan_out(self, observable_int: Observable[int]):
+        destinations = [Observable("") for _ in range(10)]
+        BindingGroup(observable_int, destinations, str, apply_immediately=True)
+        assert all(destination.value == "100" for destination in destinations)
+
+        observable_int.value = 5
+        assert all(destination.value == "5" for destination in destinations)
+        assert observable_int.observers_count == 1
+
+    def test_shared_conversion(self, observable_int: Observable[int], target_list: List):
+        converter = Converter(lambda v: target_list.append(v) or v * 2, lambda v: v // 2)
+        destinations = [Observable(0) for _ in range(100)]
+        BindingGroup(observable_int, destinations, converter)
+
+        observable_int.value = 21
+        assert target_list == [21]
+        assert destinations[-1].value == 42
+
+    def test_enable_disable(self, observable_int: Observable[int]):
+        destination: Observable[int] = Observable(0)
+        group = BindingGroup(observable_int, [destination])
+
+        group.disable()
+        observable_int.value = 1
+        assert destination.value == 0
+        assert not group.is_enabled
+
+        group.enable()
+        observable_int.value = 2
+        assert destination.value == 2
+
+    def test_add_remove(self, observable_int: Observable[int]):
+        first, second = Observable(0), Observable(0)
+        group = BindingGroup(observable_int, [first])
+        group.add(second)
+        group.remove(first)
+
+        observable_int.value = 3
+        assert (first.value, second.value) == (0, 3)
+
+    def test_dispose(self, observable_int: Observable[int]):
+        destination: Observable[int] = Observable(0)
+        group = BindingGroup(observable_int, [destination])
+
+        group.dispose()
+        observable_int.value = 4
+        assert destination.value == 0
+        assert group.destinations == []
+        assert observable_int.observers_count == 0
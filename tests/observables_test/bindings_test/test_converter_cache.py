@@ -0,0 +1,62 @@
+import pytest
+from typing import List
+
+from src.magique.declarative import Observable, Binding, BindingMode, Converter
+
+
+class TestConverterCache:
+    def test_lru(self, target_list: List):
+        converter = Converter(lambda v: target_list.append(v) or str(v), int, cache_size=2)
+
+        assert [converter.convert(v) for v in (1, 2, 1, 3, 2)] == ["1", "2", "1", "3", "2"]
+        assert target_list == [1, 2, 3, 2]
+        assert (converter.hits, converter.misses) == (1, 4)
+
+        converter.cache_clear()
+        assert (converter.hits, converter.misses) == (0, 0)
+
+    def test_typed_keys(self):
+        converter = Converter(repr, eval, cache_size=4)
+        assert (converter.convert(1), converter.convert(True), converter.convert(1.0)) == ("1", "True", "1.0")
+
+    def test_unhashable(self):
+        converter = Converter(len, lambda v: [None] * v, cache_size=4)
+        assert converter.convert([1, 2]) == 2
+        assert converter.convert([1, 2]) == 2
+        assert (converter.hits, converter.misses) == (0, 2)
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            Converter(str, int, cache_size=-1)
+
+    def test_two_way_skips_convert_back(self, target_list: List):
+        source: Observable[int] = Observable(0)
+        destination: Observable[str] = Observable("")
+        converter = Converter(str, lambda v: target_list.append(v) or int(v), cache_size=8, bijective=True)
+        Binding(source, destination, BindingMode.two_way, converter)
+
+        source.value = 5
+        source.value = 6
+        destination.value = "5"
+        assert source.value == 5
+        assert target_list == []
+
+        destination.value = "7"
+        assert source.value == 7
+        assert target_list == ["7"]
+
+    def test_non_bijective_round_trip(self):
+        source: Observable[int] = Observable(1)
+        destination: Observable[str] = Observable("1")
+        Binding(source, destination, BindingMode.two_way, Converter(str, int, cache_size=8))
+
+        destination.value = "01"
+        source.value = 2
+        source.value = 1
+        assert destination.value == "1"
+
+    def test_non_bijective_convert_back(self):
+        converter = Converter(str.lower, lambda v: v, cache_size=8)
+
+        assert converter.convert("ABC") == "abc"
+        assert converter.convert_back("abc") == "abc"
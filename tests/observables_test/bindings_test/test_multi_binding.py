@@ -0,0 +1,61 @@
+from typing import List
+
+from src.magique.declarative import Observable, MultiBinding, batch, dependency_graph
+
+
+class TestMultiBinding:
+    def test_aggregates_sources(self):
+        width, height, area = Observable(2), Observable(3), Observable(0)
+        MultiBinding([width, height], area, lambda w, h: w * h, apply_immediately=True)
+        assert area.value == 6
+
+        width.value = 4
+        assert area.value == 12
+
+    def test_once_per_batch(self, target_list: List):
+        sources = [Observable(0) for _ in range(5)]
+        total = Observable(0)
+
+        def summarize(*values: int) -> int:
+            target_list.append(values)
+            return sum(values)
+
+        MultiBinding(sources, total, summarize)
+        with batch():
+            for index, source in enumerate(sources):
+                source.value = index + 1
+
+        assert total.value == 15
+        assert target_list == [(1, 2, 3, 4, 5)]
+
+    def test_source_updated_by_handler(self):
+        first, second, destination = Observable(1), Observable(10), Observable(0)
+        MultiBinding([first, second], destination, lambda *values: sum(values))
+        first.attach_on_update(lambda v: setattr(second, "value", first.value * 100))
+
+        first.value = 2
+        assert destination.value == 202
+
+    def test_source_updated_after_apply(self):
+        first, second, destination = Observable(1), Observable(10), Observable(0)
+        MultiBinding([first, second], destination, lambda *values: sum(values))
+        destination.attach_on_update(lambda v: setattr(second, "value", 20))
+
+        first.value = 2
+        assert destination.value == 22
+
+    def test_dispose(self):
+        source, destination = Observable(1), Observable(0)
+        multi_binding = MultiBinding([source], destination, lambda v: v * 10)
+
+        multi_binding.dispose()
+        source.value = 2
+        assert destination.value == 0
+
+    def test_graph_edges(self):
+        first, second, destination = Observable(1), Observable(2), Observable(0)
+        multi_binding = MultiBinding([first, second], destination, max)
+
+        graph = dependency_graph(first, second)
+        assert graph.cascade(id(first)) == (2, 2)
+        assert graph.fan_out(id(multi_binding)) == 1
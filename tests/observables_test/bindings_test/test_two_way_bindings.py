@@ -83,3 +83,75 @@ class TestTwoWayBindingMode:
 
         assert observable_str.value == str_value_before_binding
         assert observable_int.value == int_value_before_binding
+
+
+class TestTwoWayPropagation:
+    def test_no_echo_conversion(self, observable_int: Observable[int], observable_str: Observable[str]):
+        calls = []
+        converter = Converter(
+            lambda v: calls.append("convert") or str(v),
+            lambda v: calls.append("convert_back") or int(v)
+        )
+
+        Binding(observable_int, observable_str, BindingMode.two_way, converter)
+        observable_int.value = 7
+        assert calls == ["convert"]
+
+    def test_ring_terminates(self):
+        first, second, third = Observable(0), Observable(0), Observable(0)
+        calls = []
+
+        # lossy converters never reach a fixed point, the ring has to be cut
+        def increment(v: int) -> int:
+            calls.append(v)
+            return v + 1
+
+        Binding(first, second, BindingMode.two_way, (increment, increment))
+        Binding(second, third, BindingMode.two_way, (increment, increment))
+        Binding(third, first, BindingMode.two_way, (increment, increment))
+
+        first.value = 1
+        assert (first.value, second.value, third.value) == (4, 2, 3)
+        assert len(calls) == 3
+
+    def test_chain_applies_each_binding_once(self):
+        observables = [Observable(0) for _ in range(20)]
+        calls = []
+        for left, right in zip(observables, observables[1:]):
+            Binding(left, right, BindingMode.two_way, (lambda v: calls.append(v) or v, lambda v: calls.append(v) or v))
+
+        observables[10].value = 5
+        assert all(observable.value == 5 for observable in observables)
+        assert len(calls) == 19
+
+    def test_several_updates_in_one_wave(self):
+        a, b, c = Observable(0), Observable(0), Observable(0)
+        Binding(b, c, BindingMode.two_way)
+
+        def update_b(value: int) -> None:
+            b.value = value
+            b.value = value + 1
+
+        a.attach_on_update(update_b)
+        a.value = 1
+        assert (b.value, c.value) == (2, 2)
+
+    def test_concurrent_propagations(self):
+        from threading import Thread
+
+        pairs = [(Observable(0), Observable(0)) for _ in range(4)]
+        for left, right in pairs:
+            Binding(left, right, BindingMode.two_way)
+
+        def update(observable: Observable[int]) -> None:
+            for value in range(1, 2001):
+                observable.value = value
+
+        threads = [Thread(target=update, args=(left,)) for left, _ in pairs]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert all(right.value == 2000 for _, right in pairs)
@@ -0,0 +1,97 @@
+import time
+import asyncio
+import pytest
+
+from src.magique.declarative import Observable, Binding, BindingMode, UpdateTrigger, batch
+
+
+class TestExplicitTrigger:
+    def test_flush(self, observable_int: Observable[int]):
+        destination: Observable[int] = Observable(0)
+        binding = Binding(observable_int, destination, update_trigger=UpdateTrigger.explicit)
+
+        observable_int.value = 1
+        observable_int.value = 2
+        assert destination.value == 0
+        assert binding.pending_count == 1
+
+        assert binding.flush()
+        assert not binding.flush()
+        assert destination.value == 2
+        assert (binding.delivered_count, binding.coalesced_count) == (1, 1)
+
+    def test_two_way_no_echo(self, observable_int: Observable[int]):
+        destination: Observable[int] = Observable(0)
+        binding = Binding(
+            observable_int, destination, BindingMode.two_way,
+            converter=(lambda v: v * 2, lambda v: v // 2),
+            update_trigger=UpdateTrigger.explicit
+        )
+
+        destination.value = 10
+        binding.flush()
+        assert observable_int.value == 5
+        assert binding.pending_count == 0
+
+    def test_dropped_on_dispose(self, observable_int: Observable[int]):
+        destination: Observable[int] = Observable(0)
+        binding = Binding(observable_int, destination, update_trigger=UpdateTrigger.explicit)
+
+        observable_int.value = 1
+        binding.dispose()
+        assert not binding.flush()
+        assert binding.dropped_count == 1
+        assert destination.value == 0
+
+
+class TestDeferredTrigger:
+    def test_once_per_batch(self, observable_int: Observable[int]):
+        destination: Observable[int] = Observable(0)
+        binding = Binding(observable_int, destination, update_trigger=UpdateTrigger.deferred)
+        updates = []
+        destination.attach_on_update(updates.append)
+
+        with batch():
+            observable_int.value = 1
+            observable_int.value = 2
+            observable_int.value = 3
+
+        assert updates == [3]
+        assert binding.delivered_count == 1
+
+        observable_int.value = 4
+        assert updates == [3, 4]
+
+    def test_event_loop_turn(self, observable_int: Observable[int]):
+        destination: Observable[int] = Observable(0)
+        Binding(observable_int, destination, update_trigger=UpdateTrigger.deferred)
+
+        async def update() -> int:
+            observable_int.value = 1
+            observable_int.value = 2
+            assert destination.value == 0
+
+            await asyncio.sleep(0)
+            return destination.value
+
+        assert asyncio.run(update()) == 2
+
+
+class TestRateLimitedTrigger:
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            UpdateTrigger.rate_limited(0)
+
+    def test_latest_value_delivered(self, observable_int: Observable[int]):
+        destination: Observable[int] = Observable(0)
+        binding = Binding(observable_int, destination, update_trigger=UpdateTrigger.rate_limited(20))
+
+        for i in range(1, 11):
+            observable_int.value = i
+
+        assert destination.value == 1
+        time.sleep(0.2)
+
+        assert destination.value == 10
+        assert binding.delivered_count == 2
+        assert binding.coalesced_count == 8
@@ -0,0 +1,75 @@
+import asyncio
+from threading import Thread
+from typing import List
+
+import pytest
+
+from src.magique.declarative import Observable
+
+
+class TestAsyncObserving:
+    def test_changed(self, observable_int: Observable[int]):
+        async def main() -> int:
+            asyncio.get_running_loop().call_soon(setattr, observable_int, "value", 42)
+            return await observable_int.changed()
+
+        assert asyncio.run(main()) == 42
+        assert observable_int.observers_count == 0
+
+    def test_changed_from_thread(self, observable_int: Observable[int]):
+        async def main() -> int:
+            thread = Thread(target=setattr, args=(observable_int, "value", 7))
+            asyncio.get_running_loop().call_soon(thread.start)
+            return await observable_int.changed()
+
+        assert asyncio.run(main()) == 7
+
+    def test_values(self, observable_int: Observable[int], target_list: List):
+        async def main():
+            async with observable_int.values() as updates:
+                observable_int.value = 1
+                target_list.append(await anext(updates))
+
+                observable_int.value = 2
+                observable_int.value = 3
+                target_list.append(await anext(updates))
+
+        asyncio.run(main())
+        assert target_list == [1, 3]
+        assert observable_int.observers_count == 0
+
+    def test_values_stopped_on_close(self, observable_int: Observable[int], target_list: List):
+        async def main():
+            updates = observable_int.values()
+            asyncio.get_running_loop().call_soon(updates.close)
+            async for value in updates:
+                target_list.append(value)
+
+        asyncio.run(main())
+        assert target_list == []
+
+    def test_coroutine_observer(self, observable_int: Observable[int], target_list: List):
+        async def on_update(value: int) -> None:
+            await asyncio.sleep(0)
+            target_list.append(value)
+
+        async def main():
+            observable_int.attach_on_update(on_update)
+            observable_int.value = 1
+
+            thread = Thread(target=setattr, args=(observable_int, "value", 2))
+            thread.start()
+            thread.join()
+
+            await asyncio.sleep(0.05)
+            observable_int.detach_on_update(on_update)
+
+        asyncio.run(main())
+        assert target_list == [1, 2]
+        assert observable_int.observers_count == 0
+
+    def test_coroutine_observer_needs_loop(self, observable_int: Observable[int]):
+        async def on_update(value: int) -> None: pass
+
+        with pytest.raises(RuntimeError):
+            observable_int.attach_on_update(on_update)
@@ -0,0 +1,91 @@
+import pytest
+from threading import Thread
+from typing import List
+
+from src.magique.declarative import Observable, ObservableList, batch, is_batching
+
+
+class TestBatchScope:
+    def test_single_event_with_final_value(self, observable_int: Observable[int], target_list: List):
+        observable_int.attach_on_update(lambda v: target_list.append(v))
+
+        with batch():
+            for value in range(20):
+                observable_int.value = value
+
+            assert target_list == []
+
+        assert target_list == [19]
+
+    def test_nested_scopes(self, observable_int: Observable[int], target_list: List):
+        observable_int.attach_on_update(lambda v: target_list.append(v))
+
+        with batch():
+            with batch():
+                observable_int.value = 1
+
+            assert is_batching()
+            assert target_list == []
+            observable_int.value = 2
+
+        assert not is_batching()
+        assert target_list == [2]
+
+    def test_multiple_observables(
+            self,
+            observable_int: Observable[int],
+            observable_list: ObservableList,
+            target_list: List):
+
+        observable_int.attach_on_update(lambda v: target_list.append("int"))
+        observable_list.attach_on_update(lambda v: target_list.append("list"))
+
+        with batch():
+            observable_list.append(1)
+            observable_int.value = 5
+            observable_list.extend([2, 3])
+
+        assert target_list == ["list", "int"]
+        assert observable_list.value == [1, 2, 3]
+
+    def test_decorator(self, observable_int: Observable[int], target_list: List):
+        observable_int.attach_on_update(lambda v: target_list.append(v))
+
+        @batch
+        def update_many():
+            observable_int.value = 1
+            observable_int.value = 2
+
+        update_many()
+        assert target_list == [2]
+
+    def test_other_threads_are_not_deferred(self, observable_int: Observable[int], target_list: List):
+        observable_int.attach_on_update(lambda v: target_list.append(v))
+
+        def update_from_thread():
+            observable_int.value = 7
+
+        with batch():
+            thread = Thread(target=update_from_thread)
+            thread.start()
+            thread.join()
+            assert target_list == [7]
+
+        assert target_list == [7]
+
+    def test_failing_handler_doesnt_lose_events(self, target_list: List):
+        first, second = Observable(0), Observable(0)
+
+        def fail(value: int) -> None:
+            raise ValueError(value)
+
+        first.attach_on_update(fail)
+        second.attach_on_update(target_list.append)
+
+        with pytest.raises(ValueError):
+            with batch():
+                first.value = 1
+                second.value = 2
+
+        assert target_list == [2]
+        assert not is_batching()
@@ -0,0 +1,92 @@
+from typing import List
+
+from src.magique.declarative import Observable, ObservableList, Computed, computed, notify_property_dataclass
+
+
+@notify_property_dataclass
+class Point:
+    x: int
+    y: int
+
+
+class TestComputedValue:
+    def test_lazy_calculation(self, observable_int: Observable[int], target_list: List):
+        def double() -> int:
+            target_list.append(True)
+            return observable_int.value * 2
+
+        doubled: Computed[int] = computed(double)
+        assert target_list == []
+
+        assert doubled.value == 200
+        assert doubled.value == 200
+        assert target_list == [True]
+
+        observable_int.value = 5
+        observable_int.value = 6
+        assert doubled.is_dirty
+        assert target_list == [True]
+
+        assert doubled.value == 12
+        assert target_list == [True, True]
+
+    def test_observed_recalculation(self, observable_int: Observable[int], target_list: List):
+        doubled: Computed[int] = computed(lambda: observable_int.value * 2)
+        doubled.attach_on_update(lambda v: target_list.append(v))
+
+        observable_int.value = 5
+        observable_int.value = 5
+        observable_int.value = 6
+
+        assert target_list == [10, 12]
+
+    def test_retracking(self, observable_int: Observable[int], observable_str: Observable[str], target_list: List):
+        flag: Observable[bool] = Observable(True)
+
+        @computed
+        def selected() -> int | str:
+            return observable_int.value if flag.value else observable_str.value
+
+        selected.attach_on_update(lambda v: target_list.append(v))
+        assert selected.dependencies_count == 2
+
+        flag.value = False
+        assert selected.dependencies_count == 2
+        assert observable_int.observers_count == 0
+
+        observable_int.value = 1
+        observable_str.value = "hello"
+        assert target_list == ["500", "hello"]
+
+    def test_chain(self, observable_int: Observable[int], target_list: List):
+        plus_one: Computed[int] = computed(lambda: observable_int.value + 1)
+        times_two: Computed[int] = computed(lambda: plus_one.value * 2)
+        times_two.attach_on_update(lambda v: target_list.append(v))
+
+        observable_int.value = 1
+        assert target_list == [4]
+
+    def test_list_reads(self, observable_list: ObservableList, target_list: List):
+        total: Computed[int] = computed(lambda: sum(observable_list))
+        total.attach_on_update(lambda v: target_list.append(v))
+
+        observable_list.append(5)
+        observable_list.extend([1, 2])
+        assert target_list == [5, 8]
+
+    def test_dataclass_property_reads(self, target_list: List):
+        point = Point(1, 2)
+        x_squared: Computed[int] = computed(lambda: point.x ** 2)
+        x_squared.attach_on_update(lambda v: target_list.append(v))
+
+        point.y = 10
+        point.x = 3
+        assert target_list == [9]
+
+    def test_dispose(self, observable_int: Observable[int]):
+        doubled: Computed[int] = computed(lambda: observable_int.value * 2)
+        doubled.attach_on_update(lambda v: v)
+        doubled.dispose()
+
+        assert observable_int.observers_count == 0
+        assert doubled.is_dirty
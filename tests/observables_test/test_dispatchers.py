@@ -0,0 +1,108 @@
+import asyncio
+import time
+from threading import current_thread, Event
+from typing import List
+
+from src.magique.declarative import (
+    Observable,
+    InlineDispatcher,
+    ThreadDispatcher,
+    ThreadPoolDispatcher,
+    AsyncioDispatcher,
+    set_default_dispatcher
+)
+
+
+def wait_until_delivered(dispatcher, count: int, timeout: float = 2.0) -> None:
+    deadline: float = time.monotonic() + timeout
+    while dispatcher.dispatched_count < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class TestDispatchers:
+    def test_inline(self, observable_int: Observable[int], target_list: List):
+        dispatcher = InlineDispatcher()
+        observable_int.dispatcher = dispatcher
+        observable_int.attach_on_update(lambda v: target_list.append(v))
+
+        observable_int.value = 1
+        assert target_list == [1]
+        assert dispatcher.dispatched_count == 1
+
+    def test_thread_keeps_order(self, observable_int: Observable[int], target_list: List):
+        dispatcher = ThreadDispatcher()
+        observable_int.dispatcher = dispatcher
+        observable_int.attach_on_update(lambda v: target_list.append((v, current_thread().name)))
+
+        for value in range(50):
+            observable_int.value = value
+
+        wait_until_delivered(dispatcher, 50)
+        dispatcher.shutdown()
+
+        assert [value for value, _ in target_list] == list(range(50))
+        assert {name for _, name in target_list} == {"magique-dispatcher"}
+
+    def test_slow_handler_does_not_block(self, observable_int: Observable[int]):
+        dispatcher = ThreadDispatcher()
+        release = Event()
+        observable_int.dispatcher = dispatcher
+        observable_int.attach_on_update(lambda v: release.wait(2))
+
+        started: float = time.monotonic()
+        for value in range(5):
+            observable_int.value = value
+
+        assert time.monotonic() - started < 0.5
+        assert dispatcher.queue_depth >= 4
+        assert dispatcher.max_queue_depth >= 4
+
+        release.set()
+        wait_until_delivered(dispatcher, 5)
+        dispatcher.shutdown()
+        assert dispatcher.queue_depth == 0
+
+    def test_thread_pool_keeps_order_per_observable(self, target_list: List):
+        dispatcher = ThreadPoolDispatcher(workers_count=3)
+        observables: List[Observable[int]] = [Observable(-1) for _ in range(6)]
+        results = {i: [] for i in range(6)}
+
+        for i, observable in enumerate(observables):
+            observable.dispatcher = dispatcher
+            observable.attach_on_update(lambda v, i=i: results[i].append(v))
+
+        for value in range(20):
+            for observable in observables:
+                observable.value = value
+
+        wait_until_delivered(dispatcher, 120)
+        dispatcher.shutdown()
+        assert all(values == list(range(20)) for values in results.values())
+
+    def test_asyncio_loop(self, observable_int: Observable[int], target_list: List):
+        async def main():
+            observable_int.dispatcher = AsyncioDispatcher(asyncio.get_running_loop())
+            observable_int.attach_on_update(lambda v: target_list.append(v))
+
+            observable_int.value = 1
+            assert target_list == []
+
+            await asyncio.sleep(0)
+            assert target_list == [1]
+
+        asyncio.run(main())
+
+    def test_default_dispatcher(self, observable_int: Observable[int], target_list: List):
+        dispatcher = ThreadDispatcher()
+        observable_int.attach_on_update(lambda v: target_list.append(v))
+
+        set_default_dispatcher(dispatcher)
+        try:
+            observable_int.value = 1
+            wait_until_delivered(dispatcher, 1)
+        finally:
+            set_default_dispatcher(None)
+            dispatcher.shutdown()
+
+        assert target_list == [1]
+        assert dispatcher.dispatched_count == 1
@@ -0,0 +1,105 @@
+from typing import List, Any
+from src.magique.declarative import (
+    Observable,
+    computed,
+    identity_equals,
+    value_equals,
+    array_equals,
+    versioned
+)
+
+
+class ElementWise:
+    """ Imitates arrays, which ``==`` returns element-wise result """
+
+    def __init__(self, *items: int):
+        self.items: List[int] = list(items)
+
+    def __eq__(self, other: Any) -> Any:
+        if not isinstance(other, ElementWise) or len(other.items) != len(self.items):
+            return False
+
+        return ElementWise(*[int(a == b) for a, b in zip(self.items, other.items)])
+
+    def __bool__(self) -> bool:
+        raise ValueError("the truth value of an element-wise result is ambiguous")
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+class Document:
+    def __init__(self, version: int, text: str):
+        self.version: int = version
+        self.text: str = text
+
+
+class TestStrategies:
+    def test_identity_equals(self):
+        assert identity_equals(None, None)
+        assert not identity_equals([1], [1])
+
+    def test_value_equals(self):
+        assert value_equals([1, 2], [1, 2])
+        assert not value_equals(1, 2)
+
+    def test_element_wise_values(self):
+        assert not value_equals(ElementWise(1, 2), ElementWise(1, 3))
+        assert not array_equals(ElementWise(1, 2), ElementWise(1, 2, 3))
+
+    def test_versioned(self):
+        by_attribute = versioned()
+        assert by_attribute(Document(1, "a"), Document(1, "b"))
+        assert not by_attribute(Document(1, "a"), Document(2, "a"))
+
+        by_function = versioned(lambda document: document.text)
+        assert by_function(Document(1, "a"), Document(2, "a"))
+
+
+class TestObservableEquality:
+    def test_identity_equals(self, target_list: List):
+        observable: Observable[List[int]] = Observable([1, 2], identity_equals)
+        observable.attach_on_update(target_list.append)
+
+        observable.value = [1, 2]
+        observable.value = observable.value
+        assert target_list == [[1, 2]]
+
+    def test_element_wise_value(self, target_list: List):
+        observable: Observable[ElementWise] = Observable(ElementWise(1, 2))
+        observable.attach_on_update(target_list.append)
+
+        observable.value = ElementWise(1, 3)
+        assert len(target_list) == 1
+
+    def test_versioned_value(self, target_list: List):
+        observable: Observable[Document] = Observable(Document(1, "a"), versioned())
+        observable.attach_on_update(lambda document: target_list.append(document.text))
+
+        observable.value = Document(1, "b")
+        observable.value = Document(2, "c")
+        assert target_list == ["c"]
+
+    def test_forced_set(self, observable_int: Observable[int], target_list: List):
+        observable_int.attach_on_update(target_list.append)
+
+        assert not observable_int.set(100)
+        assert observable_int.set(100, force=True)
+        assert target_list == [100]
+
+    def test_in_place_mutation(self, target_list: List):
+        items: List[int] = [1, 2]
+        observable: Observable[List[int]] = Observable(items, identity_equals)
+        observable.attach_on_update(target_list.append)
+
+        items.append(3)
+        observable.set(items, force=True)
+        assert target_list == [[1, 2, 3]]
+
+    def test_computed_equals(self, observable_int: Observable[int], target_list: List):
+        parity = computed(equals=lambda a, b: a % 2 == b % 2)(lambda: observable_int.value)
+        parity.attach_on_update(target_list.append)
+
+        observable_int.value = 102
+        observable_int.value = 103
+        assert target_list == [103]
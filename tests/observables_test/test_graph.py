@@ -0,0 +1,93 @@
+import json
+from typing import List
+
+from src.magique.declarative import (
+    Observable,
+    Binding,
+    BindingMode,
+    WhenCondition,
+    computed,
+    dependency_graph,
+    enable_instrumentation,
+    disable_instrumentation,
+    reset_stats
+)
+
+
+class TestDependencyGraph:
+    def test_binding_chain(self, target_list: List):
+        first, second, third = Observable(1), Observable(2), Observable(3)
+        Binding(first, second)
+        Binding(second, third)
+        third.attach_on_update(target_list.append)
+
+        graph = dependency_graph(first)
+        assert len(graph.nodes) == 4
+        assert graph.cascade(id(first)) == (3, 3)
+        assert graph.fan_out(id(first)) == 1
+        assert [edge.via for edge in graph.edges] == ["Binding(send)", "Binding(send)", "handler"]
+
+    def test_two_way_binding_cycle(self):
+        first, second = Observable(1), Observable(2)
+        Binding(first, second, BindingMode.two_way)
+
+        graph = dependency_graph(first)
+        assert len(graph.edges) == 2
+        assert graph.cascade_size(id(first)) == 1
+
+    def test_binding_targets(self):
+        first, second = Observable(1), Observable(2)
+        binding = Binding(first, second, BindingMode.two_way)
+        to_second, to_first = binding._subscriptions
+
+        assert (binding.target_of(to_second), binding.target_of(to_first)) == (second, first)
+        assert binding.target_of(first.attach_on_update(lambda value: None)) is None
+
+        graph = dependency_graph(first)
+        bound = {(edge.source, edge.target) for edge in graph.edges if edge.via == "Binding(two_way)"}
+        assert bound == {(id(first), id(second)), (id(second), id(first))}
+
+    def test_derived_nodes(self, observable_int: Observable[int]):
+        doubled = computed(lambda: observable_int.value * 2)
+        doubled.attach_on_update(lambda value: None)
+        WhenCondition([observable_int, doubled], [lambda: True], [lambda: None])
+
+        graph = dependency_graph(observable_int)
+        kinds = sorted(node.kind for node in graph.nodes.values())
+        assert kinds == ["Computed", "Observable", "WhenCondition", "function"]
+
+        worst, size = graph.worst_cascade()
+        assert worst.id == id(observable_int)
+        assert size == 3
+
+    def test_redirects(self):
+        key, one_of_keys = Observable(False), Observable(False)
+        graph = dependency_graph(redirects=[{key: [one_of_keys]}])
+        assert graph.edges[0].via == "redirect"
+        assert graph.cascade_size(id(key)) == 1
+
+    def test_measured_cost(self, observable_int: Observable[int]):
+        observable_int.attach_on_update(lambda value: None)
+        reset_stats()
+        enable_instrumentation()
+        try:
+            observable_int.value = 1
+            observable_int.value = 2
+        finally:
+            disable_instrumentation()
+
+        graph = dependency_graph(observable_int)
+        assert graph.edges[0].calls_count == 2
+        reset_stats()
+
+    def test_export(self, observable_int: Observable[int]):
+        Binding(observable_int, Observable(0))
+        graph = dependency_graph(observable_int)
+
+        exported = json.loads(graph.to_json())
+        assert exported["worst_cascade"]["size"] == 1
+        assert exported["nodes"][0]["fan_out"] == 1
+
+        dot: str = graph.to_dot()
+        assert dot.startswith("digraph magique {")
+        assert f"n{id(observable_int)} -> " in dot
@@ -0,0 +1,161 @@
+import pytest
+from typing import List
+
+from src.magique.declarative import Observable, ObservableList, ObservableDict, ListChange, History, batch
+
+
+class TestValueHistory:
+    def test_undo_redo(self):
+        observable: Observable[int] = Observable(0)
+        history = History(observable)
+
+        observable.value = 1
+        observable.value = 2
+        assert history.undo()
+        assert observable.value == 1
+        assert history.undo()
+        assert observable.value == 0
+        assert not history.undo()
+
+        assert history.redo()
+        assert observable.value == 1
+        assert (history.undo_count, history.redo_count) == (1, 1)
+
+    def test_new_change_clears_redo(self):
+        observable: Observable[int] = Observable(0)
+        history = History(observable)
+
+        observable.value = 1
+        history.undo()
+        observable.value = 5
+        assert not history.can_redo
+        assert not history.redo()
+
+    def test_capacity(self):
+        observable: Observable[int] = Observable(0)
+        history = History(observable, capacity=3)
+
+        for i in range(1, 11):
+            observable.value = i
+
+        while history.undo():
+            pass
+
+        assert observable.value == 7
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            History(Observable(0), capacity=0)
+
+    def test_batch_is_single_entry(self):
+        observable: Observable[int] = Observable(0)
+        history = History(observable)
+
+        with batch():
+            observable.value = 1
+            observable.value = 2
+
+        history.undo()
+        assert observable.value == 0
+
+    def test_undo_inside_batch(self):
+        observable: Observable[int] = Observable(0)
+        history = History(observable)
+        observable.value = 1
+
+        with batch():
+            observable.value = 5
+            history.undo()
+
+        assert observable.value == 1
+        assert history.redo()
+        assert observable.value == 5
+        assert history.undo_count == 2
+
+        items = ObservableList([1])
+        items_history = History(items)
+        with batch():
+            items.append(2)
+            items_history.undo()
+
+        assert items.value == [1]
+        assert items_history.redo_count == 1
+
+
+class TestCollectionHistory:
+    def test_list_diffs(self, target_list: List):
+        items: ObservableList[int] = ObservableList([1, 2, 3])
+        history = History(items)
+        items.attach_on_update(lambda value: target_list.append(list(value)))
+
+        items.append(4)
+        items[0] = 10
+        del items[1:3]
+        items.remove_many([10])
+        assert items.value == [4]
+
+        target_list.clear()
+        for expected in ([10, 4], [10, 2, 3, 4], [1, 2, 3, 4], [1, 2, 3]):
+            history.undo()
+            assert items.value == expected
+
+        assert target_list == [[10, 4], [10, 2, 3, 4], [1, 2, 3, 4], [1, 2, 3]]
+
+        history.redo()
+        history.redo()
+        assert items.value == [10, 2, 3, 4]
+
+    def test_stores_diffs(self):
+        items: ObservableList[int] = ObservableList(range(1000))
+        history = History(items)
+
+        items.append(1000)
+        (operation,) = history._undo_entries[0]
+        assert operation == ("change", ListChange("insert", 1000, [], [1000]), None)
+
+    def test_extended_slice(self):
+        items: ObservableList[int] = ObservableList([0, 1, 2, 3])
+        history = History(items)
+
+        del items[::2]
+        assert items.value == [1, 3]
+        history.undo()
+        assert items.value == [0, 1, 2, 3]
+
+    def test_replaced_list(self):
+        items: ObservableList[int] = ObservableList([1])
+        history = History(items)
+
+        with batch():
+            items.append(2)
+            items.value = [5]
+            items.append(6)
+
+        history.undo()
+        assert items.value == [1]
+        history.redo()
+        assert items.value == [5, 6]
+
+    def test_dict_diffs(self):
+        settings: ObservableDict[str, int] = ObservableDict(a=1)
+        history = History(settings)
+
+        settings["b"] = 2
+        settings.update(a=3, c=4)
+        settings.clear()
+
+        history.undo()
+        assert settings.value == {"a": 3, "b": 2, "c": 4}
+        history.undo()
+        assert settings.value == {"a": 1, "b": 2}
+        history.undo()
+        assert settings.value == {"a": 1}
+
+    def test_dispose(self):
+        items: ObservableList[int] = ObservableList()
+        history = History(items)
+
+        history.dispose()
+        items.append(1)
+        assert not history.can_undo
+        assert items._changes.observers_count == 0
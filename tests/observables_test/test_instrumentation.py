@@ -0,0 +1,103 @@
+import time
+import pytest
+from typing import List
+
+from src.magique.declarative import (
+    Observable,
+    enable_instrumentation,
+    disable_instrumentation,
+    reset_stats,
+    stats
+)
+
+
+@pytest.fixture
+def instrumentation():
+    reset_stats()
+    enable_instrumentation()
+    yield
+    disable_instrumentation()
+    reset_stats()
+
+
+def handler_stats(name_part: str):
+    return next(handler for handler in stats().handlers if name_part in handler.name)
+
+
+class TestInstrumentation:
+    def test_disabled_by_default(self, observable_int: Observable[int]):
+        reset_stats()
+        observable_int.attach_on_update(lambda value: None)
+        observable_int.value = 1
+        assert all(notifier.raise_count == 0 for notifier in stats().notifiers)
+        assert stats().handlers == []
+
+    def test_raise_count(self, instrumentation, observable_int: Observable[int]):
+        for value in range(5):
+            observable_int.value = value
+
+        assert stats().notifiers[0].raise_count == 5
+        assert stats().notifiers[0].name.startswith("Observable@")
+
+    def test_collected_notifiers_merged(self, instrumentation):
+        for _ in range(3):
+            observable: Observable[int] = Observable(0)
+            observable.value = 1
+            observable.value = 2
+            del observable
+
+        collected = [notifier for notifier in stats().notifiers if not notifier.is_alive]
+        assert len(collected) == 1
+        assert collected[0].name == "Observable (collected)"
+        assert (collected[0].raise_count, collected[0].instances_count) == (6, 3)
+
+    def test_handler_timing(self, instrumentation, observable_int: Observable[int], target_list: List):
+        def append_value(value: int) -> None:
+            target_list.append(value)
+
+        observable_int.attach_on_update(append_value)
+        observable_int.value = 1
+        observable_int.value = 2
+
+        append_stats = handler_stats("append_value")
+        assert append_stats.calls_count == 2
+        assert sum(append_stats.histogram) == 2
+        assert append_stats.max_seconds >= append_stats.mean_seconds > 0
+
+    def test_slow_handler(self, observable_int: Observable[int]):
+        slow_calls: List = []
+        reset_stats()
+        enable_instrumentation(0.005, lambda handler, duration: slow_calls.append(duration))
+
+        def sleeping_handler(value: int) -> None:
+            time.sleep(0.01)
+
+        try:
+            observable_int.attach_on_update(sleeping_handler)
+            observable_int.attach_on_update(lambda value: None)
+            observable_int.value = 1
+            assert handler_stats("sleeping_handler").slow_calls_count == 1
+            assert len(slow_calls) == 1
+        finally:
+            disable_instrumentation()
+            reset_stats()
+
+    def test_snapshot_export(self, instrumentation, observable_int: Observable[int]):
+        observable_int.attach_on_update(lambda value: None)
+        observable_int.value = 1
+
+        exported = stats().as_dict()
+        assert exported["handlers"][0]["calls_count"] == 1
+        assert len(exported["handlers"][0]["histogram"]) == len(exported["histogram_bounds"]) + 1
+
+    def test_subscription_costs_released(self, instrumentation, observable_int: Observable[int]):
+        from src.magique.declarative import instrumentation as module
+
+        for value in range(100):
+            subscription = observable_int.attach_on_update(lambda new_value: None)
+            observable_int.value = value
+            assert module.subscription_cost(subscription)[0] == 1
+            subscription.dispose()
+
+        del subscription
+        assert len(module._subscription_costs) == 0
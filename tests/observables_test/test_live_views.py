@@ -0,0 +1,151 @@
+import random
+import pytest
+from typing import List
+
+from src.magique.declarative import ObservableList, ListChange, notify_property_dataclass, batch
+
+
+@notify_property_dataclass
+class Task:
+    name: str
+    priority: int
+    done: bool = False
+
+
+def mutate_randomly(source: ObservableList, seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(300):
+        operation = rng.randrange(7)
+        if operation == 0 or not source.value:
+            source.append(rng.randrange(50))
+        elif operation == 1:
+            source.insert(rng.randrange(len(source) + 1), rng.randrange(50))
+        elif operation == 2:
+            source.pop(rng.randrange(len(source)))
+        elif operation == 3:
+            source[rng.randrange(len(source))] = rng.randrange(50)
+        elif operation == 4:
+            source.move(rng.randrange(len(source)), rng.randrange(len(source)))
+        elif operation == 5:
+            start = rng.randrange(len(source))
+            source[start:start + 3] = [rng.randrange(50) for _ in range(rng.randrange(4))]
+        else:
+            source.remove_many(source.value[:2])
+
+
+class TestLiveViews:
+    def test_where(self):
+        source = ObservableList(range(10))
+        even = source.where(lambda value: value % 2 == 0)
+        mutate_randomly(source, 1)
+        assert even.value == [value for value in source if value % 2 == 0]
+
+    def test_select(self):
+        source = ObservableList(range(10))
+        squares = source.select(lambda value: value * value)
+        mutate_randomly(source, 2)
+        assert squares.value == [value * value for value in source]
+
+    def test_sorted_by(self):
+        source = ObservableList(range(10))
+        ordered = source.sorted_by(lambda value: -value)
+        mutate_randomly(source, 3)
+        assert ordered.value == sorted(source.value, reverse=True)
+
+    def test_chained_views(self):
+        source = ObservableList([5, 3, 8, 1])
+        view = source.where(lambda value: value > 2).sorted_by(lambda value: value)
+
+        source.extend([4, 0])
+        source.remove(8)
+        assert view.value == [3, 4, 5]
+
+    def test_replaced_source_value(self):
+        source = ObservableList([1, 2, 3])
+        odd = source.where(lambda value: value % 2)
+
+        source.value = [5, 6, 7]
+        source.append(9)
+        assert odd.value == [5, 7, 9]
+
+    def test_single_event_per_change(self, target_list: List):
+        source = ObservableList([1, 2])
+        doubled = source.select(lambda value: value * 2)
+        doubled.attach_on_update(lambda value: target_list.append(list(value)))
+        records: List = []
+        doubled.attach_on_change(records.append)
+
+        source.extend([3, 4])
+        assert target_list == [[2, 4, 6, 8]]
+        assert records == [ListChange("insert", 2, [], [6, 8])]
+
+    def test_watch_items(self):
+        tasks = ObservableList([Task("a", 3), Task("b", 1), Task("c", 2)])
+        pending = tasks.where(lambda task: not task.done, watch=True)
+        by_priority = pending.sorted_by(lambda task: task.priority, watch=True)
+
+        tasks[0].done = True
+        assert [task.name for task in by_priority] == ["b", "c"]
+
+        tasks[1].priority = 5
+        assert [task.name for task in by_priority] == ["c", "b"]
+
+        with batch():
+            tasks[0].done = False
+            tasks[0].priority = 0
+
+        assert [task.name for task in by_priority] == ["a", "c", "b"]
+
+    def test_dispose(self):
+        tasks = ObservableList([Task("a", 1)])
+        pending = tasks.where(lambda task: not task.done, watch=True)
+
+        pending.dispose()
+        tasks[0].done = True
+        tasks.append(Task("b", 2))
+        assert [task.name for task in pending] == ["a"]
+        assert tasks[0].observers_count == 0
+
+    def test_watched_positions_follow_changes(self):
+        rng = random.Random(3)
+        pool = [Task(str(number), number) for number in range(8)]
+        tasks = ObservableList([rng.choice(pool) for _ in range(10)])
+        pending = tasks.where(lambda task: not task.done, watch=True)
+        by_priority = tasks.sorted_by(lambda task: task.priority, watch=True)
+
+        for _ in range(300):
+            operation = rng.randrange(5)
+            if operation == 0 or not tasks.value:
+                tasks.insert(rng.randrange(len(tasks) + 1), rng.choice(pool))
+            elif operation == 1:
+                tasks.pop(rng.randrange(len(tasks)))
+            elif operation == 2:
+                tasks.move(rng.randrange(len(tasks)), rng.randrange(len(tasks)))
+            elif operation == 3:
+                start = rng.randrange(len(tasks))
+                tasks[start:start + 2] = [rng.choice(pool) for _ in range(rng.randrange(3))]
+            else:
+                task = rng.choice(pool)
+                task.update(done=not task.done, priority=rng.randrange(10))
+
+            assert pending.value == [task for task in tasks if not task.done]
+            assert [task.priority for task in by_priority] == sorted(task.priority for task in tasks)
+
+    def test_nested_items(self):
+        rows = ObservableList([[3, 1], [2]])
+        by_size = rows.sorted_by(len)
+        long_rows = rows.where(lambda row: len(row) > 1)
+
+        rows[1].extend([5, 6])
+        assert by_size.value == [[3, 1], [2, 5, 6]]
+        assert long_rows.value == [[3, 1], [2, 5, 6]]
+
+        rows[0].clear()
+        assert by_size.value == [[], [2, 5, 6]]
+        assert long_rows.value == [[2, 5, 6]]
+
+    def test_abstract_base(self):
+        from src.magique.declarative import LiveView
+
+        with pytest.raises(TypeError):
+            LiveView(ObservableList())
@@ -0,0 +1,80 @@
+from typing import List
+
+from src.magique.declarative import ObservableList, ObservableDict, batch
+
+
+class TestNestedViews:
+    def test_identity_stable(self):
+        matrix = ObservableList([[1, 2], [3, 4]])
+        row = matrix[0]
+
+        assert matrix[0] is row
+        assert row.value is matrix.value[0]
+        assert matrix[0:1] is not matrix[0:1]
+        assert (matrix.parent, matrix.path) == (None, ())
+
+    def test_subscriptions_kept(self, target_list: List):
+        matrix = ObservableList([[1, 2], [3, 4]])
+        matrix[1].attach_on_update(lambda value: target_list.append(list(value)))
+
+        matrix[1].append(5)
+        matrix[1][0] = 0
+        assert target_list == [[3, 4, 5], [0, 4, 5]]
+
+    def test_propagated_to_parents(self, target_list: List):
+        config = ObservableDict(screens={"main": [1920, 1080]})
+        config.attach_on_update(lambda value: target_list.append("config"))
+        size = config["screens"]["main"]
+
+        assert size.path == ("screens", "main")
+        with batch():
+            size[0] = 1280
+            size[1] = 720
+
+        assert target_list == ["config"]
+        assert config.value == {"screens": {"main": [1280, 720]}}
+
+    def test_path_follows_moves(self):
+        rows = ObservableList([[1], [2], [3]])
+        last = rows[2]
+
+        rows.remove_many([[1]])
+        assert last.path == (1,)
+        assert last.parent is rows
+
+    def test_detached(self, target_list: List):
+        rows = ObservableList([[1], [2]])
+        rows.attach_on_update(lambda value: target_list.append("rows"))
+        first = rows[0]
+
+        rows[0] = [10]
+        target_list.clear()
+        first.append(2)
+        assert target_list == []
+        assert first.path is None
+        assert rows[0] is not first
+
+    def test_nested_change_records(self, target_list: List):
+        from src.magique.declarative import History, ListChange, DictChange, NestedChange
+
+        matrix = ObservableList([[1, 2]])
+        history = History(matrix)
+        matrix.attach_on_change(target_list.append)
+
+        matrix[0].append(9)
+        assert target_list == [NestedChange((0,), ListChange("insert", 2, [], [9]))]
+        assert history.undo_count == 1
+
+        history.undo()
+        assert matrix.value == [[1, 2]]
+        history.redo()
+        assert matrix.value == [[1, 2, 9]]
+
+        config = ObservableDict(screens={"main": [1920, 1080]})
+        config.key_updated("screens").attach_on_update(target_list.append)
+        config["screens"]["main"][0] = 1280
+        config["screens"]["side"] = [800, 600]
+        assert target_list[-2:] == [
+            NestedChange(("screens", "main"), ListChange("replace", 0, [1920], [1280])),
+            NestedChange(("screens",), DictChange("insert", "side", None, [800, 600])),
+        ]
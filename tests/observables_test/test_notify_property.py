@@ -0,0 +1,71 @@
+import pytest
+from typing import List
+
+from src.magique.declarative import NotifyUpdated, notify_property_updated, notify_property
+
+
+class DecoratedPoint(NotifyUpdated):
+    def __init__(self):
+        super().__init__()
+        self._x: int = 0
+        self.reads_count: int = 0
+
+    @property
+    def x(self) -> int: return self._x
+
+    @x.setter
+    @notify_property_updated(lambda self: self.read_x())
+    def x(self, new_x: int): self._x = new_x
+
+    def read_x(self) -> int:
+        self.reads_count += 1
+        return self._x
+
+
+class CompiledPoint(NotifyUpdated):
+    __slots__ = ("_x",)
+
+    def __init__(self):
+        super().__init__()
+        self._x: int = 0
+
+    x = notify_property("x")
+
+
+class TestNotifyPropertyUpdated:
+    def test_no_reads_without_listeners(self):
+        point = DecoratedPoint()
+        point.x = 5
+        assert point.x == 5
+        assert point.reads_count == 0
+
+    def test_property_updated(self, target_list: List):
+        point = DecoratedPoint()
+        point.property_updated("x").attach_on_update(lambda notifier: target_list.append(notifier.value))
+        point.attach_on_update(lambda notifier: target_list.append("point"))
+
+        point.x = 5
+        point.x = 5
+        assert target_list == [5, "point"]
+        assert point.reads_count == 4
+
+
+class TestNotifyProperty:
+    def test_slot_storage(self):
+        point = CompiledPoint()
+        point.x = 7
+        assert point.x == 7
+        assert point._x == 7
+
+    def test_property_updated(self, target_list: List):
+        point = CompiledPoint()
+        point.property_updated("x").attach_on_update(lambda notifier: target_list.append(notifier.value))
+
+        point.x = 3
+        point.x = 3
+        point.x = 4
+        assert target_list == [3, 4]
+
+    def test_invalid_name(self):
+        with pytest.raises(ValueError):
+            notify_property("x; import os")
@@ -0,0 +1,99 @@
+import pytest
+from typing import List
+
+from src.magique.declarative import NotifyUpdated, notify_property_dataclass
+
+
+@notify_property_dataclass(eq=True)
+class Size:
+    width: int
+    height: int = 10
+
+    def area(self) -> int:
+        return self.width * self.height
+
+
+@notify_property_dataclass(slots=False)
+class Label:
+    text: str
+
+
+class TestGeneratedClass:
+    def test_construction(self):
+        size = Size(5)
+        assert isinstance(size, NotifyUpdated)
+        assert (size.width, size.height) == (5, 10)
+        assert Size(height=2, width=3).area() == 6
+        assert Size.__notify_fields__ == ("width", "height")
+
+    def test_properties_are_shared(self):
+        first, second = Size(1), Size(2)
+        assert first.width == 1
+        assert type(first).__dict__["width"] is type(second).__dict__["width"]
+
+    def test_slots(self):
+        with pytest.raises(AttributeError):
+            Size(1).depth = 5
+
+        Label("a").depth = 5
+
+    def test_eq(self):
+        assert Size(1, 2) == Size(1, 2)
+        assert Size(1, 2) != Size(2, 2)
+        assert Label("a") != Label("a")
+
+    def test_hash(self):
+        label = Label("a")
+        assert {label: 1}[label] == 1
+
+        with pytest.raises(TypeError):
+            hash(Size(1))
+
+    def test_mutable_default(self):
+        with pytest.raises(ValueError):
+            @notify_property_dataclass
+            class Tags:
+                items: list = []
+
+    def test_repr(self):
+        assert repr(Size(1)) == "<Size as notify_property_dataclass: width=1; height=10>"
+
+
+class TestNotifications:
+    def test_property_updated(self, target_list: List):
+        size = Size(1)
+        size.property_updated("width").attach_on_update(lambda notifier: target_list.append(notifier.value))
+        size.attach_on_update(lambda notifier: target_list.append("size"))
+
+        size.width = 4
+        size.width = 4
+        assert target_list == [4, "size"]
+
+    def test_update_raises_once(self, target_list: List):
+        size = Size(1)
+        size.property_updated("width").attach_on_update(lambda notifier: target_list.append(notifier.value))
+        size.property_updated("height").attach_on_update(lambda notifier: target_list.append(notifier.value))
+        size.attach_on_update(lambda notifier: target_list.append((notifier.width, notifier.height)))
+
+        assert size.update(width=2, height=3) == ["width", "height"]
+        assert target_list == [2, 3, (2, 3)]
+
+    def test_setter_raises_instance_event(self, target_list: List):
+        size = Size(1)
+        size.attach_on_update(lambda notifier: target_list.append(notifier.width))
+
+        size.width = 5
+        size.width = 5
+        size.update(width=6)
+        assert target_list == [5, 6]
+
+    def test_update_without_changes(self, target_list: List):
+        size = Size(1)
+        size.attach_on_update(target_list.append)
+
+        assert size.update(width=1) == []
+        assert target_list == []
+
+    def test_update_unknown_field(self):
+        with pytest.raises(TypeError):
+            Size(1).update(depth=3)
@@ -70,3 +70,19 @@ class TestUpdateHandlers:
         observable_int.value = 6   # [144, 6] -> [864, 36]
 
         assert target_list == [864, 36]
+
+
+class TestMemoryLayout:
+    def test_no_instance_dict(self, observable_int: Observable[int]):
+        assert not hasattr(observable_int, "__dict__")
+
+    def test_lazy_observers(self, target_list: List):
+        observable: Observable[int] = Observable(1)
+        assert observable.observers_count == 0
+
+        observable.value = 2
+        observable.attach_on_update(lambda v: target_list.append(v))
+        observable.value = 3
+
+        assert observable.observers_count == 1
+        assert target_list == [3]
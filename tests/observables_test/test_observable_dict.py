@@ -1,7 +1,7 @@
 import pytest
 
 from typing import List, Dict
-from src.magique.declarative import ObservableDict
+from src.magique.declarative import ObservableDict, DictChange
 
 
 class TestContaining:
@@ -74,3 +74,117 @@ class TestUpdateHandlers:
 
         assert target_list == [True]
         assert observable_dict.value == {}
+
+
+class TestKeyChannels:
+    def test_only_key_subscribers(self, target_list: List):
+        settings = ObservableDict(theme="dark", scale=1)
+        settings.key_updated("theme").attach_on_update(target_list.append)
+
+        settings["scale"] = 2
+        settings["theme"] = "light"
+        assert target_list == [DictChange("replace", "theme", "dark", "light")]
+        assert settings.key_updated("theme").value == "light"
+
+    def test_update_and_clear(self, target_list: List):
+        settings = ObservableDict(theme="dark", scale=1)
+        settings.key_updated("font").attach_on_update(target_list.append)
+        settings.key_updated("scale").attach_on_update(target_list.append)
+
+        settings.update(font="mono", theme="light")
+        settings.clear()
+        assert target_list == [
+            DictChange("insert", "font", None, "mono"),
+            DictChange("remove", "scale", 1, None),
+            DictChange("remove", "font", "mono", None),
+        ]
+
+    def test_attach_on_change(self, target_list: List):
+        settings = ObservableDict(a=1)
+        settings.attach_on_change(target_list.append)
+
+        settings["b"] = 2
+        del settings["a"]
+        assert target_list == [DictChange("insert", "b", None, 2), DictChange("remove", "a", 1, None)]
+        assert target_list[1].reversed() == DictChange("insert", "a", None, 1)
+
+    def test_replaced_value_changes(self, target_list: List):
+        settings = ObservableDict(a=1, b=2)
+        settings.attach_on_change(target_list.append)
+
+        settings.value = {"b": 2, "c": 3}
+        assert target_list == [DictChange("remove", "a", 1, None), DictChange("insert", "c", None, 3)]
+
+    def test_lookup_doesnt_register_channel(self, target_list: List):
+        settings = ObservableDict(a=1)
+        first, second = settings.key_updated("a"), settings.key_updated("a")
+        assert settings._key_channels is None
+        assert not settings._has_change_observers()
+
+        first.attach_on_update(target_list.append)
+        second.attach_on_update(target_list.append)
+        settings["a"] = 2
+        assert target_list == [DictChange("replace", "a", 1, 2)] * 2
+        assert settings.key_updated("a") is first
+
+    def test_replaced_value(self, target_list: List):
+        from src.magique.declarative import History
+
+        settings = ObservableDict(a=1, b=2)
+        history = History(settings)
+        settings.key_updated("a").attach_on_update(target_list.append)
+        settings.key_updated("b").attach_on_update(target_list.append)
+        settings.key_updated("c").attach_on_update(target_list.append)
+
+        settings.value = {"a": 5, "b": 2}
+        assert settings.key_updated("a").value == 5
+        history.undo()
+        assert settings.key_updated("a").value == 1
+        assert target_list == [DictChange("replace", "a", 1, 5), DictChange("replace", "a", 5, 1)]
+
+    def test_channel_dropped_with_last_subscription(self, target_list: List):
+        settings = ObservableDict(a=1)
+        channel = settings.key_updated("a")
+        first = channel.attach_on_update(target_list.append)
+        second = channel.attach_on_update(target_list.append)
+
+        first.dispose()
+        assert settings.key_updated("a") is channel
+        second.dispose()
+        assert settings._key_channels is None
+
+        channel.attach_on_update(target_list.append)
+        settings["a"] = 2
+        assert target_list == [DictChange("replace", "a", 1, 2)]
+        assert settings.key_updated("a") is channel
+
+
+class TestMappingSurface:
+    def test_abc(self):
+        from collections.abc import MutableMapping
+        assert isinstance(ObservableDict(), MutableMapping)
+
+    def test_single_event_per_operation(self, target_list: List):
+        settings = ObservableDict(a=1, b=2)
+        settings.attach_on_update(lambda value: target_list.append(dict(value)))
+
+        assert settings.pop("a") == 1
+        assert settings.pop("a", None) is None
+        assert settings.setdefault("c", 3) == 3
+        assert settings.setdefault("c", 4) == 3
+        assert settings.popitem() == ("c", 3)
+        assert target_list == [{"b": 2}, {"b": 2, "c": 3}, {"b": 2}]
+
+        with pytest.raises(KeyError):
+            settings.pop("missing")
+
+    def test_iteration_helpers(self):
+        settings = ObservableDict(a=1, b=2)
+        assert (list(settings), list(settings.keys()), list(settings.values())) == (["a", "b"], ["a", "b"], [1, 2])
+        assert list(settings.items()) == [("a", 1), ("b", 2)]
+        assert list(reversed(settings)) == ["b", "a"]
+        assert settings.get("c", 0) == 0 and "a" in settings
+
+    def test_identity_comparison(self):
+        assert ObservableDict(a=1) != ObservableDict(a=1)
+        assert len({ObservableDict(), ObservableDict()}) == 2
@@ -1,7 +1,7 @@
 import pytest
 
 from typing import List
-from src.magique.declarative import ObservableList
+from src.magique.declarative import ObservableList, ListChange
 
 
 class TestContaining:
@@ -113,3 +113,125 @@ class TestUpdateHandlers:
 
         assert target_list == [True]
         assert observable_list.value == []
+
+
+class TestChangeRecords:
+    @staticmethod
+    def recorded(observable_list: ObservableList) -> List:
+        changes: List = []
+        observable_list.attach_on_change(changes.append)
+        return changes
+
+    def test_single_item_changes(self):
+        obs_list = ObservableList([1, 2, 3])
+        changes = self.recorded(obs_list)
+
+        obs_list.append(4)
+        obs_list.insert(0, 0)
+        obs_list[1] = 10
+        obs_list.remove(2)
+        obs_list.move(0, -1)
+        assert obs_list.value == [10, 3, 4, 0]
+        assert changes == [
+            ListChange("insert", 3, [], [4]),
+            ListChange("insert", 0, [], [0]),
+            ListChange("replace", 1, [1], [10]),
+            ListChange("remove", 2, [2], []),
+            ListChange("move", 0, [0], [0], 3),
+        ]
+
+    def test_range_changes(self):
+        obs_list = ObservableList(range(10))
+        changes = self.recorded(obs_list)
+
+        obs_list.extend([10, 11])
+        obs_list[0:3] = ["a"]
+        del obs_list[1:4]
+        obs_list.remove_many([7, 6, 9])
+        obs_list.clear()
+        assert changes == [
+            ListChange("insert", 10, [], [10, 11]),
+            ListChange("replace", 0, [0, 1, 2], ["a"]),
+            ListChange("remove", 1, [3, 4, 5], []),
+            ListChange("remove", 1, [6, 7], []),
+            ListChange("remove", 2, [9], []),
+            ListChange("remove", 0, ["a", 8, 10, 11], []),
+        ]
+
+    def test_replayed_changes(self):
+        obs_list = ObservableList([5, 1, 4, 2, 3])
+        mirror = list(obs_list.value)
+
+        def replay(change: ListChange):
+            if change.kind == "move":
+                mirror.insert(change.new_index, mirror.pop(change.index))
+            else:
+                mirror[change.index:change.index + len(change.old_items)] = change.new_items
+
+        obs_list.attach_on_change(replay)
+        obs_list.remove_many([4, 1, 3])
+        obs_list[::-1] = [7, 8]
+        obs_list.extend([9, 9])
+        obs_list.move(-1, 0)
+        obs_list.clear()
+        obs_list.append(6)
+        assert mirror == obs_list.value == [6]
+
+    def test_no_records_without_subscribers(self):
+        obs_list = ObservableList([1])
+        obs_list.append(2)
+        assert obs_list._changes is None
+
+
+class TestSequenceSurface:
+    @staticmethod
+    def events(obs_list: ObservableList) -> List:
+        events: List = []
+        obs_list.attach_on_update(lambda value: events.append(list(value)))
+        return events
+
+    def test_abc(self):
+        from collections.abc import MutableSequence
+        assert isinstance(ObservableList(), MutableSequence)
+
+    def test_single_event_per_operation(self):
+        obs_list = ObservableList([3, 1, 2])
+        events = self.events(obs_list)
+
+        obs_list.sort()
+        obs_list.reverse()
+        assert obs_list.pop() == 1
+        obs_list += [5, 6]
+        obs_list[1:2] = [7, 8, 9]
+        assert events == [[1, 2, 3], [3, 2, 1], [3, 2], [3, 2, 5, 6], [3, 7, 8, 9, 5, 6]]
+        assert (obs_list.index(9), obs_list.count(7), list(reversed(obs_list))[0]) == (3, 1, 6)
+
+    def test_iadd_callable_subscribes(self, target_list: List):
+        obs_list = ObservableList()
+        obs_list += target_list.append
+
+        obs_list.append(1)
+        assert target_list == [[1]]
+
+    def test_remove_many_first_occurrences(self):
+        obs_list = ObservableList([1, 2, 1, 3, 1, [4]])
+        events = self.events(obs_list)
+
+        obs_list.remove_many([1, 1, 3])
+        obs_list.remove_many([[4]])
+        assert obs_list.value == [2, 1]
+        assert len(events) == 2
+
+    def test_remove_many_missing(self):
+        obs_list = ObservableList([1, 2])
+
+        with pytest.raises(ValueError):
+            obs_list.remove_many([1, 5])
+
+        assert obs_list.value == [1, 2]
+
+        obs_list = ObservableList([1, [2], 3])
+        with pytest.raises(ValueError):
+            obs_list.remove_many([[2], 1, [5]])
+
+        assert obs_list.value == [1, [2], 3]
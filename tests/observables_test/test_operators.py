@@ -0,0 +1,119 @@
+import time
+import pytest
+from threading import Event, enumerate as threads
+from typing import List
+
+from src.magique.declarative import Observable, NotifyUpdated
+
+
+def wait_for(target_list: List, count: int, timeout: float = 2.0) -> None:
+    deadline: float = time.monotonic() + timeout
+    while len(target_list) < count and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+class TestTimeOperators:
+    def test_debounce(self, observable_int: Observable[int], target_list: List):
+        debounced = observable_int.debounce(0.05)
+        debounced.attach_on_update(target_list.append)
+
+        for value in range(20):
+            observable_int.value = value
+
+        wait_for(target_list, 1)
+        time.sleep(0.1)
+        assert target_list == [19]
+        assert debounced.value == 19
+
+    def test_throttle(self, observable_int: Observable[int], target_list: List):
+        throttled = observable_int.throttle(0.1)
+        throttled.attach_on_update(target_list.append)
+
+        for value in range(20):
+            observable_int.value = value
+
+        assert target_list == [0]
+        wait_for(target_list, 2)
+        assert target_list == [0, 19]
+
+    def test_throttle_leading_only(self, observable_int: Observable[int], target_list: List):
+        throttled = observable_int.throttle(0.05, trailing=False)
+        throttled.attach_on_update(target_list.append)
+
+        for value in range(20):
+            observable_int.value = value
+
+        time.sleep(0.1)
+        observable_int.value = 50
+        assert target_list == [0, 50]
+
+    def test_sample(self, observable_int: Observable[int], target_list: List):
+        sampled = observable_int.sample(0.05)
+        sampled.attach_on_update(target_list.append)
+
+        observable_int.value = 1
+        observable_int.value = 2
+        wait_for(target_list, 1)
+        time.sleep(0.1)
+        assert target_list == [2]
+
+    def test_time_buffer(self, observable_int: Observable[int], target_list: List):
+        buffered = observable_int.buffer(0.05)
+        buffered.attach_on_update(target_list.append)
+
+        for value in range(5):
+            observable_int.value = value
+
+        wait_for(target_list, 1)
+        assert target_list == [[0, 1, 2, 3, 4]]
+
+    def test_dispose_cancels_timer(self, observable_int: Observable[int], target_list: List):
+        debounced = observable_int.debounce(0.02)
+        debounced.attach_on_update(target_list.append)
+
+        observable_int.value = 1
+        debounced.dispose()
+        observable_int.value = 2
+        time.sleep(0.06)
+        assert target_list == []
+
+    def test_single_timer_thread(self, observable_int: Observable[int]):
+        operators = [observable_int.debounce(0.01) for _ in range(10)]
+        observable_int.value = 1
+
+        event = Event()
+        operators[-1].attach_on_update(lambda value: event.set())
+        event.wait(1)
+        assert len([thread for thread in threads() if thread.name == "magique-timer"]) == 1
+
+
+class TestSyncOperators:
+    def test_distinct_until_changed(self, target_list: List):
+        class Counter(NotifyUpdated):
+            count: int = 0
+
+        notifier = Counter()
+        distinct = notifier.distinct_until_changed(lambda sender: sender.count // 10)
+        distinct.attach_on_update(lambda sender: target_list.append(sender.count))
+
+        for count in (1, 5, 12, 15, 31):
+            notifier.count = count
+            notifier.raise_update_event()
+
+        assert target_list == [1, 12, 31]
+
+    def test_count_buffer(self, observable_int: Observable[int], target_list: List):
+        buffered = observable_int.buffer(2)
+        buffered.attach_on_update(target_list.append)
+
+        for value in range(5):
+            observable_int.value = value
+
+        assert target_list == [[0, 1], [2, 3]]
+
+    def test_read_only(self, observable_int: Observable[int]):
+        distinct = observable_int.distinct_until_changed()
+        with pytest.raises(AttributeError):
+            distinct.value = 5
+
+        assert distinct.value == 100
@@ -0,0 +1,79 @@
+from typing import List
+
+from src.magique.declarative import (
+    Observable, Binding, BindingMode, HookMetrics, computed, when, batch
+)
+from src.magique.declarative.propagation import _propagation_state
+
+
+class TestDiamondPropagation:
+    def test_bindings_and_hook_metrics(self, observable_int: Observable[int], target_list: List):
+        left: Observable[int] = Observable(0)
+        right: Observable[int] = Observable(0)
+        left_binding = Binding(observable_int, left, BindingMode.send, (lambda x: x + 1, lambda x: x - 1))
+        right_binding = Binding(observable_int, right, BindingMode.send, (lambda x: x * 2, lambda x: x // 2))
+
+        def total() -> int:
+            target_list.append((left.value, right.value))
+            return left.value + right.value
+
+        metrics = HookMetrics(total, 0, True, left, right)
+        observable_int.value = 10
+
+        assert target_list == [(11, 20)]
+        assert metrics.value == 31
+
+    def test_computed_chain(self, observable_int: Observable[int], target_list: List):
+        plus_one = computed(lambda: observable_int.value + 1)
+        times_two = computed(lambda: observable_int.value * 2)
+        total = computed(lambda: plus_one.value + times_two.value)
+        final = computed(lambda: total.value + plus_one.value)
+
+        final.attach_on_update(lambda v: target_list.append(v))
+        assert final.propagation_height > total.propagation_height > plus_one.propagation_height
+
+        observable_int.value = 1
+        assert target_list == [2 + 2 + 2]
+
+    def test_when_condition_checked_once(self, observable_int: Observable[int], target_list: List):
+        left: Observable[int] = Observable(0)
+        right: Observable[int] = Observable(0)
+        bindings = [
+            Binding(observable_int, left, BindingMode.send),
+            Binding(observable_int, right, BindingMode.send)
+        ]
+
+        when([left, right], lambda: left.value == right.value, lambda: target_list.append(left.value))
+        observable_int.value = 5
+
+        assert target_list == [5]
+
+    def test_single_update_per_batch(self, observable_int: Observable[int], target_list: List):
+        other: Observable[int] = Observable(0)
+        metrics = HookMetrics(lambda: observable_int.value + other.value, 0, True, observable_int, other)
+        metrics.attach_on_update(lambda v: target_list.append(v))
+
+        with batch():
+            observable_int.value = 1
+            other.value = 2
+
+        assert target_list == [3]
+
+
+class TestLazyWaves:
+    def test_plain_delivery_doesnt_open_wave(self, observable_int: Observable[int], target_list: List):
+        observable_int.attach_on_update(lambda v: target_list.append(_propagation_state.depth))
+        observable_int.value = 1
+
+        assert target_list == [0]
+        assert not observable_int._observers.opens_wave
+
+    def test_derived_node_opens_wave(self, observable_int: Observable[int], target_list: List):
+        doubled = computed(lambda: observable_int.value * 2)
+        doubled.attach_on_update(lambda v: target_list.append(doubled.value))
+        observable_int.attach_on_update(lambda v: target_list.append(_propagation_state.depth))
+        observable_int.value = 1
+
+        assert observable_int._observers.opens_wave
+        assert target_list == [1, 2]
+        assert _propagation_state.depth == 0 and not _propagation_state.is_open
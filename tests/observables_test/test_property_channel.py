@@ -0,0 +1,82 @@
+from typing import List
+
+from src.magique.declarative import (
+    Observable,
+    Binding,
+    BindingMode,
+    PropertyChannel,
+    notify_property_dataclass,
+    computed,
+    batch
+)
+
+
+@notify_property_dataclass
+class Point:
+    x: int
+    y: int
+
+
+class TestPropertyChannel:
+    def test_attach_on_property_update(self, target_list: List):
+        point = Point(1, 2)
+        subscription = point.attach_on_property_update("x", target_list.append)
+
+        point.x = 5
+        point.y = 6
+        point.x = 5
+        subscription.dispose()
+        point.x = 7
+        assert target_list == [5]
+
+    def test_no_listener_objects(self, target_list: List):
+        point = Point(1, 2)
+        point.attach_on_property_update("x", target_list.append)
+
+        channel = point._property_observers["x"]
+        assert isinstance(channel, PropertyChannel)
+        assert (channel.notifier, channel.receiver, channel.listener) == (None, None, None)
+
+    def test_materialized_on_request(self, target_list: List):
+        point = Point(1, 2)
+        point.attach_on_property_update("x", target_list.append)
+        point.property_updated("x").attach_on_update(lambda notifier: target_list.append(("notifier", notifier.value)))
+
+        point.x = 3
+        assert target_list == [3, ("notifier", 3)]
+        assert point.property("x") is point.property("x")
+
+    def test_binding_materializes_listener(self):
+        point = Point(1, 2)
+        observable: Observable[int] = Observable(0)
+        Binding(point.property("x"), observable, BindingMode.two_way)
+
+        point.x = 4
+        assert observable.value == 4
+
+        observable.value = 9
+        assert point.x == 9
+
+    def test_properties(self):
+        point = Point(1, 2)
+        x, y = point.properties("x", "y")
+        assert (x.value, y.value) == (1, 2)
+
+    def test_computed_uses_channel(self, target_list: List):
+        point = Point(1, 2)
+        total = computed(lambda: point.x + point.y)
+        total.attach_on_update(target_list.append)
+
+        point.x = 10
+        assert target_list == [12]
+        assert point._property_observers["x"].notifier is None
+
+    def test_batched_property_updates(self, target_list: List):
+        point = Point(1, 2)
+        point.attach_on_property_update("x", target_list.append)
+
+        with batch():
+            point.x = 3
+            point.x = 4
+
+        assert target_list == [4]
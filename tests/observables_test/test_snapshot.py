@@ -0,0 +1,126 @@
+import pickle
+import pytest
+from enum import Enum
+from typing import List
+
+from src.magique.declarative import (
+    Observable,
+    ObservableList,
+    ObservableDict,
+    Snapshot,
+    notify_property_dataclass,
+    computed,
+    snapshot,
+    restore
+)
+
+
+@notify_property_dataclass
+class Monitor:
+    name: str
+    width: int
+    tags: ObservableList
+
+
+@notify_property_dataclass
+class Workspace:
+    title: Observable
+    monitors: ObservableList
+    settings: ObservableDict
+
+
+@notify_property_dataclass
+class Node:
+    name: str
+    next: "Node"
+
+
+class Theme(Enum):
+    dark = "dark"
+
+
+def make_workspace() -> Workspace:
+    return Workspace(
+        Observable("main"),
+        ObservableList([Monitor("left", 1920, ObservableList(["a"])), Monitor("right", 1280, ObservableList())]),
+        ObservableDict(theme="dark")
+    )
+
+
+class TestSnapshot:
+    def test_values_only(self):
+        workspace = make_workspace()
+        workspace.title.attach_on_update(lambda value: None)
+
+        restored = Snapshot.from_bytes(snapshot(workspace).to_bytes())
+        assert restored == snapshot(workspace)
+
+    def test_restore_in_place(self, target_list: List):
+        workspace = make_workspace()
+        left = workspace.monitors[0]
+        captured = snapshot(workspace)
+
+        workspace.title.value = "other"
+        left.width = 100
+        left.tags.append("b")
+        workspace.settings["theme"] = "light"
+        workspace.settings["scale"] = 2
+
+        for notifier in (workspace, workspace.title, workspace.monitors, left, left.tags, workspace.settings):
+            notifier.attach_on_update(lambda value, notifier=notifier: target_list.append(notifier))
+
+        assert restore(workspace, captured) is workspace
+        assert workspace.title.value == "main"
+        assert workspace.monitors[0] is left
+        assert (left.width, left.tags.value) == (1920, ["a"])
+        assert workspace.settings.value == {"theme": "dark"}
+
+        assert len(target_list) == 4
+        assert workspace.monitors not in target_list
+
+    def test_missing_instances_created(self):
+        workspace = make_workspace()
+        captured = snapshot(workspace)
+
+        workspace.monitors.clear()
+        captured.restore(workspace)
+        assert [monitor.name for monitor in workspace.monitors] == ["left", "right"]
+        assert workspace.monitors[0].tags.value == ["a"]
+
+    def test_derived_skipped(self):
+        observable: Observable[int] = Observable(1)
+        doubled = computed(lambda: observable.value * 2)
+        roots = [observable, doubled]
+        captured = snapshot(roots)
+
+        observable.value = 5
+        restore(roots, captured)
+        assert (observable.value, doubled.value) == (1, 2)
+
+    def test_cycles(self):
+        first, second = Node("first"), Node("second")
+        first.next, second.next = second, first
+        captured = Snapshot.from_bytes(snapshot(first).to_bytes())
+
+        second.name = "other"
+        assert restore(first, captured) is first
+        assert (first.next is second, second.next is first, second.name) == (True, True, "second")
+
+        first.next = None
+        restore(first, captured)
+        assert first.next is not second and first.next.next is first
+
+        restored = restore(None, captured)
+        assert restored.next.next is restored and restored.next.name == "second"
+
+    def test_unknown_classes_not_loaded(self):
+        data: bytes = pickle.dumps(Theme.dark)
+        with pytest.raises(pickle.UnpicklingError):
+            Snapshot.from_bytes(data)
+
+        observable: Observable[Theme] = Observable(Theme.dark)
+        data = snapshot(observable).to_bytes()
+        with pytest.raises(pickle.UnpicklingError):
+            Snapshot.from_bytes(data)
+
+        assert Snapshot.from_bytes(data, trusted_types=[Theme]) == snapshot(observable)
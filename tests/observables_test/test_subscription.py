@@ -0,0 +1,115 @@
+import gc
+from typing import List
+
+from src.magique.declarative import Observable, Binding, BindingMode, Subscription
+
+
+class Receiver:
+    def __init__(self, target_list: List):
+        self.target_list = target_list
+
+    def on_update(self, value: int) -> None:
+        self.target_list.append(value)
+
+
+class TestSubscription:
+    def test_dispose(self, observable_int: Observable[int], target_list: List):
+        subscription: Subscription = observable_int.attach_on_update(lambda v: target_list.append(v))
+        observable_int.value = 1
+
+        assert subscription.is_active
+        assert subscription.dispose()
+        assert not subscription.is_active
+        assert not subscription.dispose()
+
+        observable_int.value = 2
+        assert target_list == [1]
+
+    def test_with_statement(self, observable_int: Observable[int], target_list: List):
+        with observable_int.attach_on_update(lambda v: target_list.append(v)):
+            observable_int.value = 1
+
+        observable_int.value = 2
+        assert target_list == [1]
+
+    def test_same_function_twice(self, observable_int: Observable[int], target_list: List):
+        handler = lambda v: target_list.append(v)
+        first: Subscription = observable_int.attach_on_update(handler)
+        observable_int.attach_on_update(handler)
+
+        observable_int.value = 1
+        first.dispose()
+        observable_int.value = 2
+
+        assert target_list == [1, 1, 2]
+
+    def test_detach_by_function(self, observable_int: Observable[int], target_list: List):
+        handler = lambda v: target_list.append(v)
+        observable_int += handler
+        observable_int -= handler
+
+        observable_int.value = 1
+        assert target_list == []
+        assert observable_int.observers_count == 0
+
+    def test_dispose_while_dispatching(self, observable_int: Observable[int], target_list: List):
+        subscriptions: List[Subscription] = []
+
+        def dispose_all(value: int) -> None:
+            for subscription in subscriptions:
+                subscription.dispose()
+
+        subscriptions.append(observable_int.attach_on_update(dispose_all))
+        subscriptions.append(observable_int.attach_on_update(lambda v: target_list.append(v)))
+
+        # the second subscription is disposed by the first handler, before it's invoked
+        observable_int.value = 1
+        observable_int.value = 2
+        assert target_list == []
+
+    def test_attach_while_dispatching(self, observable_int: Observable[int], target_list: List):
+        def attach_more(value: int) -> None:
+            observable_int.attach_on_update(target_list.append)
+
+        subscription = observable_int.attach_on_update(attach_more)
+        observable_int.value = 1
+        subscription.dispose()
+        observable_int.value = 2
+        assert target_list == [2]
+        assert observable_int.observers_count == 1
+
+
+class TestWeakSubscription:
+    def test_bound_method_not_kept_alive(self, observable_int: Observable[int], target_list: List):
+        receiver = Receiver(target_list)
+        subscription: Subscription = observable_int.attach_on_update(receiver.on_update, weak=True)
+
+        observable_int.value = 1
+        del receiver
+        gc.collect()
+
+        assert subscription.callback is None
+        observable_int.value = 2
+
+        assert target_list == [1]
+        assert observable_int.observers_count == 0
+
+    def test_weak_binding(self, observable_int: Observable[int], observable_str: Observable[str]):
+        binding = Binding(observable_int, observable_str, BindingMode.send, (str, int), weak=True)
+        observable_int.value = 1
+        assert observable_str.value == "1"
+
+        del binding
+        gc.collect()
+
+        observable_int.value = 2
+        assert observable_str.value == "1"
+
+    def test_binding_dispose(self, observable_int: Observable[int], observable_str: Observable[str]):
+        binding = Binding(observable_int, observable_str, BindingMode.two_way, (str, int))
+        binding.dispose()
+
+        observable_int.value = 1
+        assert observable_str.value == "500"
+        assert observable_int.observers_count == 0
+        assert observable_str.observers_count == 0